@@ -27,6 +27,18 @@ from app.shared.exceptions import (
     operation_not_allowed,
 )
 
+# Map error category to HTTP status code, built once at import
+HTTP_STATUS_BY_CATEGORY = {
+    "not_found": 404,
+    "validation": 422,
+    "authentication": 401,
+    "authorization": 403,
+    "business_rule": 400,
+    "database": 500,
+    "external_service": 502,
+    "internal": 500,
+}
+
 
 # ============================================================================
 # Example 1: Basic CRUD Operations
@@ -202,8 +214,9 @@ def fastapi_router_example():
     Note: This is pseudo-code showing the pattern.
     """
 
+    import orjson
     from fastapi import FastAPI, Request
-    from fastapi.responses import JSONResponse
+    from fastapi.responses import Response
     from app.shared.exceptions import AppException
 
     app = FastAPI()
@@ -212,21 +225,14 @@ def fastapi_router_example():
     @app.exception_handler(AppException)
     async def app_exception_handler(request: Request, exc: AppException):
         """Handle all application exceptions."""
-        # Map category to HTTP status code
-        status_map = {
-            "not_found": 404,
-            "validation": 422,
-            "authentication": 401,
-            "authorization": 403,
-            "business_rule": 400,
-            "database": 500,
-            "external_service": 502,
-            "internal": 500,
-        }
-
-        status_code = status_map.get(exc.category.value, 500)
-
-        return JSONResponse(status_code=status_code, content=exc.to_dict())
+        status_code = HTTP_STATUS_BY_CATEGORY.get(exc.category.value, 500)
+
+        # orjson emits bytes directly, skipping stdlib json + UTF-8 encoding
+        return Response(
+            content=orjson.dumps(exc.to_dict()),
+            status_code=status_code,
+            media_type="application/json",
+        )
 
     # Router endpoint
     @app.get("/users/{user_id}")
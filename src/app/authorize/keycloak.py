@@ -1,8 +1,15 @@
+# Init file for auth
 from fastapi import HTTPException, Depends
 from fastapi.security import OAuth2AuthorizationCodeBearer
-from authlib.integrations.requests_client import OAuth2Session
+from authlib.integrations.httpx_client import AsyncOAuth2Client
+from authlib.jose import JsonWebKey, JsonWebToken
+from authlib.jose.errors import JoseError
+import asyncio
+import hashlib
+import httpx
+import orjson
 import os
-import json
+import time
 
 
 # Setup environment variables
@@ -11,6 +18,21 @@ REALM = os.getenv("REALM", "YourRealm")
 CLIENT_ID = os.getenv("CLIENT_ID", "your-client-id")
 CLIENT_SECRET = os.getenv("CLIENT_SECRET")
 JWKS_URL = f"{KEYCLOAK_URL}realms/{REALM}/protocol/openid-connect/certs"
+ISSUER = f"{KEYCLOAK_URL}realms/{REALM}"
+
+# How long a fetched JWKS is trusted before it is fetched again (seconds)
+JWKS_TTL = int(os.getenv("JWKS_TTL", "3600"))
+# Minimum gap between forced refreshes triggered by an unknown key id
+JWKS_MIN_REFRESH_INTERVAL = 30
+
+# Introspection results are reused for at most this long (seconds); inactive
+# tokens are remembered for a shorter time
+INTROSPECTION_CACHE_TTL = 60
+INTROSPECTION_NEGATIVE_TTL = 5
+INTROSPECTION_CACHE_MAXSIZE = 10_000
+
+# Realm roles that grant access; a token needs at least one of them
+_REQUIRED_ROLES = frozenset({"IT-Admin"})
 
 # OAuth2 configuration
 oauth2_scheme = OAuth2AuthorizationCodeBearer(
@@ -18,26 +40,177 @@ oauth2_scheme = OAuth2AuthorizationCodeBearer(
     tokenUrl=f"{KEYCLOAK_URL}realms/{REALM}/protocol/openid-connect/token",
 )
 
+# Keycloak signs access tokens with RS256; any other algorithm is rejected
+# before a key is looked up
+_jwt = JsonWebToken(["RS256"])
 
-async def validate_keycloak_token(user_token: str = Depends(oauth2_scheme)):
-    auth = OAuth2Session(client_id=CLIENT_ID, client_secret=CLIENT_SECRET)
-    result = auth.introspect_token(
+# Claims every locally verified access token must carry
+_CLAIMS_OPTIONS = {
+    "iss": {"essential": True, "value": ISSUER},
+    "exp": {"essential": True},
+}
+
+# Shared client so JWKS fetches and introspection reuse pooled keep-alive
+# connections instead of paying a TCP+TLS handshake per request
+_client = AsyncOAuth2Client(
+    client_id=CLIENT_ID,
+    client_secret=CLIENT_SECRET,
+    limits=httpx.Limits(max_keepalive_connections=100),
+)
+
+# Introspection results keyed by token digest: key -> (expires_at, token_info)
+_introspection_cache: dict[str, tuple[float, dict]] = {}
+# In-flight introspections so concurrent requests with one token share a call
+_introspection_inflight: dict[str, asyncio.Future] = {}
+
+# Cached realm key set and the monotonic time it was fetched
+_jwks = None
+_jwks_fetched_at = 0.0
+# Held while fetching, so concurrent requests share one refresh
+_jwks_lock = asyncio.Lock()
+
+
+def _jwks_stale(force_refresh: bool) -> bool:
+    """Whether the cached key set must be fetched again."""
+    age = time.monotonic() - _jwks_fetched_at
+    if _jwks is None or age > JWKS_TTL:
+        return True
+    return force_refresh and age > JWKS_MIN_REFRESH_INTERVAL
+
+
+async def _get_jwks(force_refresh: bool = False):
+    """Return the realm's JSON Web Key Set, fetching it at most once per TTL."""
+    global _jwks, _jwks_fetched_at
+
+    if _jwks_stale(force_refresh):
+        async with _jwks_lock:
+            # Another request may have refreshed it while this one waited
+            if _jwks_stale(force_refresh):
+                response = await _client.get(JWKS_URL)
+                response.raise_for_status()
+                _jwks = JsonWebKey.import_key_set(orjson.loads(response.content))
+                _jwks_fetched_at = time.monotonic()
+
+    return _jwks
+
+
+def _is_jwt(token: str) -> bool:
+    """JWS compact serialization has exactly three dot-separated segments."""
+    return token.count(".") == 2
+
+
+async def _decode_jwt(token: str) -> dict:
+    """Verify a JWT access token locally against the cached realm keys."""
+    jwks = await _get_jwks()
+    try:
+        claims = _jwt.decode(token, jwks, claims_options=_CLAIMS_OPTIONS)
+    except ValueError:
+        # Unknown key id: Keycloak rotated its keys since our last fetch
+        jwks = await _get_jwks(force_refresh=True)
+        claims = _jwt.decode(token, jwks, claims_options=_CLAIMS_OPTIONS)
+    claims.validate()
+    return dict(claims)
+
+
+async def _introspect(user_token: str) -> dict:
+    """Ask Keycloak about an opaque (non-JWT) token."""
+    result = await _client.introspect_token(
         url=f"{KEYCLOAK_URL}realms/{REALM}/protocol/openid-connect/token/introspect",
         token=user_token,
     )
+    return orjson.loads(result.content)
+
+
+def _token_key(user_token: str) -> str:
+    """Digest used as cache key so raw tokens are never kept in memory."""
+    return hashlib.blake2b(user_token.encode(), digest_size=16).hexdigest()
+
+
+def _store_introspection(key: str, token_info: dict) -> None:
+    """Cache an introspection result until the token (or our TTL) expires."""
+    now = time.time()
+    if token_info.get("active"):
+        ttl = INTROSPECTION_CACHE_TTL
+        exp = token_info.get("exp")
+        if exp is not None:
+            ttl = min(ttl, exp - now)
+    else:
+        ttl = INTROSPECTION_NEGATIVE_TTL
+    if ttl <= 0:
+        return
+
+    if len(_introspection_cache) >= INTROSPECTION_CACHE_MAXSIZE:
+        for stale_key in [k for k, v in _introspection_cache.items() if v[0] <= now]:
+            del _introspection_cache[stale_key]
+        if len(_introspection_cache) >= INTROSPECTION_CACHE_MAXSIZE:
+            # Still full: evict the oldest insertion
+            del _introspection_cache[next(iter(_introspection_cache))]
+
+    _introspection_cache[key] = (now + ttl, token_info)
+
+
+async def _cached_introspect(user_token: str) -> dict:
+    """Introspect with a TTL cache and single-flight coalescing per token."""
+    key = _token_key(user_token)
+
+    cached = _introspection_cache.get(key)
+    if cached is not None:
+        if cached[0] > time.time():
+            return cached[1]
+        del _introspection_cache[key]
+
+    inflight = _introspection_inflight.get(key)
+    if inflight is not None:
+        try:
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            # The request that owned the call was cancelled, not this one:
+            # take over instead of failing every waiter with it
+            if not inflight.cancelled() or asyncio.current_task().cancelling():
+                raise
+            return await _cached_introspect(user_token)
+
+    future = asyncio.get_running_loop().create_future()
+    _introspection_inflight[key] = future
+    try:
+        token_info = await _introspect(user_token)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        future.set_exception(exc)
+        # Mark retrieved so an unobserved failure is not reported by asyncio
+        future.exception()
+        raise
+    else:
+        _store_introspection(key, token_info)
+        future.set_result(token_info)
+        return token_info
+    finally:
+        del _introspection_inflight[key]
+
+
+async def close_keycloak_client() -> None:
+    """Close the shared Keycloak HTTP client. Call on application shutdown."""
+    await _client.aclose()
+
+
+async def validate_keycloak_token(user_token: str = Depends(oauth2_scheme)):
+    if _is_jwt(user_token):
+        try:
+            token_info = await _decode_jwt(user_token)
+        except (JoseError, ValueError, KeyError) as exc:
+            # Bad signature, algorithm, claims, or a key the token cannot use
+            raise HTTPException(
+                status_code=401, detail="Token is invalid or expired"
+            ) from exc
+    else:
+        token_info = await _cached_introspect(user_token)
+        if not token_info["active"]:
+            raise HTTPException(status_code=401, detail="Token is invalid or expired")
 
-    # try:
-    #     token_info = keycloak_openid.decode_token(token, key="RS256")
-    # except KeycloakGetError as exc:
-    #     raise HTTPException(
-    #         status_code=401, detail="Token is invalid or expired") from exc
-
-    token_info = json.loads(result.content.decode())
-    print(token_info)
-    if not token_info["active"]:
-        raise HTTPException(status_code=401, detail="Token is invalid or expired")
-    roles = token_info["realm_access"].get("roles")
-    if "IT-Admin" in roles:
+    user_roles = frozenset((token_info.get("realm_access") or {}).get("roles") or ())
+    if not _REQUIRED_ROLES.isdisjoint(user_roles):
         return token_info
 
     raise HTTPException(status_code=403, detail="User does not have the required role")
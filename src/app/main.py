@@ -1,16 +1,58 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.authorize.keycloak import close_keycloak_client
+from app.shared.config import get_settings
+from app.shared.exceptions import AppException, configuration_error
+from app.shared.logger import get_logger
+from app.shared.responses import ErrorResponse
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await close_keycloak_client()
+
+
+app = FastAPI(title="OpenTaberna API", lifespan=lifespan)
+
+
+@app.exception_handler(AppException)
+async def app_exception_handler(request: Request, exc: AppException) -> Response:
+    """Render an AppException as an ErrorResponse; logs it once."""
+    response = ErrorResponse.from_exception(exc)
+    # orjson, as for other handler payloads, not JSONResponse's stdlib json
+    return Response(
+        orjson.dumps(response.model_dump(mode="json")),
+        status_code=response.status_code,
+        media_type="application/json",
+    )
 
-app = FastAPI(title="OpenTaberna API")
 
+origins = settings.cors_origins
+allow_credentials = settings.cors_credentials
 
-origins = ["*"]  # Consider restricting this in a production environment
+# A wildcard origin with credentials is invalid per the CORS spec and makes
+# Starlette echo the request Origin on every response. Refuse it in
+# production; elsewhere drop credentials so "*" is sent as-is.
+if "*" in origins and allow_credentials:
+    if settings.is_production:
+        raise configuration_error(
+            "CORS_ORIGINS", "wildcard origin cannot be used with CORS_CREDENTIALS"
+        )
+    logger.warning("CORS wildcard origin set, disabling credentials")
+    allow_credentials = False
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
-    allow_credentials=True,
+    allow_credentials=allow_credentials,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -17,12 +17,12 @@ class Environment(str, Enum):
 
     def is_production(self) -> bool:
         """Check if environment is production."""
-        return self == Environment.PRODUCTION
+        return self is Environment.PRODUCTION
 
     def is_testing(self) -> bool:
         """Check if environment is testing."""
-        return self == Environment.TESTING
+        return self is Environment.TESTING
 
     def is_development(self) -> bool:
         """Check if environment is development."""
-        return self == Environment.DEVELOPMENT
+        return self is Environment.DEVELOPMENT
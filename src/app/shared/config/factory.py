@@ -4,16 +4,22 @@ Configuration Factory
 Provides singleton access to application settings.
 """
 
-from functools import lru_cache
+from typing import Optional
 
 from app.shared.config.settings import Settings
 
 
-@lru_cache
+# Global settings instance (singleton), created on first access
+_settings: Optional[Settings] = None
+
+
 def get_settings() -> Settings:
     """
     Get application settings (cached singleton).
 
+    The instance is built on first call and returned as-is afterwards,
+    so hot paths pay a single global lookup instead of a cache probe.
+
     Returns:
         Settings instance
 
@@ -22,7 +28,16 @@ def get_settings() -> Settings:
         >>> settings = get_settings()
         >>> print(settings.database_url)
     """
-    return Settings()
+    if _settings is None:
+        return _load_settings()
+    return _settings
+
+
+def _load_settings() -> Settings:
+    """Build the settings singleton from the current environment."""
+    global _settings
+    _settings = Settings()
+    return _settings
 
 
 def clear_settings_cache() -> None:
@@ -35,4 +50,5 @@ def clear_settings_cache() -> None:
         >>> clear_settings_cache()
         >>> settings = get_settings()  # Loads fresh settings
     """
-    get_settings.cache_clear()
+    global _settings
+    _settings = None
@@ -8,9 +8,48 @@ Loads secrets from various sources:
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+# Secret mounts are set up before the process starts and don't come and go
+# at runtime, so the directories are probed once at import.
+_DOCKER_SECRETS_DIR = Path("/run/secrets")
+_K8S_SECRETS_DIR = Path("/var/run/secrets")
+_HAS_DOCKER_SECRETS = _DOCKER_SECRETS_DIR.is_dir()
+_HAS_K8S_SECRETS = _K8S_SECRETS_DIR.is_dir()
+
+# Secrets are small; one read usually drains the file
+_SECRET_READ_SIZE = 4096
+
+
+@lru_cache(maxsize=128)
+def _read_secret_file(secret_dir: Path, secret_name: str) -> str | None:
+    """
+    Read a secret file once and cache its content.
+
+    Args:
+        secret_dir: Secrets mount directory
+        secret_name: File name of the secret
+
+    Returns:
+        Stripped file content, or None if the file doesn't exist
+    """
+    try:
+        fd = os.open(secret_dir / secret_name, os.O_RDONLY)
+    except OSError:
+        return None
+
+    try:
+        chunks = []
+        while chunk := os.read(fd, _SECRET_READ_SIZE):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+    # UTF-8 rather than ASCII so non-ASCII passwords still load
+    return b"".join(chunks).strip().decode("utf-8")
+
 
 def load_secret(secret_name: str, default: Any = None) -> str | None:
     """
@@ -31,14 +70,16 @@ def load_secret(secret_name: str, default: Any = None) -> str | None:
         >>> db_password = load_secret("database_password", "default_pwd")
     """
     # Try Docker secrets
-    docker_secret_path = Path(f"/run/secrets/{secret_name}")
-    if docker_secret_path.exists():
-        return docker_secret_path.read_text().strip()
+    if _HAS_DOCKER_SECRETS:
+        secret = _read_secret_file(_DOCKER_SECRETS_DIR, secret_name)
+        if secret is not None:
+            return secret
 
     # Try Kubernetes secrets
-    k8s_secret_path = Path(f"/var/run/secrets/{secret_name}")
-    if k8s_secret_path.exists():
-        return k8s_secret_path.read_text().strip()
+    if _HAS_K8S_SECRETS:
+        secret = _read_secret_file(_K8S_SECRETS_DIR, secret_name)
+        if secret is not None:
+            return secret
 
     # Try environment variable (uppercase with underscores)
     env_var = secret_name.upper().replace("-", "_")
@@ -86,4 +127,4 @@ def secrets_available() -> bool:
         >>> if secrets_available():
         ...     password = load_secret("db_password")
     """
-    return Path("/run/secrets").exists() or Path("/var/run/secrets").exists()
+    return _HAS_DOCKER_SECRETS or _HAS_K8S_SECRETS
@@ -8,14 +8,22 @@ Environment-based configuration with support for:
 - Environment variables
 """
 
+import re
+from functools import cached_property
 from typing import Any
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from app.shared.config.enums import Environment
 from app.shared.config.loader import load_secret
 
+# scheme://user:password@ -> captures "scheme://user" ahead of the password
+_PASSWORD_RE = re.compile(r"^(?P<prefix>[^:]*://[^:@]*):[^@]*@")
+
+# Fields that fall back to a Docker/K8s secret when left empty
+_SECRET_FIELDS = ("database_url", "redis_password", "keycloak_client_secret")
+
 
 class Settings(BaseSettings):
     """
@@ -37,6 +45,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
     # Application
@@ -86,6 +95,16 @@ class Settings(BaseSettings):
     database_command_timeout: int = Field(
         default=60, description="Command timeout in seconds"
     )
+    database_statement_cache_size: int = Field(
+        default=512, description="Prepared statements cached per connection"
+    )
+    database_insert_page_size: int = Field(
+        default=1000, description="Rows per multi-VALUES INSERT in bulk inserts"
+    )
+    database_use_pgbouncer: bool = Field(
+        default=False,
+        description="Disable prepared statement caching for transaction poolers",
+    )
     database_server_settings: dict[str, str] = Field(
         default_factory=lambda: {
             "application_name": "OpenTaberna API",
@@ -149,54 +168,55 @@ class Settings(BaseSettings):
             raise ValueError("SECRET_KEY must be changed in production!")
         return v
 
-    @field_validator("database_url", mode="before")
+    @model_validator(mode="before")
     @classmethod
-    def load_database_url(cls, v: str | None) -> str:
-        """Load database URL from secrets if available."""
-        if v:
-            return v
-        return load_secret("database_url") or v or ""
+    def apply_environment(cls, data: Any) -> Any:
+        """
+        Fill empty credentials from secrets and apply environment overrides.
 
-    @field_validator("redis_password", mode="before")
-    @classmethod
-    def load_redis_password(cls, v: str | None) -> str | None:
-        """Load Redis password from secrets if available."""
-        if v:
-            return v
-        return load_secret("redis_password")
+        Runs on the raw input because the model is frozen once built.
+        """
+        if not isinstance(data, dict):
+            return data
+        data = dict(data)
+
+        # Fill credentials that were left empty from secrets if available
+        for name in _SECRET_FIELDS:
+            if not data.get(name, cls.model_fields[name].default):
+                secret = load_secret(name)
+                if secret is not None:
+                    data[name] = secret
+
+        try:
+            env = Environment(data.get("environment", Environment.DEVELOPMENT))
+        except ValueError:
+            # Leave the error to field validation
+            return data
 
-    @field_validator("keycloak_client_secret", mode="before")
-    @classmethod
-    def load_keycloak_secret(cls, v: str | None) -> str:
-        """Load Keycloak client secret from secrets if available."""
-        if v:
-            return v
-        return load_secret("keycloak_client_secret") or v or ""
-
-    def model_post_init(self, __context: Any) -> None:
-        """Post-initialization processing."""
         # Auto-enable debug in development
-        if self.environment.is_development():
-            self.debug = True
-            self.reload = True
+        if env.is_development():
+            data["debug"] = True
+            data["reload"] = True
 
         # Ensure security in production
-        if self.environment.is_production():
-            self.debug = False
-            self.reload = False
-            self.database_echo = False
+        if env.is_production():
+            data["debug"] = False
+            data["reload"] = False
+            data["database_echo"] = False
+
+        return data
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production."""
         return self.environment.is_production()
 
-    @property
+    @cached_property
     def is_testing(self) -> bool:
         """Check if running in testing mode."""
         return self.environment.is_testing()
 
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development mode."""
         return self.environment.is_development()
@@ -214,12 +234,4 @@ class Settings(BaseSettings):
         if not hide_password:
             return self.database_url
 
-        # Simple password hiding
-        if "@" in self.database_url:
-            protocol, rest = self.database_url.split("://", 1)
-            if "@" in rest:
-                creds, host = rest.split("@", 1)
-                if ":" in creds:
-                    user = creds.split(":")[0]
-                    return f"{protocol}://{user}:***@{host}"
-        return self.database_url
+        return _PASSWORD_RE.sub(r"\g<prefix>:***@", self.database_url, count=1)
@@ -7,6 +7,7 @@ Framework-agnostic, follows SOLID principles, and can be reused across APIs.
 Components:
     - Engine and session management
     - Base repository pattern with CRUD operations
+    - Optional query cache for repository reads
     - Transaction management
     - Health checks
     - Migration support
@@ -27,6 +28,8 @@ from app.shared.database.engine import (
     init_database,
     close_database,
     get_engine,
+    use_engine,
+    warmup_pool,
 )
 from app.shared.database.session import (
     get_session,
@@ -35,6 +38,7 @@ from app.shared.database.session import (
 )
 from app.shared.database.base import Base, TimestampMixin, SoftDeleteMixin
 from app.shared.database.repository import BaseRepository
+from app.shared.database.cache import QueryCache, TTLQueryCache
 from app.shared.database.transaction import transaction
 from app.shared.database.health import check_database_health
 
@@ -43,6 +47,8 @@ __all__ = [
     "init_database",
     "close_database",
     "get_engine",
+    "use_engine",
+    "warmup_pool",
     # Session
     "get_session",
     "get_session_dependency",
@@ -53,6 +59,8 @@ __all__ = [
     "SoftDeleteMixin",
     # Repository
     "BaseRepository",
+    "QueryCache",
+    "TTLQueryCache",
     # Transaction
     "transaction",
     # Health
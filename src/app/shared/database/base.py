@@ -5,12 +5,44 @@ Declarative base for SQLAlchemy models with common fields and utilities.
 """
 
 from datetime import datetime, UTC
-from typing import Any
-
-from sqlalchemy import DateTime, func
+from operator import attrgetter
+from typing import Any, Callable, Iterable
+
+from sqlalchemy import (
+    DateTime,
+    Index,
+    Select,
+    Update,
+    func,
+    inspect,
+    select,
+    update,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
+def _column_spec(cls: type) -> tuple[tuple[str, ...], Callable[[Any], tuple]]:
+    """
+    Return the column names of a model and a getter for their values.
+
+    Built once per mapped class and stored on it, so serialization does not
+    walk ``__table__.columns`` for every row.
+    """
+    spec = cls.__dict__.get("__to_dict_spec__")
+    if spec is None:
+        names = tuple(column.name for column in cls.__table__.columns)
+        if len(names) == 1:
+            single = attrgetter(names[0])
+
+            def getter(obj: Any) -> tuple:
+                return (single(obj),)
+        else:
+            getter = attrgetter(*names)
+        spec = (names, getter)
+        cls.__to_dict_spec__ = spec
+    return spec
+
+
 class Base(DeclarativeBase):
     """
     Base class for all database models.
@@ -29,6 +61,12 @@ class Base(DeclarativeBase):
     # Disable default constructor to avoid conflicts with Pydantic
     __abstract__ = True
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Build the column spec when a model is mapped, not on first use."""
+        super().__init_subclass__(**kwargs)
+        if getattr(cls, "__table__", None) is not None:
+            _column_spec(cls)
+
     def to_dict(self) -> dict[str, Any]:
         """
         Convert model instance to dictionary.
@@ -41,15 +79,60 @@ class Base(DeclarativeBase):
             >>> user.to_dict()
             {"id": 1, "name": "John", "created_at": "2025-12-07T..."}
         """
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
+        names, getter = _column_spec(type(self))
+        return dict(zip(names, getter(self)))
+
+    @classmethod
+    def to_dicts(cls, instances: Iterable["Base"]) -> list[dict[str, Any]]:
+        """
+        Convert many instances of this model to dictionaries.
+
+        Looks up the column spec once for the whole batch instead of once
+        per row.
+
+        Args:
+            instances: Model instances of this class
+
+        Returns:
+            List of dictionaries, in input order
+
+        Example:
+            >>> users = await repo.get_all(limit=100)
+            >>> return success(data=User.to_dicts(users))
+        """
+        names, getter = _column_spec(cls)
+        return [dict(zip(names, getter(instance))) for instance in instances]
+
+    @classmethod
+    def select_dicts(cls, *names: str) -> Select:
+        """
+        Build a column-level SELECT for this model.
+
+        Rows of the statement are plain tuples, not ORM instances, so
+        reading them skips instance construction and the identity map.
+        Pair it with ``BaseRepository.fetch_dicts`` for list endpoints
+        that only serialize data. Soft-delete and other filters must be
+        added by the caller.
+
+        Args:
+            *names: Column names to select (defaults to all columns)
+
+        Returns:
+            Select statement over the requested columns
+
+        Example:
+            >>> stmt = User.select_dicts("id", "name").where(User.active)
+            >>> rows = await repo.fetch_dicts(stmt)
+            [{"id": 1, "name": "John"}, ...]
+        """
+        if not names:
+            names = _column_spec(cls)[0]
+        return select(*(getattr(cls, name) for name in names))
 
     def __repr__(self) -> str:
         """String representation of model."""
-        attrs = ", ".join(
-            f"{k}={v!r}" for k, v in self.to_dict().items() if not k.startswith("_")
-        )
+        names, getter = _column_spec(type(self))
+        attrs = ", ".join(f"{k}={v!r}" for k, v in zip(names, getter(self)))
         return f"{self.__class__.__name__}({attrs})"
 
 
@@ -99,6 +182,29 @@ class SoftDeleteMixin:
         doc="Timestamp when record was soft deleted",
     )
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Add a partial primary key index over rows that are not deleted."""
+        super().__init_subclass__(**kwargs)
+        table = cls.__dict__.get("__table__")
+        if table is not None and "deleted_at" in table.c:
+            # Binding to table columns attaches the index to the table
+            Index(
+                f"ix_{table.name}_alive",
+                *table.primary_key.columns,
+                postgresql_where=table.c.deleted_at.is_(None),
+            )
+
+    @classmethod
+    def select_alive(cls) -> Select:
+        """
+        Select rows that are not soft deleted.
+
+        Example:
+            >>> stmt = Product.select_alive().where(Product.price > 10)
+            >>> products = (await repo.execute(stmt)).scalars().all()
+        """
+        return select(cls).where(cls.deleted_at.is_(None))
+
     @property
     def is_deleted(self) -> bool:
         """Check if record is soft deleted."""
@@ -111,3 +217,27 @@ class SoftDeleteMixin:
     def restore(self) -> None:
         """Restore soft deleted record."""
         self.deleted_at = None
+
+    @classmethod
+    def soft_delete_many(cls, ids: Iterable[Any]) -> Update:
+        """
+        Build a single UPDATE that soft deletes rows by primary key.
+
+        The timestamp comes from the database clock (``now()``), and rows
+        that are already deleted keep their original timestamp.
+
+        Args:
+            ids: Primary key values
+
+        Returns:
+            Update statement to execute in a session
+
+        Example:
+            >>> await repo.execute(User.soft_delete_many([1, 2, 3]))
+        """
+        pk = inspect(cls).primary_key[0]
+        return (
+            update(cls)
+            .where(pk.in_(ids), cls.deleted_at.is_(None))
+            .values(deleted_at=func.now())
+        )
@@ -0,0 +1,105 @@
+"""
+Query Cache
+
+Short-lived cache for repository reads, shared across requests.
+"""
+
+import time
+from typing import Any, Optional, Protocol
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# session.info key under which writes queue (cache, prefix) pairs to drop
+# once their transaction has ended
+INVALIDATIONS_KEY = "query_cache_invalidations"
+
+
+class QueryCache(Protocol):
+    """
+    Interface for repository query caches.
+
+    Implement it to back the cache with another store (e.g. Redis).
+    Values are plain data (column dicts, counts); the cache decides how
+    long to keep them.
+    """
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on a miss."""
+        ...
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store a value."""
+        ...
+
+    async def invalidate_prefix(self, prefix: str) -> None:
+        """Drop every entry whose key starts with prefix."""
+        ...
+
+
+class TTLQueryCache:
+    """
+    In-process query cache with a fixed time-to-live.
+
+    Entries expire after ``ttl`` seconds; when ``maxsize`` is reached,
+    expired entries are dropped first and then the oldest insertion.
+
+    Example:
+        >>> cache = TTLQueryCache(ttl=30)
+        >>> repo = UserRepository(session, cache=cache)
+    """
+
+    def __init__(self, ttl: float = 30.0, maxsize: int = 10_000):
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Seconds an entry is served after it was stored
+            maxsize: Maximum number of entries kept
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # key -> (expires_at, value)
+        self._entries: dict[str, tuple[float, Any]] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store a value for ``ttl`` seconds."""
+        now = time.monotonic()
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            for stale_key in [k for k, v in self._entries.items() if v[0] <= now]:
+                del self._entries[stale_key]
+            if len(self._entries) >= self.maxsize:
+                # Still full: evict the oldest insertion
+                del self._entries[next(iter(self._entries))]
+        self._entries[key] = (now + self.ttl, value)
+
+    async def invalidate_prefix(self, prefix: str) -> None:
+        """Drop every entry whose key starts with prefix."""
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+async def apply_invalidations(session: AsyncSession) -> None:
+    """
+    Drop the cached reads queued by writes on this session.
+
+    Called once the session's transaction has ended, so no reader can
+    cache the old row again between the invalidation and the commit.
+    """
+    pending = session.info.pop(INVALIDATIONS_KEY, None)
+    if pending:
+        for cache, prefix in pending:
+            await cache.invalidate_prefix(prefix)
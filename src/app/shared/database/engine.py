@@ -4,13 +4,17 @@ Database Engine Management
 Handles database engine creation, configuration, and lifecycle.
 """
 
-from typing import Optional
+import asyncio
+from contextlib import AsyncExitStack, contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncEngine,
 )
-from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from app.shared.database.utils import (
     get_logger,
@@ -23,11 +27,29 @@ logger = get_logger(__name__)
 
 
 # Global engine instance (singleton)
-_engine: Optional[AsyncEngine] = None
+_engine: AsyncEngine | None = None
+
+# Per-context engine that takes precedence over the global one (see use_engine)
+_engine_override: ContextVar[AsyncEngine | None] = ContextVar(
+    "db_engine_override", default=None
+)
+
+# TCP keepalives so connections silently dropped by NAT or the cluster
+# network are detected within about a minute instead of on the next query
+_KEEPALIVE_SERVER_SETTINGS = {
+    "tcp_keepalives_idle": "30",
+    "tcp_keepalives_interval": "10",
+    "tcp_keepalives_count": "3",
+}
+
+
+def _unique_statement_name() -> str:
+    """Statement names that cannot clash across pooled backends."""
+    return f"__asyncpg_{uuid4().hex}__"
 
 
 def create_engine(
-    database_url: Optional[str] = None,
+    database_url: str | None = None,
     pool_size: int = 20,
     max_overflow: int = 40,
     pool_timeout: int = 30,
@@ -35,7 +57,10 @@ def create_engine(
     pool_pre_ping: bool = True,
     echo: bool = False,
     echo_pool: bool = False,
-    server_settings: Optional[dict[str, str]] = None,
+    server_settings: dict[str, str] | None = None,
+    statement_cache_size: int = 512,
+    insert_page_size: int = 1000,
+    use_pgbouncer: bool = False,
 ) -> AsyncEngine:
     """
     Create async database engine with connection pooling.
@@ -50,6 +75,12 @@ def create_engine(
         echo: Log all SQL statements
         echo_pool: Log connection pool events
         server_settings: PostgreSQL server-side settings
+        statement_cache_size: Prepared statements kept per connection, so
+            repeated query shapes skip parse and plan on the server
+        insert_page_size: Rows rendered into each multi-VALUES INSERT when
+            many rows are inserted in one call (create_many, bulk_insert)
+        use_pgbouncer: Disable prepared statement caching for transaction-mode
+            poolers (PgBouncer, Supabase) that share backends between clients
 
     Returns:
         Configured AsyncEngine instance
@@ -71,6 +102,9 @@ def create_engine(
         echo = settings.database_echo
         echo_pool = settings.database_echo_pool
         server_settings = settings.database_server_settings
+        statement_cache_size = settings.database_statement_cache_size
+        insert_page_size = settings.database_insert_page_size
+        use_pgbouncer = settings.database_use_pgbouncer
 
     if not database_url:
         error_msg = "Database URL is required but not provided"
@@ -80,15 +114,27 @@ def create_engine(
             context={"pool_size": pool_size, "max_overflow": max_overflow},
         )
 
-    # Build connect_args
-    connect_args = {}
-    if server_settings:
-        connect_args["server_settings"] = server_settings
+    # Build connect_args; explicit server settings override the keepalive
+    # defaults
+    connect_args = {
+        "server_settings": {**_KEEPALIVE_SERVER_SETTINGS, **(server_settings or {})}
+    }
 
     # Add timeouts
     connect_args["command_timeout"] = 60
     connect_args["timeout"] = 60
 
+    # Transaction-mode poolers hand each transaction a different backend, so
+    # cached prepared statements collide or vanish between queries
+    if use_pgbouncer:
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = _unique_statement_name
+    else:
+        # asyncpg's own cache and SQLAlchemy's adapter cache in front of it
+        connect_args["statement_cache_size"] = statement_cache_size
+        connect_args["prepared_statement_cache_size"] = statement_cache_size
+
     logger.info(
         "Creating database engine",
         extra={
@@ -96,6 +142,7 @@ def create_engine(
             "max_overflow": max_overflow,
             "pool_recycle": pool_recycle,
             "pool_pre_ping": pool_pre_ping,
+            "use_pgbouncer": use_pgbouncer,
         },
     )
 
@@ -109,7 +156,11 @@ def create_engine(
             pool_timeout=pool_timeout,
             pool_recycle=pool_recycle,
             pool_pre_ping=pool_pre_ping,
-            poolclass=QueuePool,
+            poolclass=AsyncAdaptedQueuePool,
+            # Reuse the most recently returned connection so hot connections
+            # stay in use and idle ones age out through pool_recycle
+            pool_use_lifo=True,
+            insertmanyvalues_page_size=insert_page_size,
             connect_args=connect_args,
         )
         logger.info("Database engine created successfully")
@@ -152,7 +203,7 @@ def create_test_engine(database_url: str) -> AsyncEngine:
     )
 
 
-async def init_database(engine: Optional[AsyncEngine] = None) -> AsyncEngine:
+async def init_database(engine: AsyncEngine | None = None) -> AsyncEngine:
     """
     Initialize database connection.
 
@@ -178,6 +229,8 @@ async def init_database(engine: Optional[AsyncEngine] = None) -> AsyncEngine:
         logger.info("Database initialized with provided engine")
         return _engine
 
+    # No await between the check and the assignment, so concurrent callers
+    # on the event loop cannot both create an engine
     if _engine is None:
         _engine = create_engine()
         logger.info("Database initialized")
@@ -201,21 +254,65 @@ async def close_database() -> None:
     """
     global _engine
 
-    if _engine:
+    # Detach before awaiting so concurrent callers neither dispose the same
+    # engine twice nor pick up one that is being disposed
+    engine, _engine = _engine, None
+
+    if engine:
         logger.info("Closing database connection")
-        await _engine.dispose()
-        _engine = None
+        await engine.dispose()
         logger.info("Database connection closed")
     else:
         logger.debug("No database connection to close")
 
 
+async def warmup_pool(connections: int | None = None) -> int:
+    """
+    Open pooled connections ahead of traffic.
+
+    Checks out ``connections`` connections at the same time (default: the
+    pool size) and returns them to the pool, so the first requests after
+    startup do not each pay the TCP, TLS and authentication handshake.
+    Call it on application startup after ``init_database()``.
+
+    Args:
+        connections: Number of connections to open (defaults to pool size)
+
+    Returns:
+        Number of connections opened; 0 for pools that keep no connections
+
+    Example:
+        >>> await init_database()
+        >>> await warmup_pool()
+    """
+    engine = get_engine()
+    if connections is None:
+        size = getattr(engine.pool, "size", None)
+        if size is None:
+            # NullPool and friends keep no connections to warm up
+            return 0
+        connections = size()
+
+    # Hold all connections at once so each checkout opens a new one; the
+    # task group settles every checkout before the stack releases them
+    async with AsyncExitStack() as stack:
+        async with asyncio.TaskGroup() as group:
+            for _ in range(connections):
+                group.create_task(stack.enter_async_context(engine.connect()))
+
+    logger.info("Database pool warmed up", extra={"connections": connections})
+    return connections
+
+
 def get_engine() -> AsyncEngine:
     """
-    Get global database engine.
+    Get database engine for the current context.
+
+    Returns the engine bound with ``use_engine()`` if any, otherwise the
+    global engine.
 
     Returns:
-        Global AsyncEngine instance
+        AsyncEngine instance
 
     Raises:
         InternalError: If database not initialized
@@ -225,11 +322,42 @@ def get_engine() -> AsyncEngine:
         >>> async with engine.begin() as conn:
         ...     result = await conn.execute(select(User))
     """
-    if _engine is None:
-        error_msg = "Database not initialized. Call init_database() first."
-        logger.error(error_msg)
-        raise InternalError(
-            message=error_msg,
-            context={"action": "get_engine", "state": "not_initialized"},
-        )
-    return _engine
+    engine = _engine_override.get()
+    if engine is None:
+        engine = _engine
+    if engine is not None:
+        return engine
+
+    error_msg = "Database not initialized. Call init_database() first."
+    logger.error(error_msg)
+    raise InternalError(
+        message=error_msg,
+        context={"action": "get_engine", "state": "not_initialized"},
+    )
+
+
+@contextmanager
+def use_engine(engine: AsyncEngine) -> Iterator[AsyncEngine]:
+    """
+    Route ``get_engine()`` to another engine within the current context.
+
+    The binding lives in a ContextVar, so it only affects the current task
+    and tasks created from it (e.g. one request), which allows per-tenant
+    databases without passing the engine through every call.
+
+    Args:
+        engine: Engine to use inside the block
+
+    Yields:
+        The bound engine
+
+    Example:
+        >>> with use_engine(tenant_engine):
+        ...     async with get_session() as session:
+        ...         ...  # Runs against tenant_engine
+    """
+    token = _engine_override.set(engine)
+    try:
+        yield engine
+    finally:
+        _engine_override.reset(token)
@@ -4,11 +4,13 @@ Database Health Checks
 Utilities for monitoring database connectivity and health.
 """
 
+import time
 from datetime import datetime, UTC
-from typing import Optional
+from typing import Any
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
 
 from app.shared.database.engine import get_engine
 
@@ -16,25 +18,67 @@ from app.shared.database.utils import get_logger
 
 logger = get_logger(__name__)
 
+# Statements are built once and reused so SQLAlchemy's compiled cache sees
+# the same objects on every call; do not mutate them
+_PING_QUERY = text("SELECT 1")
+
+_DATABASE_INFO_QUERY = text(
+    "SELECT version(), current_database(), current_user, "
+    "(SELECT count(*) FROM pg_stat_activity "
+    "WHERE datname = current_database())"
+)
+
+# Reads pg_catalog directly; the information_schema view adds joins and
+# per-row privilege checks on top of the same data
+_TABLES_QUERY = text(
+    "SELECT c.relname FROM pg_catalog.pg_class c "
+    "JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace "
+    "WHERE n.nspname = 'public' AND c.relkind IN ('r', 'p') "
+    "ORDER BY c.relname"
+)
+
+
+def _pool_stats(engine: AsyncEngine) -> dict[str, int]:
+    """Collect connection pool statistics without touching the database."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        # NullPool and friends keep no connections to report on
+        return {}
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
 
 async def check_database_health(
-    engine: Optional[AsyncEngine] = None,
-) -> dict[str, any]:
+    engine: AsyncEngine | None = None,
+    deep: bool = True,
+) -> dict[str, Any]:
     """
     Check database connectivity and health.
 
     Performs a simple query to verify database is accessible
     and responsive. Useful for health check endpoints.
 
+    With ``deep=False`` no connection is checked out: only the engine
+    and its pool statistics are inspected. Use it for liveness probes so
+    frequent checks do not take connections away from real traffic, and
+    keep ``deep=True`` for readiness probes.
+
     Args:
         engine: Database engine (defaults to global engine)
+        deep: Run a query against the database (default) or only
+            inspect the connection pool
 
     Returns:
         Health status dictionary with:
         - healthy: bool
-        - latency_ms: float
+        - latency_ms: float (None for shallow checks)
         - timestamp: datetime
         - error: Optional[str]
+        - pool: dict with pool statistics (shallow checks only)
 
     Example:
         >>> health = await check_database_health()
@@ -58,15 +102,23 @@ async def check_database_health(
                 "error": "Database not initialized",
             }
 
-    start_time = datetime.now(UTC)
+    if not deep:
+        return {
+            "healthy": True,
+            "latency_ms": None,
+            "timestamp": datetime.now(UTC),
+            "error": None,
+            "pool": _pool_stats(engine),
+        }
+
+    start = time.perf_counter_ns()
 
     try:
         async with engine.connect() as conn:
             # Simple query to verify connectivity
-            await conn.execute(text("SELECT 1"))
+            await conn.execute(_PING_QUERY)
 
-        end_time = datetime.now(UTC)
-        latency_ms = (end_time - start_time).total_seconds() * 1000
+        latency_ms = (time.perf_counter_ns() - start) / 1e6
 
         logger.debug(
             "Database health check passed",
@@ -76,13 +128,12 @@ async def check_database_health(
         return {
             "healthy": True,
             "latency_ms": round(latency_ms, 2),
-            "timestamp": end_time,
+            "timestamp": datetime.now(UTC),
             "error": None,
         }
 
     except Exception as e:
-        end_time = datetime.now(UTC)
-        latency_ms = (end_time - start_time).total_seconds() * 1000
+        latency_ms = (time.perf_counter_ns() - start) / 1e6
 
         logger.error(
             "Database health check failed",
@@ -93,14 +144,14 @@ async def check_database_health(
         return {
             "healthy": False,
             "latency_ms": round(latency_ms, 2),
-            "timestamp": end_time,
+            "timestamp": datetime.now(UTC),
             "error": str(e),
         }
 
 
 async def get_database_info(
-    engine: Optional[AsyncEngine] = None,
-) -> dict[str, any]:
+    engine: AsyncEngine | None = None,
+) -> dict[str, Any]:
     """
     Get database server information.
 
@@ -121,26 +172,9 @@ async def get_database_info(
 
     try:
         async with engine.connect() as conn:
-            # Get PostgreSQL version
-            version_result = await conn.execute(text("SELECT version()"))
-            version = version_result.scalar_one()
-
-            # Get current database name
-            db_result = await conn.execute(text("SELECT current_database()"))
-            database = db_result.scalar_one()
-
-            # Get current user
-            user_result = await conn.execute(text("SELECT current_user"))
-            user = user_result.scalar_one()
-
-            # Get active connections count
-            conn_result = await conn.execute(
-                text(
-                    "SELECT count(*) FROM pg_stat_activity "
-                    "WHERE datname = current_database()"
-                )
-            )
-            active_connections = conn_result.scalar_one()
+            # Version, database, user and active connections in one round-trip
+            result = await conn.execute(_DATABASE_INFO_QUERY)
+            version, database, user, active_connections = result.one()
 
             logger.debug("Retrieved database info", extra={"database": database})
 
@@ -165,12 +199,13 @@ async def get_database_info(
 
 
 async def check_database_tables(
-    engine: Optional[AsyncEngine] = None,
+    engine: AsyncEngine | None = None,
 ) -> list[str]:
     """
     Get list of tables in database.
 
-    Queries information_schema for table names.
+    Queries pg_catalog for ordinary and partitioned tables in the public
+    schema.
 
     Args:
         engine: Database engine (defaults to global engine)
@@ -188,14 +223,8 @@ async def check_database_tables(
 
     try:
         async with engine.connect() as conn:
-            result = await conn.execute(
-                text(
-                    "SELECT table_name FROM information_schema.tables "
-                    "WHERE table_schema = 'public' "
-                    "ORDER BY table_name"
-                )
-            )
-            tables = [row[0] for row in result]
+            result = await conn.execute(_TABLES_QUERY)
+            tables = list(result.scalars())
 
             logger.debug(
                 "Retrieved database tables",
@@ -0,0 +1,105 @@
+"""
+Primary Key Batch Loader
+
+Coalesces concurrent primary-key lookups on one session into one query.
+"""
+
+import asyncio
+from typing import Any, Optional
+
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# session.info key under which a session's loader is stored
+PK_LOADER_KEY = "pk_loader"
+
+
+class PKBatchLoader:
+    """
+    Batch ``get``-by-primary-key calls issued in the same event loop tick.
+
+    The first lookup for a model waits one tick; lookups for the same model
+    started meanwhile join its batch and the batch is read with a single
+    ``SELECT ... WHERE pk IN (...)``. A batch of one uses ``session.get``,
+    so sequential lookups keep the identity map fast path. Only models
+    with a single-column primary key are supported, and ids must have the
+    column's Python type to match the loaded rows.
+
+    Example:
+        >>> session.info[PK_LOADER_KEY] = PKBatchLoader(session)
+        >>> users = await asyncio.gather(*(repo.get(i) for i in ids))
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize loader.
+
+        Args:
+            session: Session the batches are loaded with
+        """
+        self.session = session
+        # Open batch per model: id -> future resolved with the instance
+        self._batches: dict[type, dict[Any, asyncio.Future]] = {}
+
+    async def load(self, model: type, id: Any) -> Optional[Any]:
+        """
+        Load one instance by primary key, batched with concurrent calls.
+
+        Args:
+            model: Mapped model class
+            id: Primary key value
+
+        Returns:
+            Model instance or None if not found
+        """
+        batch = self._batches.get(model)
+        if batch is not None:
+            # Join the batch another task is about to load
+            future = batch.get(id)
+            if future is None:
+                future = batch[id] = asyncio.get_running_loop().create_future()
+            try:
+                # Shielded: cancelling one caller must not cancel the
+                # future other callers of the same id wait on
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The task that owned the batch was cancelled, not this one:
+                # load again instead of failing with it
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                return await self.load(model, id)
+
+        future = asyncio.get_running_loop().create_future()
+        batch = self._batches[model] = {id: future}
+        try:
+            # Let the other tasks scheduled in this tick add their ids
+            await asyncio.sleep(0)
+            del self._batches[model]
+            found = await self._load_batch(model, list(batch))
+        except BaseException as exc:
+            if self._batches.get(model) is batch:
+                del self._batches[model]
+            for waiter in batch.values():
+                if isinstance(exc, asyncio.CancelledError):
+                    # Joined callers see the cancellation and load again
+                    waiter.cancel()
+                else:
+                    waiter.set_exception(exc)
+                    # Mark retrieved so asyncio does not report it as unobserved
+                    waiter.exception()
+            raise
+
+        for key, waiter in batch.items():
+            waiter.set_result(found.get(key))
+        return found.get(id)
+
+    async def _load_batch(self, model: type, ids: list[Any]) -> dict[Any, Any]:
+        """Load the batch, mapping each id to its instance."""
+        if len(ids) == 1:
+            return {ids[0]: await self.session.get(model, ids[0])}
+
+        mapper = inspect(model)
+        pk_column = mapper.primary_key[0]
+        pk_key = mapper.get_property_by_column(pk_column).key
+        result = await self.session.scalars(select(model).where(pk_column.in_(ids)))
+        return {getattr(instance, pk_key): instance for instance in result}
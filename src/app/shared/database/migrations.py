@@ -4,11 +4,13 @@ Database Migration Support
 Utilities for Alembic migrations and schema management.
 """
 
+import asyncio
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
 
 from alembic import command
 from alembic.config import Config as AlembicConfig
+from alembic.script import ScriptDirectory
 
 from app.shared.database.utils import get_logger
 
@@ -16,11 +18,14 @@ logger = get_logger(__name__)
 
 
 def get_alembic_config(
-    migrations_dir: Optional[Path] = None,
+    migrations_dir: Path | None = None,
 ) -> AlembicConfig:
     """
     Get Alembic configuration.
 
+    The parsed configuration is cached per migrations directory; the
+    alembic.ini existence check still runs on every call.
+
     Args:
         migrations_dir: Path to migrations directory (defaults to ./migrations)
 
@@ -35,6 +40,7 @@ def get_alembic_config(
         # Default to ./migrations in project root
         migrations_dir = Path.cwd() / "migrations"
 
+    migrations_dir = migrations_dir.resolve()
     alembic_ini = migrations_dir / "alembic.ini"
 
     if not alembic_ini.exists():
@@ -43,19 +49,27 @@ def get_alembic_config(
             "Run 'alembic init migrations' first."
         )
 
-    config = AlembicConfig(str(alembic_ini))
-    config.set_main_option("script_location", str(migrations_dir))
+    return _load_alembic_config(str(alembic_ini), str(migrations_dir))
+
 
+@lru_cache(maxsize=8)
+def _load_alembic_config(ini_path: str, script_location: str) -> AlembicConfig:
+    """Parse alembic.ini once per migrations directory."""
+    config = AlembicConfig(ini_path)
+    config.set_main_option("script_location", script_location)
     return config
 
 
 async def run_migrations(
     revision: str = "head",
-    migrations_dir: Optional[Path] = None,
+    migrations_dir: Path | None = None,
 ) -> None:
     """
     Run database migrations to specified revision.
 
+    Alembic runs in a worker thread so the event loop keeps serving
+    requests (and health probes) while migrations are applied.
+
     Args:
         revision: Target revision (default: "head" for latest)
         migrations_dir: Path to migrations directory
@@ -74,7 +88,7 @@ async def run_migrations(
 
     try:
         config = get_alembic_config(migrations_dir)
-        command.upgrade(config, revision)
+        await asyncio.to_thread(command.upgrade, config, revision)
 
         logger.info("Database migrations completed successfully")
 
@@ -89,7 +103,7 @@ async def run_migrations(
 
 async def rollback_migration(
     revision: str = "-1",
-    migrations_dir: Optional[Path] = None,
+    migrations_dir: Path | None = None,
 ) -> None:
     """
     Rollback database migration.
@@ -112,7 +126,7 @@ async def rollback_migration(
 
     try:
         config = get_alembic_config(migrations_dir)
-        command.downgrade(config, revision)
+        await asyncio.to_thread(command.downgrade, config, revision)
 
         logger.info("Database rollback completed successfully")
 
@@ -128,7 +142,7 @@ async def rollback_migration(
 async def create_migration(
     message: str,
     autogenerate: bool = True,
-    migrations_dir: Optional[Path] = None,
+    migrations_dir: Path | None = None,
 ) -> None:
     """
     Create new migration file.
@@ -149,7 +163,8 @@ async def create_migration(
 
     try:
         config = get_alembic_config(migrations_dir)
-        command.revision(
+        await asyncio.to_thread(
+            command.revision,
             config,
             message=message,
             autogenerate=autogenerate,
@@ -167,7 +182,7 @@ async def create_migration(
 
 
 async def get_migration_history(
-    migrations_dir: Optional[Path] = None,
+    migrations_dir: Path | None = None,
 ) -> list[str]:
     """
     Get migration history.
@@ -176,18 +191,18 @@ async def get_migration_history(
         migrations_dir: Path to migrations directory
 
     Returns:
-        List of migration revisions
+        List of migration revisions, newest first
 
     Example:
         >>> history = await get_migration_history()
         >>> print(f"Total migrations: {len(history)}")
     """
     try:
-        get_alembic_config(migrations_dir)
-        # This would need to be implemented to actually query Alembic
-        # For now, return empty list
-        logger.debug("Retrieved migration history")
-        return []
+        config = get_alembic_config(migrations_dir)
+        # Reads the versions directory from disk, so keep it off the loop
+        history = await asyncio.to_thread(_list_revisions, config)
+        logger.debug("Retrieved migration history", extra={"count": len(history)})
+        return history
 
     except Exception as e:
         logger.error(
@@ -198,6 +213,12 @@ async def get_migration_history(
         raise
 
 
+def _list_revisions(config: AlembicConfig) -> list[str]:
+    """Walk the migration scripts from head down to base."""
+    script = ScriptDirectory.from_config(config)
+    return [revision.revision for revision in script.walk_revisions()]
+
+
 __all__ = [
     "get_alembic_config",
     "run_migrations",
@@ -5,12 +5,32 @@ Generic CRUD repository with async support and type safety.
 Framework-agnostic and reusable across different APIs.
 """
 
-from typing import Any, Generic, Optional, Sequence, Type, TypeVar
-
-from sqlalchemy import Delete, Select, Update, delete, func, select, update
+import logging
+from functools import lru_cache
+from typing import Any, AsyncIterator, Generic, Optional, Sequence, Type, TypeVar
+
+from sqlalchemy import (
+    ColumnElement,
+    Delete,
+    Select,
+    Update,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    inspect,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached, selectinload
 
 from app.shared.database.base import Base
+from app.shared.database.cache import INVALIDATIONS_KEY, QueryCache
+from app.shared.database.loader import PK_LOADER_KEY
 
 from app.shared.database.utils import get_logger, DatabaseError, NotFoundError
 
@@ -20,6 +40,30 @@ logger = get_logger(__name__)
 # Type variable for model classes
 ModelType = TypeVar("ModelType", bound=Base)
 
+# From this many rows on, bulk_insert streams rows with COPY on asyncpg
+COPY_THRESHOLD = 1000
+
+
+def _filter_statement(model: type, shape: str, criteria: dict[str, Any]) -> Select:
+    """Build a ``filter_by`` select of the given shape: rows, count or exists."""
+    if shape == "count":
+        stmt = select(func.count()).select_from(model)
+    elif shape == "exists":
+        stmt = select(literal(1)).select_from(model)
+    else:
+        stmt = select(model)
+    stmt = stmt.filter_by(**criteria)
+    if shape == "exists":
+        # Stops at the first match instead of counting every row
+        stmt = stmt.limit(1)
+    return stmt
+
+
+@lru_cache(maxsize=256)
+def _filter_template(model: type, shape: str, keys: frozenset[str]) -> Select:
+    """Statement per filter key set; values are bound at execution time."""
+    return _filter_statement(model, shape, {key: bindparam(key) for key in keys})
+
 
 class BaseRepository(Generic[ModelType]):
     """
@@ -43,23 +87,47 @@ class BaseRepository(Generic[ModelType]):
         ...
         ...     async def get_by_email(self, email: str) -> Optional[User]:
         ...         return await self.get_by(email=email)
+        >>>
+        >>> # Serve repeated reads from a cache shared across requests
+        >>> user_repo = BaseRepository(User, session, cache=TTLQueryCache(ttl=30))
     """
 
-    def __init__(self, model: Type[ModelType], session: AsyncSession):
+    def __init__(
+        self,
+        model: Type[ModelType],
+        session: AsyncSession,
+        cache: Optional[QueryCache] = None,
+    ):
         """
         Initialize repository.
 
         Args:
             model: SQLAlchemy model class
             session: Database session
+            cache: Optional query cache for get, get_by and count. Writes
+                made through this repository invalidate the model's
+                entries once the transaction ends (``get_session`` and
+                ``transaction`` apply them); changes made elsewhere show
+                up once entries expire.
         """
         self.model = model
         self.session = session
+        self.cache = cache
+        # Resolved once; every method needs the name and several the key
+        mapper = self._mapper = inspect(model)
+        self._name = model.__name__
+        self._primary_key = mapper.primary_key
+        self._pk_key = mapper.get_property_by_column(mapper.primary_key[0]).key
+        # (dialect, sql) for exists_by_id, built on first use
+        self._exists_sql: Optional[tuple[Any, str]] = None
 
     async def get(self, id: Any) -> Optional[ModelType]:
         """
         Get entity by primary key.
 
+        On sessions from ``get_session_dependency``, concurrent calls
+        (e.g. under ``asyncio.gather``) are loaded with one query.
+
         Args:
             id: Primary key value
 
@@ -71,7 +139,24 @@ class BaseRepository(Generic[ModelType]):
             >>> if user:
             ...     print(user.name)
         """
-        logger.debug(f"Getting {self.model.__name__} by id", extra={"id": id})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Getting {self._name} by id", extra={"id": id})
+        if not self._can_cache():
+            return await self._get(id)
+
+        key = f"{self._name}:get:{id!r}"
+        instance = await self._cached_instance(key)
+        if instance is None:
+            instance = await self._get(id)
+            if instance is not None:
+                await self.cache.set(key, instance.to_dict())
+        return instance
+
+    async def _get(self, id: Any) -> Optional[ModelType]:
+        """Load by primary key, through the session's batch loader if set."""
+        loader = self.session.info.get(PK_LOADER_KEY)
+        if loader is not None and len(self._primary_key) == 1:
+            return await loader.load(self.model, id)
         return await self.session.get(self.model, id)
 
     async def get_by(self, **filters) -> Optional[ModelType]:
@@ -88,25 +173,49 @@ class BaseRepository(Generic[ModelType]):
             >>> user = await repo.get_by(email="john@example.com")
             >>> user = await repo.get_by(name="John", active=True)
         """
-        logger.debug(
-            f"Getting {self.model.__name__} by filters",
-            extra={"filters": filters},
-        )
-        stmt = select(self.model).filter_by(**filters)
-        result = await self.session.execute(stmt)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Getting {self._name} by filters",
+                extra={"filters": filters},
+            )
+        if not self._can_cache():
+            return await self._get_by(filters)
+
+        key = self._cache_key("get_by", filters)
+        instance = await self._cached_instance(key)
+        if instance is None:
+            instance = await self._get_by(filters)
+            if instance is not None:
+                await self.cache.set(key, instance.to_dict())
+        return instance
+
+    async def _get_by(self, filters: dict[str, Any]) -> Optional[ModelType]:
+        """Run the get_by query."""
+        stmt, params = self._filter_query("rows", filters)
+        result = await self.session.execute(stmt, params)
         return result.scalar_one_or_none()
 
     async def get_all(
         self,
         skip: int = 0,
         limit: Optional[int] = None,
+        load: Sequence[Any] = (),
+        after_id: Any = None,
     ) -> Sequence[ModelType]:
         """
         Get all entities with pagination.
 
+        Results are ordered by primary key. For deep pagination pass the
+        last primary key of the previous page as ``after_id`` instead of a
+        growing ``skip``: the database then seeks straight to the next page
+        instead of reading and discarding every skipped row.
+
         Args:
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored with ``after_id``)
             limit: Maximum number of records to return
+            load: Relationships to eager load, as attribute names (loaded
+                with selectinload) or prebuilt loader options
+            after_id: Return only records with a primary key greater than this
 
         Returns:
             List of model instances
@@ -115,12 +224,20 @@ class BaseRepository(Generic[ModelType]):
             >>> users = await repo.get_all(skip=0, limit=10)
             >>> for user in users:
             ...     print(user.name)
-        """
-        logger.debug(
-            f"Getting all {self.model.__name__}",
-            extra={"skip": skip, "limit": limit},
-        )
-        stmt = select(self.model).offset(skip)
+            >>>
+            >>> # Load each user's orders in one extra query, not one per user
+            >>> users = await repo.get_all(limit=10, load=["orders"])
+            >>>
+            >>> # Keyset pagination
+            >>> page = await repo.get_all(limit=50)
+            >>> next_page = await repo.get_all(limit=50, after_id=page[-1].id)
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Getting all {self._name}",
+                extra={"skip": skip, "limit": limit, "after_id": after_id},
+            )
+        stmt = self._paginate(self._with_load(select(self.model), load), skip, after_id)
         if limit:
             stmt = stmt.limit(limit)
 
@@ -131,14 +248,24 @@ class BaseRepository(Generic[ModelType]):
         self,
         skip: int = 0,
         limit: Optional[int] = None,
+        load: Sequence[Any] = (),
+        after_id: Any = None,
+        where: Sequence[ColumnElement[bool]] = (),
         **filters,
     ) -> Sequence[ModelType]:
         """
         Get entities matching filters with pagination.
 
+        Ordered by primary key; see ``get_all`` for keyset pagination.
+        Range and other non-equality predicates go in ``where`` so the
+        database filters the rows instead of Python after loading them.
+
         Args:
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored with ``after_id``)
             limit: Maximum number of records to return
+            load: Relationships to eager load (see ``get_all``)
+            after_id: Return only records with a primary key greater than this
+            where: SQLAlchemy boolean expressions, combined with AND
             **filters: Column=value filters
 
         Returns:
@@ -151,27 +278,127 @@ class BaseRepository(Generic[ModelType]):
             ...     skip=0,
             ...     limit=20
             ... )
+            >>> in_stock = await repo.filter(
+            ...     where=[Product.stock > 0, Product.price <= 100],
+            ...     active=True,
+            ... )
         """
-        logger.debug(
-            f"Filtering {self.model.__name__}",
-            extra={"filters": filters, "skip": skip, "limit": limit},
-        )
-        stmt = select(self.model).filter_by(**filters).offset(skip)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Filtering {self._name}",
+                extra={
+                    "filters": filters,
+                    "skip": skip,
+                    "limit": limit,
+                    "after_id": after_id,
+                    "where": [str(clause) for clause in where],
+                },
+            )
+        stmt = self._with_load(select(self.model), load).filter_by(**filters)
+        if where:
+            stmt = stmt.where(*where)
+        stmt = self._paginate(stmt, skip, after_id)
         if limit:
             stmt = stmt.limit(limit)
 
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
-    async def create(self, **attributes) -> ModelType:
+    def _filter_query(
+        self, shape: str, filters: dict[str, Any]
+    ) -> tuple[Select, dict[str, Any]]:
+        """
+        Return a statement and its parameters for column=value filters.
+
+        Statements are cached per model and filter key set, so repeated
+        lookups of the same shape skip rebuilding the expression tree.
+        """
+        if any(value is None for value in filters.values()):
+            # None has to render as IS NULL, which a bound template cannot do
+            return _filter_statement(self.model, shape, filters), {}
+        return _filter_template(self.model, shape, frozenset(filters)), filters
+
+    def _cache_key(self, op: str, filters: dict[str, Any]) -> str:
+        """Cache key for a read; every key of the model shares its prefix."""
+        return f"{self._name}:{op}:{sorted(filters.items())!r}"
+
+    async def _cached_instance(self, key: str) -> Optional[ModelType]:
+        """Rebuild a cached row as an instance of this session, or None."""
+        data = await self.cache.get(key)
+        if data is None:
+            return None
+        instance = self.model(**data)
+        # The session's own copy may carry newer, unflushed state
+        identity = self._mapper.identity_key_from_instance(instance)
+        existing = self.session.identity_map.get(identity)
+        if existing is not None:
+            return existing
+        make_transient_to_detached(instance)
+        # load=False attaches the cached state without querying the database
+        return await self.session.merge(instance, load=False)
+
+    def _can_cache(self) -> bool:
+        """
+        Whether reads may go through the cache.
+
+        Not while this session holds uncommitted writes: its reads would
+        disagree with what other sessions see.
+        """
+        if self.cache is None:
+            return False
+        session = self.session
+        return not (
+            INVALIDATIONS_KEY in session.info
+            or session.new
+            or session.dirty
+            or session.deleted
+        )
+
+    def _invalidate(self) -> None:
+        """Queue this model's cached reads to be dropped after the write ends."""
+        if self.cache is not None:
+            pending = self.session.info.setdefault(INVALIDATIONS_KEY, [])
+            entry = (self.cache, f"{self._name}:")
+            if entry not in pending:
+                pending.append(entry)
+
+    def _paginate(self, stmt: Select, skip: int, after_id: Any) -> Select:
+        """Order by primary key and page by offset or, if given, by key."""
+        stmt = stmt.order_by(*self._primary_key)
+        if after_id is not None:
+            return stmt.where(self._primary_key[0] > after_id)
+        return stmt.offset(skip)
+
+    def _with_load(self, stmt: Select, load: Sequence[Any]) -> Select:
+        """Apply eager loading; names resolve to selectinload on the model."""
+        if not load:
+            return stmt
+        return stmt.options(
+            *(
+                selectinload(getattr(self.model, option))
+                if isinstance(option, str)
+                else option
+                for option in load
+            )
+        )
+
+    async def create(self, refresh: bool = True, **attributes) -> ModelType:
         """
         Create new entity.
 
+        The INSERT returns generated keys and server defaults where the
+        dialect supports RETURNING; only columns it could not return are
+        reloaded with a follow-up SELECT.
+
         Args:
+            refresh: Flush so database-generated values (IDs, server
+                defaults) are populated. Pass False to only add
+                the instance to the session; it is then written by the next
+                flush or commit.
             **attributes: Model attributes
 
         Returns:
-            Created model instance with generated ID
+            Created model instance with generated ID (pending if refresh=False)
 
         Example:
             >>> user = await repo.create(
@@ -180,29 +407,39 @@ class BaseRepository(Generic[ModelType]):
             ... )
             >>> print(user.id)  # Auto-generated ID
         """
-        logger.debug(
-            f"Creating {self.model.__name__}",
-            extra={"attributes": attributes},
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Creating {self._name}",
+                extra={"attributes": attributes},
+            )
         try:
             instance = self.model(**attributes)
             self.session.add(instance)
+            self._invalidate()
+            if not refresh:
+                return instance
             await self.session.flush()
-            await self.session.refresh(instance)
-            logger.debug(
-                f"{self.model.__name__} created successfully",
-                extra={"id": getattr(instance, "id", None)},
-            )
+            # Server-generated values the INSERT did not return are expired
+            expired = inspect(instance).expired_attributes
+            if expired:
+                await self.session.refresh(instance, attribute_names=expired)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"{self._name} created successfully",
+                    extra={"id": getattr(instance, "id", None)},
+                )
             return instance
         except Exception as e:
+            # Field names only: values can be large or sensitive
+            fields = sorted(attributes)
             logger.error(
-                f"Failed to create {self.model.__name__}",
-                extra={"error": str(e), "attributes": attributes},
+                f"Failed to create {self._name}",
+                extra={"error": str(e), "fields": fields},
                 exc_info=True,
             )
             raise DatabaseError(
-                message=f"Failed to create {self.model.__name__}",
-                context={"entity_type": self.model.__name__, "attributes": attributes},
+                message=f"Failed to create {self._name}",
+                context={"entity_type": self._name, "fields": fields},
                 original_exception=e,
             )
 
@@ -213,6 +450,13 @@ class BaseRepository(Generic[ModelType]):
         Args:
             items: List of attribute dictionaries
 
+        Rows are sent as batched multi-VALUES INSERT ... RETURNING
+        statements (``DATABASE_INSERT_PAGE_SIZE`` rows each), so generated
+        keys and server defaults come back without a refresh per row.
+        On asyncpg, batches of at least ``COPY_THRESHOLD`` rows that carry
+        their own primary key are streamed with COPY and loaded back with
+        a single SELECT.
+
         Returns:
             List of created model instances
 
@@ -222,33 +466,167 @@ class BaseRepository(Generic[ModelType]):
             ...     {"name": "Jane", "email": "jane@example.com"},
             ... ])
         """
-        logger.debug(
-            f"Creating {len(items)} {self.model.__name__} instances",
-        )
+        if not items:
+            return []
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Creating {len(items)} {self._name} instances",
+            )
         try:
-            instances = [self.model(**item) for item in items]
-            self.session.add_all(instances)
-            await self.session.flush()
-            for instance in instances:
-                await self.session.refresh(instance)
-            logger.debug(f"Created {len(instances)} {self.model.__name__} instances")
+            pk_column = self._primary_key[0]
+            pk_key = self._pk_key
+            has_keys = len(self._primary_key) == 1 and all(
+                pk_key in item for item in items
+            )
+
+            if has_keys and await self._copy_rows(items):
+                # Caller-supplied keys: load the copied rows back in one query
+                ids = [item[pk_key] for item in items]
+                stmt = select(self.model).where(
+                    pk_column
+                    == any_(bindparam("ids", ids, type_=ARRAY(pk_column.type)))
+                )
+                by_id = {
+                    getattr(obj, pk_key): obj
+                    for obj in await self.session.scalars(stmt)
+                }
+                instances = [by_id[key] for key in ids]
+            else:
+                stmt = insert(self.model).returning(
+                    self.model, sort_by_parameter_order=True
+                )
+                result = await self.session.scalars(stmt, items)
+                instances = result.all()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Created {len(instances)} {self._name} instances")
+            self._invalidate()
             return instances
         except Exception as e:
             logger.error(
-                f"Failed to create {len(items)} {self.model.__name__} instances",
+                f"Failed to create {len(items)} {self._name} instances",
                 extra={"error": str(e), "count": len(items)},
                 exc_info=True,
             )
             raise DatabaseError(
-                message=f"Failed to bulk create {self.model.__name__}",
-                context={"entity_type": self.model.__name__, "count": len(items)},
+                message=f"Failed to bulk create {self._name}",
+                context={"entity_type": self._name, "count": len(items)},
+                original_exception=e,
+            )
+
+    async def bulk_insert(self, rows: list[dict[str, Any]]) -> int:
+        """
+        Insert many rows without building model instances.
+
+        Uses a single executemany INSERT. On asyncpg, batches of at least
+        ``COPY_THRESHOLD`` rows are sent with COPY instead. Either way the
+        rows join the session's current transaction, but no instances are
+        returned or added to the session. All rows must have the same keys.
+
+        Args:
+            rows: Column=value dictionaries
+
+        Returns:
+            Number of inserted rows
+
+        Example:
+            >>> count = await repo.bulk_insert([
+            ...     {"name": "John", "email": "john@example.com"},
+            ...     {"name": "Jane", "email": "jane@example.com"},
+            ... ])
+        """
+        if not rows:
+            return 0
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Bulk inserting {len(rows)} {self._name} rows",
+            )
+        try:
+            if not await self._copy_rows(rows):
+                await self.session.execute(insert(self.model), rows)
+            self._invalidate()
+            return len(rows)
+        except Exception as e:
+            logger.error(
+                f"Failed to bulk insert {len(rows)} {self._name} rows",
+                extra={"error": str(e), "count": len(rows)},
+                exc_info=True,
+            )
+            raise DatabaseError(
+                message=f"Failed to bulk insert {self._name}",
+                context={"entity_type": self._name, "count": len(rows)},
                 original_exception=e,
             )
 
+    async def _copy_rows(self, rows: list[dict[str, Any]]) -> bool:
+        """
+        Stream rows into the table with COPY if the batch qualifies.
+
+        Only batches of at least ``COPY_THRESHOLD`` rows on asyncpg whose
+        rows share one key set qualify. Values go through each column's
+        bind processing, and omitted columns get their scalar Python
+        defaults; a column with any other Python-side default keeps the
+        batch on INSERT.
+
+        Returns:
+            True if the rows were copied, False if the caller must insert them
+        """
+        if len(rows) < COPY_THRESHOLD:
+            return False
+        keys = rows[0].keys()
+        if any(row.keys() != keys for row in rows):
+            return False
+        conn = await self.session.connection()
+        dialect = conn.dialect
+        if dialect.driver != "asyncpg":
+            return False
+
+        table = self.model.__table__
+        # (column name, attribute key or None, default, bind processor)
+        fields = []
+        for prop in self._mapper.column_attrs:
+            column = prop.columns[0]
+            if column.table is not table:
+                continue
+            key = prop.key if prop.key in keys else None
+            default = None
+            if key is None:
+                if column.default is None:
+                    continue  # Server default or NULL
+                if not column.default.is_scalar:
+                    return False  # Callables and sequences run on INSERT
+                default = column.default.arg
+            processor = column.type.dialect_impl(dialect).bind_processor(dialect)
+            fields.append((column.name, key, default, processor))
+        if sum(key is not None for _, key, _, _ in fields) != len(keys):
+            return False  # Keys that are not columns: let INSERT report them
+
+        records = []
+        for row in rows:
+            record = []
+            for _, key, default, process in fields:
+                value = row[key] if key is not None else default
+                record.append(value if process is None else process(value))
+            records.append(tuple(record))
+        # Make pending ORM changes visible before streaming rows
+        await self.session.flush()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            table.name,
+            records=records,
+            columns=[name for name, _, _, _ in fields],
+            schema_name=table.schema,
+        )
+        return True
+
     async def update(self, id: Any, **attributes) -> Optional[ModelType]:
         """
         Update entity by primary key.
 
+        Runs a single UPDATE ... RETURNING; an instance of the row already
+        in the session is refreshed with the returned values.
+
         Args:
             id: Primary key value
             **attributes: Attributes to update
@@ -261,22 +639,41 @@ class BaseRepository(Generic[ModelType]):
             >>> if user:
             ...     print(user.name)  # "John Smith"
         """
-        logger.debug(
-            f"Updating {self.model.__name__}",
-            extra={"id": id, "attributes": attributes},
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Updating {self._name}",
+                extra={"id": id, "attributes": attributes},
+            )
+        primary_key = self._primary_key
+        if not attributes or len(primary_key) != 1:
+            # Nothing to write, or a composite key: load and modify instead
+            instance = await self.get(id)
+            if instance and attributes:
+                for key, value in attributes.items():
+                    setattr(instance, key, value)
+                await self.session.flush()
+                await self.session.refresh(instance)
+                self._invalidate()
+            return instance
+
+        stmt = (
+            update(self.model)
+            .where(primary_key[0] == id)
+            .values(**attributes)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
         )
-        instance = await self.get(id)
-        if instance:
-            for key, value in attributes.items():
-                setattr(instance, key, value)
-            await self.session.flush()
-            await self.session.refresh(instance)
-        return instance
+        result = await self.session.scalars(stmt)
+        self._invalidate()
+        return result.one_or_none()
 
     async def update_many(self, **filters) -> int:
         """
         Update multiple entities matching filters.
 
+        Runs one UPDATE without synchronizing the session: instances
+        already loaded keep their old values until refreshed.
+
         Args:
             **filters: Must include filter conditions and 'values' dict
 
@@ -291,21 +688,30 @@ class BaseRepository(Generic[ModelType]):
             >>> print(f"Updated {count} records")
         """
         values = filters.pop("values", {})
-        logger.debug(
-            f"Updating many {self.model.__name__}",
-            extra={"filters": filters, "values": values},
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Updating many {self._name}",
+                extra={"filters": filters, "values": values},
+            )
+        stmt = (
+            update(self.model)
+            .filter_by(**filters)
+            .values(**values)
+            .execution_options(synchronize_session=False)
         )
-        stmt = update(self.model).filter_by(**filters).values(**values)
         result = await self.session.execute(stmt)
-        await self.session.flush()
+        self._invalidate()
         return result.rowcount  # type: ignore
 
-    async def delete(self, id: Any) -> bool:
+    async def delete(self, id: Any, flush: bool = True) -> bool:
         """
         Delete entity by primary key.
 
         Args:
             id: Primary key value
+            flush: Emit the DELETE right away. Pass False when several
+                changes are batched in one transaction; the row is then
+                deleted by the next flush or commit.
 
         Returns:
             True if deleted, False if not found
@@ -315,14 +721,17 @@ class BaseRepository(Generic[ModelType]):
             >>> if deleted:
             ...     print("User deleted")
         """
-        logger.debug(
-            f"Deleting {self.model.__name__}",
-            extra={"id": id},
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Deleting {self._name}",
+                extra={"id": id},
+            )
         instance = await self.get(id)
         if instance:
             await self.session.delete(instance)
-            await self.session.flush()
+            if flush:
+                await self.session.flush()
+            self._invalidate()
             return True
         return False
 
@@ -330,6 +739,9 @@ class BaseRepository(Generic[ModelType]):
         """
         Delete multiple entities matching filters.
 
+        Runs one DELETE without synchronizing the session: instances
+        already loaded stay in it until expunged or expired.
+
         Args:
             **filters: Column=value filters
 
@@ -340,13 +752,18 @@ class BaseRepository(Generic[ModelType]):
             >>> count = await repo.delete_many(active=False)
             >>> print(f"Deleted {count} inactive users")
         """
-        logger.debug(
-            f"Deleting many {self.model.__name__}",
-            extra={"filters": filters},
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Deleting many {self._name}",
+                extra={"filters": filters},
+            )
+        stmt = (
+            delete(self.model)
+            .filter_by(**filters)
+            .execution_options(synchronize_session=False)
         )
-        stmt = delete(self.model).filter_by(**filters)
         result = await self.session.execute(stmt)
-        await self.session.flush()
+        self._invalidate()
         return result.rowcount  # type: ignore
 
     async def count(self, **filters) -> int:
@@ -363,16 +780,23 @@ class BaseRepository(Generic[ModelType]):
             >>> total = await repo.count()
             >>> active_count = await repo.count(active=True)
         """
-        logger.debug(
-            f"Counting {self.model.__name__}",
-            extra={"filters": filters},
-        )
-        stmt = select(func.count()).select_from(self.model)
-        if filters:
-            stmt = stmt.filter_by(**filters)
-
-        result = await self.session.execute(stmt)
-        return result.scalar_one()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Counting {self._name}",
+                extra={"filters": filters},
+            )
+        cache = self.cache if self._can_cache() else None
+        if cache is not None:
+            key = self._cache_key("count", filters)
+            total = await cache.get(key)
+            if total is not None:
+                return total
+
+        stmt, params = self._filter_query("count", filters)
+        total = await self.session.scalar(stmt, params)
+        if cache is not None:
+            await cache.set(key, total)
+        return total
 
     async def exists(self, **filters) -> bool:
         """
@@ -389,8 +813,60 @@ class BaseRepository(Generic[ModelType]):
             >>> if exists:
             ...     raise ValueError("Email already taken")
         """
-        count = await self.count(**filters)
-        return count > 0
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Checking {self._name} exists",
+                extra={"filters": filters},
+            )
+        stmt, params = self._filter_query("exists", filters)
+        return await self.session.scalar(stmt, params) is not None
+
+    async def exists_by_id(self, id: Any) -> bool:
+        """
+        Check if an entity with this primary key exists.
+
+        Sends plain SQL straight to the driver, skipping statement
+        compilation and result processing. Models with a composite key
+        go through ``get`` instead.
+
+        Args:
+            id: Primary key value
+
+        Returns:
+            True if the row exists
+
+        Example:
+            >>> if not await repo.exists_by_id(user_id):
+            ...     raise NotFoundError(...)
+        """
+        if len(self._primary_key) != 1:
+            return await self.get(id) is not None
+
+        conn = await self.session.connection()
+        dialect = conn.dialect
+        if self._exists_sql is None or self._exists_sql[0] is not dialect:
+            self._exists_sql = (dialect, self._pk_exists_sql(dialect))
+        sql = self._exists_sql[1]
+        params = {"pk": id} if dialect.paramstyle in ("named", "pyformat") else (id,)
+        result = await conn.exec_driver_sql(sql, params)
+        return result.first() is not None
+
+    def _pk_exists_sql(self, dialect: Any) -> str:
+        """Primary key lookup in the driver's own parameter style."""
+        placeholder = {
+            "qmark": "?",
+            "numeric": ":1",
+            "numeric_dollar": "$1",
+            "format": "%s",
+            "pyformat": "%(pk)s",
+            "named": ":pk",
+        }[dialect.paramstyle]
+        preparer = dialect.identifier_preparer
+        column = self._primary_key[0]
+        return (
+            f"SELECT 1 FROM {preparer.format_table(column.table)} "
+            f"WHERE {preparer.quote(column.name)} = {placeholder} LIMIT 1"
+        )
 
     async def execute(self, statement: Select | Update | Delete) -> Any:
         """
@@ -412,8 +888,68 @@ class BaseRepository(Generic[ModelType]):
             >>> result = await repo.execute(stmt)
             >>> recent_users = result.scalars().all()
         """
-        logger.debug(f"Executing custom statement for {self.model.__name__}")
-        return await self.session.execute(statement)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Executing custom statement for {self._name}")
+        result = await self.session.execute(statement)
+        if not isinstance(statement, Select):
+            self._invalidate()
+        return result
+
+    async def fetch_dicts(self, statement: Select) -> list[dict[str, Any]]:
+        """
+        Execute a column-level select and return rows as dictionaries.
+
+        Skips ORM instance construction, which dominates the cost of
+        endpoints that only serialize lists of rows.
+
+        Args:
+            statement: Select over columns, e.g. from ``Model.select_dicts()``
+
+        Returns:
+            List of row dictionaries keyed by column name
+
+        Example:
+            >>> stmt = User.select_dicts("id", "email").limit(50)
+            >>> users = await repo.fetch_dicts(stmt)
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Fetching {self._name} rows as dicts")
+        result = await self.session.execute(statement)
+        return [dict(row) for row in result.mappings()]
+
+    async def stream_dicts(
+        self,
+        statement: Select,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream rows of a column-level select as dictionaries.
+
+        Rows are fetched from a server-side cursor ``chunk_size`` at a time,
+        so memory stays bounded for exports of any size. Consume the
+        iterator while the session's transaction is still open.
+
+        Args:
+            statement: Select over columns, e.g. from ``Model.select_dicts()``
+            chunk_size: Number of rows fetched per round-trip
+
+        Yields:
+            Row dictionaries keyed by column name
+
+        Example:
+            >>> async for row in repo.stream_dicts(User.select_dicts()):
+            ...     writer.writerow(row)
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Streaming {self._name} rows as dicts",
+                extra={"chunk_size": chunk_size},
+            )
+        result = await self.session.stream(
+            statement.execution_options(yield_per=chunk_size)
+        )
+        async for row in result.mappings():
+            yield dict(row)
 
     # Helper methods that raise exceptions (optional, for convenience)
 
@@ -438,10 +974,10 @@ class BaseRepository(Generic[ModelType]):
         """
         entity = await self.get(id)
         if entity is None:
-            logger.warning(f"{self.model.__name__} not found", extra={"id": id})
+            logger.warning(f"{self._name} not found", extra={"id": id})
             raise NotFoundError(
-                message=f"{self.model.__name__} not found",
-                context={"entity_type": self.model.__name__, "id": id},
+                message=f"{self._name} not found",
+                context={"entity_type": self._name, "id": id},
             )
         return entity
 
@@ -463,12 +999,10 @@ class BaseRepository(Generic[ModelType]):
         """
         entity = await self.get_by(**filters)
         if entity is None:
-            logger.warning(
-                f"{self.model.__name__} not found", extra={"filters": filters}
-            )
+            logger.warning(f"{self._name} not found", extra={"filters": filters})
             raise NotFoundError(
-                message=f"{self.model.__name__} not found",
-                context={"entity_type": self.model.__name__, "filters": filters},
+                message=f"{self._name} not found",
+                context={"entity_type": self._name, "filters": filters},
             )
         return entity
 
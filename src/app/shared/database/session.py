@@ -9,17 +9,25 @@ from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.shared.database.cache import apply_invalidations
 from app.shared.database.engine import get_engine
+from app.shared.database.loader import PK_LOADER_KEY, PKBatchLoader
 
 from app.shared.database.utils import get_logger, DatabaseError
 
 logger = get_logger(__name__)
 
+# Factory for the engine it is bound to; rebuilt when the engine changes
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+
 
 def create_session_factory() -> async_sessionmaker[AsyncSession]:
     """
     Create async session factory.
 
+    The factory is built once and reused for as long as ``get_engine()``
+    returns the same engine.
+
     Returns:
         Configured async_sessionmaker
 
@@ -28,15 +36,21 @@ def create_session_factory() -> async_sessionmaker[AsyncSession]:
         >>> async with factory() as session:
         ...     result = await session.execute(select(User))
     """
+    global _session_factory
+
     engine = get_engine()
+    factory = _session_factory
+    if factory is not None and factory.kw["bind"] is engine:
+        return factory
 
-    return async_sessionmaker(
+    factory = _session_factory = async_sessionmaker(
         bind=engine,
         class_=AsyncSession,
         expire_on_commit=False,  # Don't expire objects after commit
         autoflush=False,  # Manual control over flushing
         autocommit=False,  # Explicit transaction control
     )
+    return factory
 
 
 @asynccontextmanager
@@ -48,6 +62,7 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     - Session creation
     - Transaction commit on success
     - Rollback on exception
+    - Dropping query cache entries of written models
     - Session cleanup
 
     Yields:
@@ -66,8 +81,11 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     try:
         logger.debug("Database session created")
         yield session
-        await session.commit()
-        logger.debug("Database session committed")
+        # Nothing to commit if the block never touched the database or
+        # already ended its transaction (e.g. through transaction())
+        if session.in_transaction():
+            await session.commit()
+            logger.debug("Database session committed")
     except DatabaseError:
         # Already a DatabaseError, just rollback and re-raise
         await session.rollback()
@@ -87,6 +105,7 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             original_exception=e,
         )
     finally:
+        await apply_invalidations(session)
         await session.close()
         logger.debug("Database session closed")
 
@@ -95,7 +114,9 @@ async def get_session_dependency() -> AsyncGenerator[AsyncSession, None]:
     """
     FastAPI dependency for database session.
 
-    Use with Depends() in route handlers.
+    Use with Depends() in route handlers. The session carries a
+    ``PKBatchLoader``, so concurrent ``repo.get`` calls within a request
+    share one query.
 
     Yields:
         AsyncSession for route handler
@@ -114,6 +135,7 @@ async def get_session_dependency() -> AsyncGenerator[AsyncSession, None]:
         ...     return result.scalar_one_or_none()
     """
     async with get_session() as session:
+        session.info[PK_LOADER_KEY] = PKBatchLoader(session)
         yield session
 
 
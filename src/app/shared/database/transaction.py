@@ -9,6 +9,7 @@ from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.shared.database.cache import apply_invalidations
 from app.shared.database.utils import get_logger, DatabaseError
 
 logger = get_logger(__name__)
@@ -82,6 +83,7 @@ async def transaction(
                 context={"error_type": type(e).__name__},
                 original_exception=e,
             )
+        await apply_invalidations(session)
 
 
 __all__ = ["transaction"]
@@ -4,9 +4,46 @@ Base exception class for all application exceptions.
 Provides automatic logging and context management.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
 from .interfaces import IAppException
-from .enums import ErrorCategory, ErrorCode
+from .enums import _CATEGORY_LABELS, _VALUES, ErrorCategory, ErrorCode
+
+# Logger for automatic exception logging, resolved on first use
+_logger = None
+
+
+def _get_logger():
+    """
+    Return the exception logger, creating it once per process.
+
+    Imported lazily because the logger module is not needed until the
+    first exception is logged.
+    """
+    global _logger
+    if _logger is None:
+        from app.shared.logger import get_logger
+
+        _logger = get_logger(__name__)
+    return _logger
+
+
+# Log fields of context-free exceptions, keyed by (category, error_code)
+_BASE_LOG_DATA: Dict[tuple, Dict[str, str]] = {}
+
+
+def _base_log_data(category: ErrorCategory, error_code: ErrorCode) -> Dict[str, str]:
+    """Return the shared, read-only log fields for a category and code."""
+    key = (category, error_code)
+    log_data = _BASE_LOG_DATA.get(key)
+    if log_data is None:
+        log_data = _BASE_LOG_DATA[key] = {
+            "error_code": _VALUES[error_code],
+            "category": _VALUES[category],
+        }
+    return log_data
 
 
 class AppException(Exception, IAppException):
@@ -16,6 +53,11 @@ class AppException(Exception, IAppException):
     Implements automatic logging and provides a rich context for error handling.
     All custom exceptions should inherit from this class.
 
+    Logging is deferred until the exception is handled: the first call to
+    ``ensure_logged`` (made by ``to_dict`` and ``ErrorResponse.from_exception``)
+    writes the log record, so exceptions that are caught and discarded or
+    wrapped cost no logging work.
+
     Attributes:
         message: Human-readable error message
         error_code: Specific error code for identification
@@ -25,6 +67,20 @@ class AppException(Exception, IAppException):
         should_auto_log: Whether to automatically log this exception
     """
 
+    # Attributes live in slots so instances never allocate a __dict__;
+    # subclasses declare ``__slots__ = ()`` to keep it that way
+    __slots__ = (
+        "message",
+        "error_code",
+        "category",
+        "context",
+        "original_exception",
+        "should_auto_log",
+        "_logged",
+        "_dict_cache",
+        "_original_info",
+    )
+
     def __init__(
         self,
         message: str,
@@ -43,8 +99,9 @@ class AppException(Exception, IAppException):
             category: Error category
             context: Additional context data (e.g., field names, entity IDs)
             original_exception: Original exception if wrapping another exception
-            should_auto_log: Whether to automatically log this exception
+            should_auto_log: Whether to log this exception once it is handled
         """
+        # Mirrored by errors._CategorizedError.__init__; keep both in sync
         super().__init__(message)
         self.message = message
         self.error_code = error_code
@@ -52,10 +109,10 @@ class AppException(Exception, IAppException):
         self.context = context or {}
         self.original_exception = original_exception
         self.should_auto_log = should_auto_log
-
-        # Automatic logging
-        if self.should_auto_log:
-            self._log_exception()
+        # Set once the log record has been written (see ensure_logged)
+        self._logged = False
+        self._dict_cache: Optional[Dict[str, Any]] = None
+        self._original_info: Optional[Tuple[str, str]] = None
 
     def get_message(self) -> str:
         """Get the human-readable error message."""
@@ -77,71 +134,119 @@ class AppException(Exception, IAppException):
         """Determine if this exception should be automatically logged."""
         return self.should_auto_log
 
+    def ensure_logged(self) -> None:
+        """
+        Log the exception if auto-logging is on and it was not logged yet.
+
+        Call this where the exception is finally handled, e.g. in an
+        exception handler that turns it into a response.
+        """
+        if self.should_auto_log and not self._logged:
+            self._logged = True
+            self._log_exception()
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert exception to dictionary for logging and API responses.
 
+        The dictionary is built once and reused on later calls; treat it as
+        read-only. Converting the exception counts as handling it, so it is
+        logged here if it was not already.
+
         Returns:
             Dictionary with error details
         """
-        result = {
-            "error": {
-                "message": self.message,
-                "code": self.error_code.value,
-                "category": self.category.value,
-            }
+        self.ensure_logged()
+        result = self._dict_cache
+        if result is not None:
+            return result
+
+        error = {
+            "message": self.message,
+            "code": _VALUES[self.error_code],
+            "category": _VALUES[self.category],
         }
 
         # Add context if present
         if self.context:
-            result["error"]["context"] = self.context
+            error["context"] = self.context
 
         # Add original exception info if present
         if self.original_exception:
-            result["error"]["original_error"] = {
-                "type": type(self.original_exception).__name__,
-                "message": str(self.original_exception),
+            type_name, original_message = self._original_error_info()
+            error["original_error"] = {
+                "type": type_name,
+                "message": original_message,
             }
 
+        result = self._dict_cache = {"error": error}
         return result
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the exception to JSON bytes for an API response body.
+
+        Uses orjson on the cached to_dict() result; context values that are
+        not JSON types (e.g. Decimal) are written with str().
+
+        Returns:
+            UTF-8 encoded JSON of to_dict()
+        """
+        return orjson.dumps(self.to_dict(), default=str)
+
+    def _original_error_info(self) -> Tuple[str, str]:
+        """
+        Return the wrapped exception's type name and message.
+
+        Computed on first use and kept, since both logging and to_dict need
+        them and str() of driver exceptions can be costly.
+        """
+        info = self._original_info
+        if info is None:
+            original = self.original_exception
+            info = self._original_info = (type(original).__name__, str(original))
+        return info
+
     def _log_exception(self) -> None:
         """
         Log the exception automatically using the logger module.
 
         Uses appropriate log level based on error category:
-        - Client errors (4xx): WARNING
-        - Server errors (5xx): ERROR
+        - Client errors (4xx): WARNING, without traceback
+        - Server errors (5xx): ERROR, with traceback
         """
         try:
-            from app.shared.logger import get_logger
-
-            logger = get_logger(__name__)
+            logger = _get_logger()
 
             # Prepare log data
-            log_data = {
-                "error_code": self.error_code.value,
-                "category": self.category.value,
-                **self.context,
-            }
+            if not self.context and not self.original_exception:
+                # Reuse the shared fields; the logger only reads them
+                log_data = _base_log_data(self.category, self.error_code)
+            else:
+                log_data = {
+                    "error_code": _VALUES[self.error_code],
+                    "category": _VALUES[self.category],
+                    **self.context,
+                }
 
             # Add original exception if present
             if self.original_exception:
-                log_data["original_error"] = type(self.original_exception).__name__
-                log_data["original_message"] = str(self.original_exception)
+                type_name, original_message = self._original_error_info()
+                log_data["original_error"] = type_name
+                log_data["original_message"] = original_message
 
             # Log with appropriate level
             if self.category.is_client_error():
-                logger.warning(
-                    self.message,
-                    **log_data,
-                    exc_info=self.original_exception is not None,
-                )
+                # Expected outcomes: the message and context say enough, so
+                # skip capturing and formatting a traceback
+                logger.warning(self.message, extra=log_data)
             else:
                 logger.error(
                     self.message,
-                    **log_data,
-                    exc_info=True,  # Always include stack trace for server errors
+                    extra=log_data,
+                    # This exception's own traceback, even when logged
+                    # outside its except block (e.g. by a handler)
+                    exc_info=self,
                 )
 
         except Exception as e:
@@ -154,17 +259,28 @@ class AppException(Exception, IAppException):
                 file=sys.stderr,
             )
 
+    def __reduce__(self):
+        """Pickle slot attributes too; BaseException only saves __dict__."""
+        state = {
+            name: getattr(self, name)
+            for name in AppException.__slots__
+            if hasattr(self, name)
+        }
+        return type(self), self.args, state
+
     def __str__(self) -> str:
         """String representation of the exception."""
-        context_str = f", context={self.context}" if self.context else ""
-        return f"{self.category.value.upper()}: [{self.error_code.value}] {self.message}{context_str}"
+        text = f"{_CATEGORY_LABELS[self.category]}: [{_VALUES[self.error_code]}] {self.message}"
+        if self.context:
+            text = f"{text}, context={self.context}"
+        return text
 
     def __repr__(self) -> str:
         """Detailed representation of the exception."""
         return (
             f"{self.__class__.__name__}("
             f"message='{self.message}', "
-            f"error_code={self.error_code.value}, "
-            f"category={self.category.value}, "
+            f"error_code={_VALUES[self.error_code]}, "
+            f"category={_VALUES[self.category]}, "
             f"context={self.context})"
         )
@@ -21,21 +21,30 @@ class ErrorCategory(str, Enum):
 
     def is_client_error(self) -> bool:
         """Check if error is caused by client (4xx)."""
-        return self in (
-            ErrorCategory.NOT_FOUND,
-            ErrorCategory.VALIDATION,
-            ErrorCategory.AUTHENTICATION,
-            ErrorCategory.AUTHORIZATION,
-            ErrorCategory.BUSINESS_RULE,
-        )
+        return self in _CLIENT_CATEGORIES
 
     def is_server_error(self) -> bool:
         """Check if error is server-side (5xx)."""
-        return self in (
-            ErrorCategory.DATABASE,
-            ErrorCategory.EXTERNAL_SERVICE,
-            ErrorCategory.INTERNAL,
-        )
+        return self in _SERVER_CATEGORIES
+
+
+# Category groups, built once so the checks above are a single set lookup
+_CLIENT_CATEGORIES = frozenset(
+    {
+        ErrorCategory.NOT_FOUND,
+        ErrorCategory.VALIDATION,
+        ErrorCategory.AUTHENTICATION,
+        ErrorCategory.AUTHORIZATION,
+        ErrorCategory.BUSINESS_RULE,
+    }
+)
+_SERVER_CATEGORIES = frozenset(
+    {
+        ErrorCategory.DATABASE,
+        ErrorCategory.EXTERNAL_SERVICE,
+        ErrorCategory.INTERNAL,
+    }
+)
 
 
 class ErrorCode(str, Enum):
@@ -83,3 +92,12 @@ class ErrorCode(str, Enum):
     INTERNAL_ERROR = "internal_error"
     CONFIGURATION_ERROR = "configuration_error"
     UNKNOWN_ERROR = "unknown_error"
+
+
+# Plain string value of every member; a dict lookup is cheaper than the
+# Enum ``.value`` property on the logging and serialization paths
+_VALUES = {
+    member: member.value for enum in (ErrorCategory, ErrorCode) for member in enum
+}
+# Upper-cased category labels used as the AppException.__str__ prefix
+_CATEGORY_LABELS = {category: category.value.upper() for category in ErrorCategory}
@@ -10,17 +10,23 @@ from .base import AppException
 from .enums import ErrorCategory, ErrorCode
 
 
-class NotFoundError(AppException):
+class _CategorizedError(AppException):
     """
-    Exception raised when a requested resource is not found.
+    Shared base for the concrete errors below.
 
-    Examples: Database entity not found, API resource not found, File not found
-    HTTP Status Code: 404
+    Subclasses only declare ``_default_message``, ``_default_code`` and
+    ``_category``. The attributes are written here directly instead of
+    going through ``AppException.__init__``, which saves a call frame on
+    every raise; keep both initializers in sync. The class defaults are
+    read through ``self``, which CPython serves from its per-type attribute
+    cache, and the message and code defaults only when no value was given.
     """
 
-    _default_message = "Resource not found"
-    _default_code = ErrorCode.RESOURCE_NOT_FOUND
-    _category = ErrorCategory.NOT_FOUND
+    __slots__ = ()
+
+    _default_message: str
+    _default_code: ErrorCode
+    _category: ErrorCategory
 
     def __init__(
         self,
@@ -29,17 +35,35 @@ class NotFoundError(AppException):
         context: Optional[Dict[str, Any]] = None,
         original_exception: Optional[Exception] = None,
     ):
-        super().__init__(
-            message=message or self._default_message,
-            error_code=error_code or self._default_code,
-            category=self._category,
-            context=context,
-            original_exception=original_exception,
-            should_auto_log=True,
-        )
+        message = message or self._default_message
+        Exception.__init__(self, message)
+        self.message = message
+        self.error_code = error_code or self._default_code
+        self.category = self._category
+        self.context = context or {}
+        self.original_exception = original_exception
+        self.should_auto_log = True
+        self._logged = False
+        self._dict_cache = None
+        self._original_info = None
 
 
-class ValidationError(AppException):
+class NotFoundError(_CategorizedError):
+    """
+    Exception raised when a requested resource is not found.
+
+    Examples: Database entity not found, API resource not found, File not found
+    HTTP Status Code: 404
+    """
+
+    __slots__ = ()
+
+    _default_message = "Resource not found"
+    _default_code = ErrorCode.RESOURCE_NOT_FOUND
+    _category = ErrorCategory.NOT_FOUND
+
+
+class ValidationError(_CategorizedError):
     """
     Exception raised when input validation fails.
 
@@ -47,28 +71,14 @@ class ValidationError(AppException):
     HTTP Status Code: 422 (Unprocessable Entity)
     """
 
+    __slots__ = ()
+
     _default_message = "Validation failed"
     _default_code = ErrorCode.INVALID_INPUT
     _category = ErrorCategory.VALIDATION
 
-    def __init__(
-        self,
-        message: str = None,
-        error_code: ErrorCode = None,
-        context: Optional[Dict[str, Any]] = None,
-        original_exception: Optional[Exception] = None,
-    ):
-        super().__init__(
-            message=message or self._default_message,
-            error_code=error_code or self._default_code,
-            category=self._category,
-            context=context,
-            original_exception=original_exception,
-            should_auto_log=True,
-        )
-
 
-class DatabaseError(AppException):
+class DatabaseError(_CategorizedError):
     """
     Exception raised when database operations fail.
 
@@ -76,28 +86,14 @@ class DatabaseError(AppException):
     HTTP Status Code: 500 (Internal Server Error) or 503 (Service Unavailable)
     """
 
+    __slots__ = ()
+
     _default_message = "Database operation failed"
     _default_code = ErrorCode.DATABASE_QUERY_ERROR
     _category = ErrorCategory.DATABASE
 
-    def __init__(
-        self,
-        message: str = None,
-        error_code: ErrorCode = None,
-        context: Optional[Dict[str, Any]] = None,
-        original_exception: Optional[Exception] = None,
-    ):
-        super().__init__(
-            message=message or self._default_message,
-            error_code=error_code or self._default_code,
-            category=self._category,
-            context=context,
-            original_exception=original_exception,
-            should_auto_log=True,
-        )
 
-
-class AuthenticationError(AppException):
+class AuthenticationError(_CategorizedError):
     """
     Exception raised when authentication fails.
 
@@ -105,28 +101,14 @@ class AuthenticationError(AppException):
     HTTP Status Code: 401 (Unauthorized)
     """
 
+    __slots__ = ()
+
     _default_message = "Authentication failed"
     _default_code = ErrorCode.INVALID_CREDENTIALS
     _category = ErrorCategory.AUTHENTICATION
 
-    def __init__(
-        self,
-        message: str = None,
-        error_code: ErrorCode = None,
-        context: Optional[Dict[str, Any]] = None,
-        original_exception: Optional[Exception] = None,
-    ):
-        super().__init__(
-            message=message or self._default_message,
-            error_code=error_code or self._default_code,
-            category=self._category,
-            context=context,
-            original_exception=original_exception,
-            should_auto_log=True,
-        )
-
 
-class AuthorizationError(AppException):
+class AuthorizationError(_CategorizedError):
     """
     Exception raised when authorization/permission checks fail.
 
@@ -134,28 +116,14 @@ class AuthorizationError(AppException):
     HTTP Status Code: 403 (Forbidden)
     """
 
+    __slots__ = ()
+
     _default_message = "Access denied"
     _default_code = ErrorCode.INSUFFICIENT_PERMISSIONS
     _category = ErrorCategory.AUTHORIZATION
 
-    def __init__(
-        self,
-        message: str = None,
-        error_code: ErrorCode = None,
-        context: Optional[Dict[str, Any]] = None,
-        original_exception: Optional[Exception] = None,
-    ):
-        super().__init__(
-            message=message or self._default_message,
-            error_code=error_code or self._default_code,
-            category=self._category,
-            context=context,
-            original_exception=original_exception,
-            should_auto_log=True,
-        )
-
 
-class BusinessRuleError(AppException):
+class BusinessRuleError(_CategorizedError):
     """
     Exception raised when business rules are violated.
 
@@ -163,28 +131,14 @@ class BusinessRuleError(AppException):
     HTTP Status Code: 400 (Bad Request)
     """
 
+    __slots__ = ()
+
     _default_message = "Business rule violation"
     _default_code = ErrorCode.BUSINESS_RULE_VIOLATION
     _category = ErrorCategory.BUSINESS_RULE
 
-    def __init__(
-        self,
-        message: str = None,
-        error_code: ErrorCode = None,
-        context: Optional[Dict[str, Any]] = None,
-        original_exception: Optional[Exception] = None,
-    ):
-        super().__init__(
-            message=message or self._default_message,
-            error_code=error_code or self._default_code,
-            category=self._category,
-            context=context,
-            original_exception=original_exception,
-            should_auto_log=True,
-        )
-
 
-class ExternalServiceError(AppException):
+class ExternalServiceError(_CategorizedError):
     """
     Exception raised when external service calls fail.
 
@@ -192,28 +146,14 @@ class ExternalServiceError(AppException):
     HTTP Status Code: 502 (Bad Gateway) or 503 (Service Unavailable)
     """
 
+    __slots__ = ()
+
     _default_message = "External service error"
     _default_code = ErrorCode.EXTERNAL_SERVICE_ERROR
     _category = ErrorCategory.EXTERNAL_SERVICE
 
-    def __init__(
-        self,
-        message: str = None,
-        error_code: ErrorCode = None,
-        context: Optional[Dict[str, Any]] = None,
-        original_exception: Optional[Exception] = None,
-    ):
-        super().__init__(
-            message=message or self._default_message,
-            error_code=error_code or self._default_code,
-            category=self._category,
-            context=context,
-            original_exception=original_exception,
-            should_auto_log=True,
-        )
-
 
-class InternalError(AppException):
+class InternalError(_CategorizedError):
     """
     Exception raised for internal/unexpected errors.
 
@@ -221,22 +161,8 @@ class InternalError(AppException):
     HTTP Status Code: 500 (Internal Server Error)
     """
 
+    __slots__ = ()
+
     _default_message = "Internal error occurred"
     _default_code = ErrorCode.INTERNAL_ERROR
     _category = ErrorCategory.INTERNAL
-
-    def __init__(
-        self,
-        message: str = None,
-        error_code: ErrorCode = None,
-        context: Optional[Dict[str, Any]] = None,
-        original_exception: Optional[Exception] = None,
-    ):
-        super().__init__(
-            message=message or self._default_message,
-            error_code=error_code or self._default_code,
-            category=self._category,
-            context=context,
-            original_exception=original_exception,
-            should_auto_log=True,
-        )
@@ -2,6 +2,10 @@
 Factory functions and helpers for exception handling.
 
 Provides convenient helper functions for common exception scenarios.
+
+Client errors (not found, validation, auth) are expected outcomes. When
+raising one while handling another exception, use ``raise ... from None``
+unless the original error matters, so no exception chain is kept.
 """
 
 from typing import Any, Dict, Optional
@@ -42,9 +46,10 @@ def entity_not_found(
     Example:
         >>> raise entity_not_found("User", user_id=123)
     """
-    default_message = f"{entity_type} with ID '{entity_id}' not found"
+    if not message:
+        message = f"{entity_type} with ID '{entity_id}' not found"
     return NotFoundError(
-        message=message or default_message,
+        message=message,
         error_code=ErrorCode.ENTITY_NOT_FOUND,
         context={
             "entity_type": entity_type,
@@ -72,9 +77,10 @@ def missing_field(field_name: str, message: Optional[str] = None) -> ValidationE
     Example:
         >>> raise missing_field("email")
     """
-    default_message = f"Required field '{field_name}' is missing"
+    if not message:
+        message = f"Required field '{field_name}' is missing"
     return ValidationError(
-        message=message or default_message,
+        message=message,
         error_code=ErrorCode.MISSING_FIELD,
         context={"field": field_name},
     )
@@ -99,11 +105,12 @@ def invalid_format(
     Example:
         >>> raise invalid_format("email", "valid email address")
     """
-    default_message = (
-        f"Field '{field_name}' has invalid format. Expected: {expected_format}"
-    )
+    if not message:
+        message = (
+            f"Field '{field_name}' has invalid format. Expected: {expected_format}"
+        )
     return ValidationError(
-        message=message or default_message,
+        message=message,
         error_code=ErrorCode.INVALID_FORMAT,
         context={
             "field": field_name,
@@ -133,9 +140,10 @@ def duplicate_entry(
     Example:
         >>> raise duplicate_entry("User", "email", "test@example.com")
     """
-    default_message = f"{entity_type} with {field_name}='{field_value}' already exists"
+    if not message:
+        message = f"{entity_type} with {field_name}='{field_value}' already exists"
     return ValidationError(
-        message=message or default_message,
+        message=message,
         error_code=ErrorCode.DUPLICATE_ENTRY,
         context={
             "entity_type": entity_type,
@@ -151,15 +159,16 @@ def constraint_violation(
     message: Optional[str] = None,
 ) -> ValidationError:
     """Create ValidationError for constraint violation."""
-    details_str = f" - {details}" if details else ""
-    default_message = f"Constraint violation: {constraint}{details_str}"
+    if not message:
+        details_str = f" - {details}" if details else ""
+        message = f"Constraint violation: {constraint}{details_str}"
 
     context: Dict[str, Any] = {"constraint": constraint}
     if details:
         context["details"] = details
 
     return ValidationError(
-        message=message or default_message,
+        message=message,
         error_code=ErrorCode.CONSTRAINT_VIOLATION,
         context=context,
     )
@@ -253,11 +262,18 @@ def access_denied(
             else "Access denied"
         )
 
-    context = {k: v for k, v in {"resource": resource, "action": action}.items() if v}
+    if resource and action:
+        context = {"resource": resource, "action": action}
+    elif resource:
+        context = {"resource": resource}
+    elif action:
+        context = {"action": action}
+    else:
+        context = None
     return AuthorizationError(
         message=message,
         error_code=ErrorCode.ACCESS_DENIED,
-        context=context or None,
+        context=context,
     )
 
 
@@ -266,13 +282,14 @@ def insufficient_permissions(
     message: Optional[str] = None,
 ) -> AuthorizationError:
     """Create AuthorizationError for insufficient permissions."""
-    default_message = (
-        f"Insufficient permissions: {required_role} role required"
-        if required_role
-        else "Insufficient permissions"
-    )
+    if not message:
+        message = (
+            f"Insufficient permissions: {required_role} role required"
+            if required_role
+            else "Insufficient permissions"
+        )
     return AuthorizationError(
-        message=message or default_message,
+        message=message,
         error_code=ErrorCode.INSUFFICIENT_PERMISSIONS,
         context={"required_role": required_role} if required_role else None,
     )
@@ -324,15 +341,16 @@ def operation_not_allowed(
     message: Optional[str] = None,
 ) -> BusinessRuleError:
     """Create BusinessRuleError for disallowed operation."""
-    reason_str = f" - {reason}" if reason else ""
-    default_message = f"Operation not allowed: {operation}{reason_str}"
+    if not message:
+        reason_str = f" - {reason}" if reason else ""
+        message = f"Operation not allowed: {operation}{reason_str}"
 
     context: Dict[str, str] = {"operation": operation}
     if reason:
         context["reason"] = reason
 
     return BusinessRuleError(
-        message=message or default_message,
+        message=message,
         error_code=ErrorCode.OPERATION_NOT_ALLOWED,
         context=context,
     )
@@ -362,9 +380,10 @@ def external_service_unavailable(
     Example:
         >>> raise external_service_unavailable("PaymentAPI")
     """
-    default_message = f"External service unavailable: {service_name}"
+    if not message:
+        message = f"External service unavailable: {service_name}"
     return ExternalServiceError(
-        message=message or default_message,
+        message=message,
         error_code=ErrorCode.EXTERNAL_SERVICE_UNAVAILABLE,
         context={"service_name": service_name},
         original_exception=original_exception,
@@ -377,15 +396,16 @@ def external_service_timeout(
     message: Optional[str] = None,
 ) -> ExternalServiceError:
     """Create ExternalServiceError for service timeout."""
-    timeout_str = f" (timeout: {timeout_seconds}s)" if timeout_seconds else ""
-    default_message = f"External service timeout: {service_name}{timeout_str}"
+    if not message:
+        timeout_str = f" (timeout: {timeout_seconds}s)" if timeout_seconds else ""
+        message = f"External service timeout: {service_name}{timeout_str}"
 
     context = {"service_name": service_name}
     if timeout_seconds:
         context["timeout_seconds"] = timeout_seconds
 
     return ExternalServiceError(
-        message=message or default_message,
+        message=message,
         error_code=ErrorCode.EXTERNAL_SERVICE_TIMEOUT,
         context=context,
     )
@@ -402,15 +422,16 @@ def configuration_error(
     message: Optional[str] = None,
 ) -> InternalError:
     """Create InternalError for configuration issues."""
-    details_str = f" - {details}" if details else ""
-    default_message = f"Configuration error: {config_key}{details_str}"
+    if not message:
+        details_str = f" - {details}" if details else ""
+        message = f"Configuration error: {config_key}{details_str}"
 
     context: Dict[str, str] = {"config_key": config_key}
     if details:
         context["details"] = details
 
     return InternalError(
-        message=message or default_message,
+        message=message,
         error_code=ErrorCode.CONFIGURATION_ERROR,
         context=context,
     )
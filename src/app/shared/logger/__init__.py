@@ -41,7 +41,12 @@ from .interfaces import ILogFormatter, ILogFilter, ILogHandler
 # Implementations
 from .formatters import JSONFormatter, ConsoleFormatter
 from .filters import SensitiveDataFilter, LevelFilter
-from .handlers import ConsoleHandler, FileHandler, DailyRotatingFileHandler
+from .handlers import (
+    ConsoleHandler,
+    FileHandler,
+    DailyRotatingFileHandler,
+    QueuedHandler,
+)
 
 
 __all__ = [
@@ -67,6 +72,7 @@ __all__ = [
     "ConsoleHandler",
     "FileHandler",
     "DailyRotatingFileHandler",
+    "QueuedHandler",
 ]
 
 __version__ = "1.0.0"
@@ -11,7 +11,12 @@ from app.shared.config.enums import Environment
 
 from .enums import LogLevel
 from .filters import SensitiveDataFilter
-from .handlers import ConsoleHandler, DailyRotatingFileHandler, FileHandler
+from .handlers import (
+    ConsoleHandler,
+    DailyRotatingFileHandler,
+    FileHandler,
+    QueuedHandler,
+)
 from .interfaces import ILogFilter, ILogHandler
 
 
@@ -37,17 +42,14 @@ class LoggerConfig:
         cls, name: str, env: Environment, log_dir: Optional[Path] = None
     ) -> "LoggerConfig":
         """Create configuration based on environment."""
-        if env == Environment.DEVELOPMENT:
-            return cls._development_config(name)
-        elif env == Environment.TESTING:
-            return cls._testing_config(name)
-        elif env == Environment.STAGING:
-            return cls._staging_config(name, log_dir)
-        else:  # PRODUCTION
-            return cls._production_config(name, log_dir)
+        # Looked up by name so subclasses can override individual builders
+        builder = getattr(cls, _CONFIG_BUILDERS.get(env, "_production_config"))
+        return builder(name, log_dir)
 
     @classmethod
-    def _development_config(cls, name: str) -> "LoggerConfig":
+    def _development_config(
+        cls, name: str, log_dir: Optional[Path] = None
+    ) -> "LoggerConfig":
         """Development environment configuration."""
         return cls(
             name=name,
@@ -58,7 +60,9 @@ class LoggerConfig:
         )
 
     @classmethod
-    def _testing_config(cls, name: str) -> "LoggerConfig":
+    def _testing_config(
+        cls, name: str, log_dir: Optional[Path] = None
+    ) -> "LoggerConfig":
         """Testing environment configuration."""
         return cls(
             name=name,
@@ -77,18 +81,22 @@ class LoggerConfig:
             name=name,
             level=LogLevel.INFO,
             handlers=[
-                ConsoleHandler(LogLevel.INFO),
-                FileHandler(
-                    filepath=log_dir / "app.log",
-                    level=LogLevel.INFO,
-                    max_bytes=50 * 1024 * 1024,  # 50MB
-                    backup_count=5,
-                ),
-                FileHandler(
-                    filepath=log_dir / "error.log",
-                    level=LogLevel.ERROR,
-                    max_bytes=50 * 1024 * 1024,
-                    backup_count=5,
+                QueuedHandler(
+                    [
+                        ConsoleHandler(LogLevel.INFO),
+                        FileHandler(
+                            filepath=log_dir / "app.log",
+                            level=LogLevel.INFO,
+                            max_bytes=50 * 1024 * 1024,  # 50MB
+                            backup_count=5,
+                        ),
+                        FileHandler(
+                            filepath=log_dir / "error.log",
+                            level=LogLevel.ERROR,
+                            max_bytes=50 * 1024 * 1024,
+                            backup_count=5,
+                        ),
+                    ]
                 ),
             ],
             filters=[SensitiveDataFilter()],
@@ -104,16 +112,31 @@ class LoggerConfig:
             name=name,
             level=LogLevel.INFO,
             handlers=[
-                ConsoleHandler(LogLevel.WARNING),
-                DailyRotatingFileHandler(
-                    filepath=log_dir / "app.log", level=LogLevel.INFO, backup_count=30
-                ),
-                DailyRotatingFileHandler(
-                    filepath=log_dir / "error.log",
-                    level=LogLevel.ERROR,
-                    backup_count=90,
+                QueuedHandler(
+                    [
+                        ConsoleHandler(LogLevel.WARNING),
+                        DailyRotatingFileHandler(
+                            filepath=log_dir / "app.log",
+                            level=LogLevel.INFO,
+                            backup_count=30,
+                        ),
+                        DailyRotatingFileHandler(
+                            filepath=log_dir / "error.log",
+                            level=LogLevel.ERROR,
+                            backup_count=90,
+                        ),
+                    ]
                 ),
             ],
             filters=[SensitiveDataFilter()],
             environment=Environment.PRODUCTION,
         )
+
+
+# Configuration builder for each environment; anything else gets production
+_CONFIG_BUILDERS = {
+    Environment.DEVELOPMENT: "_development_config",
+    Environment.TESTING: "_testing_config",
+    Environment.STAGING: "_staging_config",
+    Environment.PRODUCTION: "_production_config",
+}
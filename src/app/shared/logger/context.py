@@ -8,8 +8,10 @@ from contextvars import ContextVar
 from typing import Any, Dict, Optional
 
 
-# Context storage for request-scoped data
-_log_context: ContextVar[Dict[str, Any]] = ContextVar("log_context", default={})
+# Context storage for request-scoped data; values are shared between
+# nested contexts and must be treated as read-only
+_EMPTY: Dict[str, Any] = {}
+_log_context: ContextVar[Dict[str, Any]] = ContextVar("log_context", default=_EMPTY)
 
 
 class LogContext:
@@ -22,25 +24,33 @@ class LogContext:
             # Log will include request_id and user_id
     """
 
+    # One instance per request; slots keep it to two fields and no __dict__
+    __slots__ = ("context", "token")
+
     def __init__(self, **context):
         self.context = context
         self.token: Optional[Any] = None
 
     def __enter__(self):
         """Add context to ContextVar."""
+        if not self.context:
+            return self
+
         current = _log_context.get()
-        updated = {**current, **self.context}
+        # Outermost context: nothing to merge, so store our dict as-is
+        updated = {**current, **self.context} if current else self.context
         self.token = _log_context.set(updated)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Remove context from ContextVar."""
-        if self.token:
+        if self.token is not None:
             _log_context.reset(self.token)
+            self.token = None
 
 
 def get_log_context() -> Dict[str, Any]:
-    """Get current log context."""
+    """Get current log context. The dict is shared; do not modify it."""
     return _log_context.get()
 
 
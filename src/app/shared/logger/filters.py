@@ -5,8 +5,10 @@ Each filter has one specific responsibility.
 """
 
 import logging
-from typing import Any, Dict, Set
+import re
+from typing import Any, Dict, FrozenSet, Iterable
 
+from .formatters import _RESERVED_ATTRS
 from .interfaces import ILogFilter
 from .enums import LogLevel
 
@@ -15,64 +17,106 @@ class SensitiveDataFilter(ILogFilter):
     """Filter to remove sensitive information from logs."""
 
     # Common patterns for sensitive data
-    SENSITIVE_KEYS: Set[str] = {
-        "password",
-        "passwd",
-        "pwd",
-        "secret",
-        "token",
-        "api_key",
-        "apikey",
-        "authorization",
-        "auth",
-        "credential",
-        "private_key",
-        "access_token",
-        "refresh_token",
-        "session_id",
-        "cookie",
-        "csrf_token",
-        "ssn",
-        "credit_card",
-        "cvv",
-        "pin",
-    }
+    SENSITIVE_KEYS: FrozenSet[str] = frozenset(
+        {
+            "password",
+            "passwd",
+            "pwd",
+            "secret",
+            "token",
+            "api_key",
+            "apikey",
+            "authorization",
+            "auth",
+            "credential",
+            "private_key",
+            "access_token",
+            "refresh_token",
+            "session_id",
+            "cookie",
+            "csrf_token",
+            "ssn",
+            "credit_card",
+            "cvv",
+            "pin",
+        }
+    )
 
     MASK_VALUE = "***REDACTED***"
 
+    # Upper bound on remembered key verdicts; key names repeat, values don't
+    _KEY_CACHE_SIZE = 1024
+
+    def __init__(self, extra_keys: Iterable[str] = ()):
+        """
+        Initialize filter.
+
+        Args:
+            extra_keys: Additional key patterns to mask besides SENSITIVE_KEYS
+        """
+        keys = self.SENSITIVE_KEYS.union(key.lower() for key in extra_keys)
+        # One alternation scans a key for all patterns in a single C-level pass
+        self._pattern = re.compile("|".join(re.escape(key) for key in sorted(keys)))
+        self._key_cache: Dict[str, bool] = {}
+
     def filter(self, record: logging.LogRecord) -> bool:
         """Always return True - we sanitize but don't block."""
-        # Sanitize extra fields
-        for key in list(record.__dict__.keys()):
+        # Sanitize extra fields; standard record attributes are never sensitive
+        extra_keys = record.__dict__.keys() - _RESERVED_ATTRS
+        for key in extra_keys:
             if self._is_sensitive_key(key):
                 setattr(record, key, self.MASK_VALUE)
         return True
 
     def sanitize(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively remove sensitive data from dictionary."""
+        """
+        Recursively remove sensitive data from dictionary.
+
+        Copy-on-write: a dict (or nested dict/list) without anything to
+        mask is returned as-is, so treat the result as read-only.
+        """
         if not isinstance(data, dict):
             return data
 
-        sanitized = {}
+        sanitized = None
         for key, value in data.items():
             if self._is_sensitive_key(key):
-                sanitized[key] = self.MASK_VALUE
+                clean = self.MASK_VALUE
             elif isinstance(value, dict):
-                sanitized[key] = self.sanitize(value)
+                clean = self.sanitize(value)
             elif isinstance(value, (list, tuple)):
-                sanitized[key] = [
-                    self.sanitize(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
+                clean = self._sanitize_items(value)
             else:
-                sanitized[key] = value
+                continue
+
+            if clean is not value:
+                if sanitized is None:
+                    sanitized = dict(data)
+                sanitized[key] = clean
+
+        return data if sanitized is None else sanitized
+
+    def _sanitize_items(self, items):
+        """Sanitize the dicts in a list or tuple, copying only on change."""
+        sanitized = None
+        for index, item in enumerate(items):
+            if isinstance(item, dict):
+                clean = self.sanitize(item)
+                if clean is not item:
+                    if sanitized is None:
+                        sanitized = list(items)
+                    sanitized[index] = clean
 
-        return sanitized
+        return items if sanitized is None else sanitized
 
     def _is_sensitive_key(self, key: str) -> bool:
         """Check if key name indicates sensitive data."""
-        key_lower = key.lower()
-        return any(sensitive in key_lower for sensitive in self.SENSITIVE_KEYS)
+        sensitive = self._key_cache.get(key)
+        if sensitive is None:
+            sensitive = self._pattern.search(key.lower()) is not None
+            if len(self._key_cache) < self._KEY_CACHE_SIZE:
+                self._key_cache[key] = sensitive
+        return sensitive
 
 
 class LevelFilter(ILogFilter):
@@ -6,12 +6,62 @@ New formatters can be added by implementing ILogFormatter without modifying exis
 
 import json
 import sys
+import time
 import traceback
 from datetime import datetime
 import logging
 
+import orjson
+
 from .interfaces import ILogFormatter
-from .context import get_log_context
+from .context import _log_context
+
+# Attributes every LogRecord has (plus the queued context snapshot); whatever
+# else is on a record came from the caller's extra fields
+_RESERVED_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "message",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "taskName",
+        "log_context",
+    }
+)
+
+
+def _exception_text(record: logging.LogRecord) -> str:
+    """
+    Formatted traceback of the record's exception.
+
+    Cached in ``record.exc_text`` like logging.Formatter does, so a record
+    sent to several handlers has its traceback formatted only once.
+    """
+    if record.exc_text is None:
+        lines = traceback.format_exception(*record.exc_info)
+        record.exc_text = "".join(lines).rstrip("\n")
+    return record.exc_text
+
+
+# Checked once; the terminal does not change while the process runs
+_STDERR_IS_TTY = sys.stderr.isatty()
 
 
 class JSONFormatter(ILogFormatter):
@@ -23,7 +73,8 @@ class JSONFormatter(ILogFormatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format record as JSON string."""
         log_data = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            # orjson writes naive datetimes in the same form as isoformat()
+            "timestamp": datetime.fromtimestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -32,43 +83,19 @@ class JSONFormatter(ILogFormatter):
             "line": record.lineno,
         }
 
-        # Add context data
-        context = get_log_context()
+        # Add context data (captured on the record when logged via a queue)
+        context = getattr(record, "log_context", None)
+        if context is None:
+            context = _log_context.get()
         if context:
             log_data["context"] = context
 
         # Add extra fields
         if self.include_extra:
-            # List of reserved LogRecord attributes
-            reserved_attrs = {
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "message",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "taskName",
-            }
-
             extra_fields = {
                 key: value
                 for key, value in record.__dict__.items()
-                if key not in reserved_attrs
+                if key not in _RESERVED_ATTRS
             }
             if extra_fields:
                 log_data["extra"] = extra_fields
@@ -78,10 +105,17 @@ class JSONFormatter(ILogFormatter):
             log_data["exception"] = {
                 "type": record.exc_info[0].__name__,
                 "message": str(record.exc_info[1]),
-                "traceback": traceback.format_exception(*record.exc_info),
+                "traceback": _exception_text(record),
             }
 
-        return json.dumps(log_data, default=str)
+        try:
+            return orjson.dumps(
+                log_data, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects integers beyond 64 bits without calling default
+            log_data["timestamp"] = log_data["timestamp"].isoformat()
+            return json.dumps(log_data, default=str)
 
 
 class ConsoleFormatter(ILogFormatter):
@@ -97,28 +131,48 @@ class ConsoleFormatter(ILogFormatter):
     }
 
     def __init__(self, use_colors: bool = True):
-        self.use_colors = use_colors and sys.stderr.isatty()
+        self.use_colors = use_colors and _STDERR_IS_TTY
+        # Rendered level column per level name, colored if enabled
+        self._levels = {
+            name: self._render_level(name)
+            for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+        }
+        # Last formatted second: (epoch second, local date and time)
+        self._second = (None, "")
 
     def format(self, record: logging.LogRecord) -> str:
         """Format record for console output."""
-        timestamp = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
-        level = record.levelname
-
-        if self.use_colors:
-            color = self.COLORS.get(level, "")
-            reset = self.COLORS["RESET"]
-            level = f"{color}{level}{reset}"
-
-        base_msg = f"[{timestamp}] {level:<8} {record.name}: {record.getMessage()}"
-
-        # Add context if present
-        context = get_log_context()
+        # Second resolution: format the timestamp once per second, not per record
+        second = int(record.created)
+        cached = self._second
+        if cached[0] != second:
+            cached = self._second = (
+                second,
+                time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)),
+            )
+        timestamp = cached[1]
+        level = self._levels.get(record.levelname)
+        if level is None:
+            level = self._render_level(record.levelname)
+
+        base_msg = f"[{timestamp}] {level} {record.name}: {record.getMessage()}"
+
+        # Add context if present (captured on the record when logged via a queue)
+        context = getattr(record, "log_context", None)
+        if context is None:
+            context = _log_context.get()
         if context:
-            context_str = " ".join(f"{k}={v}" for k, v in context.items())
+            context_str = " ".join([f"{k}={v}" for k, v in context.items()])
             base_msg += f" | {context_str}"
 
         # Add exception if present
         if record.exc_info:
-            base_msg += f"\n{''.join(traceback.format_exception(*record.exc_info))}"
+            base_msg += f"\n{_exception_text(record)}"
 
         return base_msg
+
+    def _render_level(self, level: str) -> str:
+        """Level name padded to the column width, colored if enabled."""
+        if self.use_colors:
+            level = f"{self.COLORS.get(level, '')}{level}{self.COLORS['RESET']}"
+        return f"{level:<8}"
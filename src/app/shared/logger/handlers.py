@@ -4,11 +4,23 @@ Log handlers following Liskov Substitution Principle.
 All handlers are interchangeable through the ILogHandler interface.
 """
 
+import atexit
+import copy
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from logging.handlers import (
+    BaseRotatingHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
 from pathlib import Path
+from typing import List, Optional
+from weakref import WeakKeyDictionary
 
+from .context import _log_context
 from .interfaces import ILogFormatter, ILogHandler
 from .enums import LogLevel
 
@@ -24,6 +36,18 @@ class _FormatterWrapper(logging.Formatter):
         return self.custom_formatter.format(record)
 
 
+# One wrapper per formatter, shared by every handler set up with it
+_WRAPPERS: "WeakKeyDictionary[ILogFormatter, _FormatterWrapper]" = WeakKeyDictionary()
+
+
+def _wrap(formatter: ILogFormatter) -> _FormatterWrapper:
+    """Return the shared logging.Formatter wrapper for a formatter."""
+    wrapper = _WRAPPERS.get(formatter)
+    if wrapper is None:
+        wrapper = _WRAPPERS[formatter] = _FormatterWrapper(formatter)
+    return wrapper
+
+
 class ConsoleHandler(ILogHandler):
     """Handler for console output."""
 
@@ -34,7 +58,7 @@ class ConsoleHandler(ILogHandler):
         """Setup console handler."""
         handler = logging.StreamHandler(sys.stdout)
         handler.setLevel(getattr(logging, self.level.value))
-        handler.setFormatter(_FormatterWrapper(formatter))
+        handler.setFormatter(_wrap(formatter))
         logger.addHandler(handler)
 
 
@@ -64,7 +88,7 @@ class FileHandler(ILogHandler):
             encoding="utf-8",
         )
         handler.setLevel(getattr(logging, self.level.value))
-        handler.setFormatter(_FormatterWrapper(formatter))
+        handler.setFormatter(_wrap(formatter))
         logger.addHandler(handler)
 
 
@@ -90,5 +114,144 @@ class DailyRotatingFileHandler(ILogHandler):
             encoding="utf-8",
         )
         handler.setLevel(getattr(logging, self.level.value))
-        handler.setFormatter(_FormatterWrapper(formatter))
+        handler.setFormatter(_wrap(formatter))
         logger.addHandler(handler)
+
+
+# Process-wide queue and the single listener thread that drains it
+_queue: Optional[queue.SimpleQueue] = None
+_listener: Optional[QueueListener] = None
+
+
+class _DispatchingQueueListener(QueueListener):
+    """
+    Listener that hands each record to the handlers it was queued for.
+
+    Records already waiting in the queue are taken as one batch, so a
+    stream handler is flushed once per batch rather than once per record.
+    It never waits for a batch to fill: an idle queue is written out at once.
+    """
+
+    # Upper bound on records handled between two flushes
+    MAX_BATCH = 256
+
+    def handle(self, item) -> None:
+        self._handle_batch([item])
+
+    def _monitor(self) -> None:
+        q = self.queue
+        while True:
+            batch = [q.get()]
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            for index, item in enumerate(batch):
+                if item is self._sentinel:
+                    # Records queued after stop() are dropped, as in QueueListener
+                    batch = batch[:index]
+                    stop = True
+                    break
+            self._handle_batch(batch)
+            if stop:
+                break
+
+    def _handle_batch(self, batch) -> None:
+        """Group the batch by handler, keeping record order per handler."""
+        by_handler: dict = {}
+        for targets, record in batch:
+            for handler in targets:
+                if record.levelno >= handler.level:
+                    by_handler.setdefault(handler, []).append(record)
+        for handler, records in by_handler.items():
+            _emit_batch(handler, records)
+
+
+def _emit_batch(handler: logging.Handler, records: List[logging.LogRecord]) -> None:
+    """
+    Write records to a handler, flushing stream handlers once at the end.
+
+    Mirrors StreamHandler.emit (and the rollover check of rotating file
+    handlers) without its per-record flush; other handlers get the usual
+    per-record handle().
+    """
+    if not isinstance(handler, logging.StreamHandler) or handler.stream is None:
+        for record in records:
+            handler.handle(record)
+        return
+
+    rotating = isinstance(handler, BaseRotatingHandler)
+    with handler.lock:
+        for record in records:
+            if not handler.filter(record):
+                continue
+            try:
+                if rotating and handler.shouldRollover(record):
+                    handler.doRollover()
+                handler.stream.write(handler.format(record) + handler.terminator)
+            except RecursionError:
+                raise
+            except Exception:
+                handler.handleError(record)
+        handler.flush()
+
+
+class _ContextQueueHandler(QueueHandler):
+    """Queue handler that captures what formatting needs from the caller."""
+
+    def __init__(self, log_queue: queue.SimpleQueue, targets: List[logging.Handler]):
+        super().__init__(log_queue)
+        self.targets = tuple(targets)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unlike QueueHandler.prepare, keep exc_info for our formatters, but
+        # merge args now and snapshot the context var, which is per-task and
+        # unset on the listener thread
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.log_context = _log_context.get()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.put_nowait((self.targets, record))
+
+
+def _get_queue() -> queue.SimpleQueue:
+    """Return the log queue, starting the listener thread on first use."""
+    global _queue, _listener
+    if _queue is None:
+        _queue = queue.SimpleQueue()
+        _listener = _DispatchingQueueListener(_queue)
+        _listener.start()
+        # Drain queued records before logging.shutdown closes the handlers
+        atexit.register(_listener.stop)
+    return _queue
+
+
+class QueuedHandler(ILogHandler):
+    """
+    Run other handlers on a background thread.
+
+    Log calls only put the record on an in-memory queue; one process-wide
+    listener thread formats it and performs the blocking writes, so file
+    and stream I/O stay off the event loop.
+
+    Example:
+        >>> QueuedHandler([FileHandler(Path("/var/log/app.log"))])
+    """
+
+    def __init__(self, handlers: List[ILogHandler]):
+        self.handlers = handlers
+
+    def setup(self, logger: logging.Logger, formatter: ILogFormatter) -> None:
+        """Setup wrapped handlers behind a queue handler."""
+        # Let the wrapped handlers attach to a detached logger, then move
+        # the resulting logging.Handler objects behind the queue
+        collector = logging.Logger(logger.name)
+        for handler in self.handlers:
+            handler.setup(collector, formatter)
+        logger.addHandler(_ContextQueueHandler(_get_queue(), collector.handlers))
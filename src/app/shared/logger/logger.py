@@ -8,15 +8,19 @@ not concrete implementations.
 import logging
 import time
 from contextlib import contextmanager
+from typing import Any, Dict, Optional
 
 from app.shared.config.enums import Environment
 
 from .config import LoggerConfig
 from .enums import LogLevel
 from .filters import SensitiveDataFilter
-from .formatters import ConsoleFormatter, JSONFormatter
+from .formatters import _RESERVED_ATTRS, ConsoleFormatter, JSONFormatter
 from .interfaces import ILogFilter
 
+# Numeric stdlib level for each LogLevel
+_LEVEL_NUMBERS = {level: getattr(logging, level.value) for level in LogLevel}
+
 
 class AppLogger:
     """
@@ -72,7 +76,7 @@ class AppLogger:
         """Log warning message."""
         self._log(LogLevel.WARNING, message, **kwargs)
 
-    def error(self, message: str, exc_info: bool = False, **kwargs):
+    def error(self, message: str, exc_info: bool | BaseException = False, **kwargs):
         """Log error message."""
         self._log(LogLevel.ERROR, message, exc_info=exc_info, **kwargs)
 
@@ -84,47 +88,54 @@ class AppLogger:
         """Log exception with traceback."""
         self._log(LogLevel.ERROR, message, exc_info=True, **kwargs)
 
-    def _log(self, level: LogLevel, message: str, exc_info: bool = False, **kwargs):
-        """Internal logging method."""
-        # Reserved LogRecord attributes that cannot be overridden
-        reserved_attrs = {
-            "name",
-            "msg",
-            "args",
-            "created",
-            "filename",
-            "funcName",
-            "levelname",
-            "levelno",
-            "lineno",
-            "module",
-            "msecs",
-            "message",
-            "pathname",
-            "process",
-            "processName",
-            "relativeCreated",
-            "thread",
-            "threadName",
-            "exc_info",
-            "exc_text",
-            "stack_info",
-            "taskName",
-        }
-
-        # Sanitize kwargs
-        sanitized_kwargs = self._sensitive_filter.sanitize(kwargs)
-
-        # Remove any reserved attributes from kwargs to avoid conflicts
-        safe_kwargs = {
-            k: v for k, v in sanitized_kwargs.items() if k not in reserved_attrs
-        }
-
-        # Get log method
-        log_method = getattr(self._logger, level.value.lower())
+    def isEnabledFor(self, level: int) -> bool:
+        """
+        Check whether a message at this level would be emitted.
+
+        Mirrors logging.Logger.isEnabledFor so callers can skip building
+        expensive messages or extra fields for disabled levels.
+        """
+        return self._logger.isEnabledFor(level)
+
+    def _log(
+        self,
+        level: LogLevel,
+        message: str,
+        exc_info: bool | BaseException = False,
+        extra: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ):
+        """
+        Internal logging method.
+
+        Fields may be passed as keyword arguments, as a stdlib-style
+        ``extra`` dict, or both; keyword arguments win on conflicts.
+        """
+        levelno = _LEVEL_NUMBERS[level]
+        # Drop below-threshold calls before paying for sanitizing or formatting
+        if not self._logger.isEnabledFor(levelno):
+            return
+
+        if extra:
+            # Used as-is: sanitize() copies before masking and the logging
+            # module only reads extra fields
+            fields = {**extra, **kwargs} if kwargs else extra
+        else:
+            fields = kwargs
+
+        # Sanitize fields
+        sanitized_kwargs = self._sensitive_filter.sanitize(fields)
+
+        # Remove any reserved attributes from kwargs to avoid conflicts;
+        # they are rare, so only copy the fields when one is present
+        safe_kwargs = sanitized_kwargs
+        if not _RESERVED_ATTRS.isdisjoint(sanitized_kwargs):
+            safe_kwargs = {
+                k: v for k, v in sanitized_kwargs.items() if k not in _RESERVED_ATTRS
+            }
 
         # Log with extra fields
-        log_method(message, exc_info=exc_info, extra=safe_kwargs)
+        self._logger.log(levelno, message, exc_info=exc_info, extra=safe_kwargs)
 
     @contextmanager
     def measure_time(self, operation: str, **context):
@@ -20,6 +20,18 @@ try:
 except ImportError:
     _logger = None
 
+# Map error category to HTTP status code
+_STATUS_CODE_MAP = {
+    "not_found": 404,
+    "validation": 422,
+    "authentication": 401,
+    "authorization": 403,
+    "business_rule": 400,
+    "database": 500,
+    "external_service": 502,
+    "internal": 500,
+}
+
 
 class ErrorResponse(BaseResponse):
     """
@@ -69,7 +81,8 @@ class ErrorResponse(BaseResponse):
         Create ErrorResponse from AppException.
 
         Automatically maps exception attributes to response fields,
-        including HTTP status code mapping from error category.
+        including HTTP status code mapping from error category. The
+        exception is logged here if it was not logged yet.
 
         Args:
             exception: AppException instance to convert
@@ -84,19 +97,8 @@ class ErrorResponse(BaseResponse):
             ... except AppException as e:
             ...     response = ErrorResponse.from_exception(e)
         """
-        # Map error category to HTTP status code
-        status_code_map = {
-            "not_found": 404,
-            "validation": 422,
-            "authentication": 401,
-            "authorization": 403,
-            "business_rule": 400,
-            "database": 500,
-            "external_service": 502,
-            "internal": 500,
-        }
-
-        status_code = status_code_map.get(exception.category.value, 500)
+        status_code = _STATUS_CODE_MAP.get(exception.category.value, 500)
+        exception.ensure_logged()
 
         # Optional debug logging for response creation
         if _logger:
@@ -6,7 +6,6 @@ Reduces boilerplate and ensures consistent response structure.
 """
 
 from typing import TYPE_CHECKING, TypeVar, Optional, Dict, Any, List
-from math import ceil
 
 from .success import SuccessResponse, DataResponse, MessageResponse
 from .error import ErrorResponse, ValidationErrorResponse
@@ -269,12 +268,10 @@ def paginated(
         ...     total=100
         ... )
     """
-    pages = ceil(total / size) if size > 0 else 0
-
     return PaginatedResponse[T](
         success=True,
         items=items,
-        page_info=PageInfo(page=page, size=size, total=total, pages=pages),
+        page_info=PageInfo(page=page, size=size, total=total),
         message=message,
         request_id=request_id,
         metadata=metadata,
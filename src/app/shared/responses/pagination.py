@@ -6,7 +6,7 @@ Optimized for webshop and list views.
 """
 
 from typing import Generic, TypeVar, List
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, computed_field
 from .base import BaseResponse
 
 # Generic type variable for paginated items
@@ -24,7 +24,7 @@ class PageInfo(BaseModel):
         page: Current page number (1-indexed)
         size: Number of items per page
         total: Total number of items across all pages
-        pages: Total number of pages available
+        pages: Total number of pages available (computed)
     """
 
     page: int = Field(..., description="Current page number (1-indexed)", ge=1)
@@ -33,17 +33,18 @@ class PageInfo(BaseModel):
 
     total: int = Field(..., description="Total number of items across all pages", ge=0)
 
-    pages: int = Field(..., description="Total number of pages available", ge=0)
-
-    @field_validator("page")
-    @classmethod
-    def validate_page(cls, v: int, info) -> int:
-        """Validate page is within bounds if pages is set."""
-        # Note: pages might not be set yet during initialization
-        return v
+    @computed_field(description="Total number of pages available")
+    @property
+    def pages(self) -> int:
+        """Total number of pages, derived from total and size."""
+        # Integer ceiling division; no float round trip for large totals
+        return -(-self.total // self.size) if self.size else 0
 
     model_config = ConfigDict(
-        json_schema_extra={"example": {"page": 1, "size": 20, "total": 100, "pages": 5}}
+        frozen=True,
+        json_schema_extra={
+            "example": {"page": 1, "size": 20, "total": 100, "pages": 5}
+        },
     )
 
 
@@ -57,7 +58,7 @@ class PaginatedResponse(BaseResponse, Generic[T]):
     Examples:
         >>> PaginatedResponse[Product](
         ...     items=[product1, product2],
-        ...     page_info=PageInfo(page=1, size=20, total=100, pages=5),
+        ...     page_info=PageInfo(page=1, size=20, total=100),
         ...     message="Products retrieved successfully"
         ... )
     """
@@ -70,13 +71,6 @@ class PaginatedResponse(BaseResponse, Generic[T]):
 
     page_info: PageInfo = Field(..., description="Pagination metadata")
 
-    @field_validator("items")
-    @classmethod
-    def validate_items_length(cls, v: List[T], info) -> List[T]:
-        """Validate items length matches page_info if available."""
-        # Note: page_info might not be set yet during initialization
-        return v
-
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
@@ -120,6 +114,7 @@ class CursorInfo(BaseModel):
     count: int = Field(..., description="Number of items in current result", ge=0)
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "cursor": "eyJpZCI6MTIzfQ==",
@@ -127,7 +122,7 @@ class CursorInfo(BaseModel):
                 "has_previous": False,
                 "count": 20,
             }
-        }
+        },
     )
 
 
@@ -0,0 +1,72 @@
+"""
+Shared test fixtures.
+"""
+
+import pytest
+
+from app.shared.config import Settings
+
+
+@pytest.fixture(scope="session")
+def default_settings() -> Settings:
+    """Settings built from the unmodified environment, shared by all tests.
+
+    Settings are frozen, so tests can share one instance; tests that
+    change environment variables construct their own.
+    """
+    return Settings()
+
+
+@pytest.fixture
+def set_env(monkeypatch):
+    """Set several environment variables for one test.
+
+    Usage:
+        set_env(ENVIRONMENT="staging", PORT=9000)
+    """
+
+    def _set(**variables):
+        for name, value in variables.items():
+            monkeypatch.setenv(name, str(value))
+
+    return _set
+
+
+class _RecordingLogger:
+    """Logger stub recording (message, kwargs) for each call."""
+
+    __slots__ = ("errors", "warnings")
+
+    def __init__(self):
+        self.errors = []
+        self.warnings = []
+
+    def error(self, message, **kwargs):
+        self.errors.append((message, kwargs))
+
+    def warning(self, message, **kwargs):
+        self.warnings.append((message, kwargs))
+
+
+@pytest.fixture
+def exception_logger(monkeypatch):
+    """Record what exceptions log instead of writing it."""
+    from app.shared.exceptions import base
+
+    logger = _RecordingLogger()
+    monkeypatch.setattr(base, "_logger", logger)
+    return logger
+
+
+@pytest.fixture
+def fresh_settings():
+    """Return get_settings with an empty cache, cleared again afterwards.
+
+    Keeps settings built from a test's patched environment from leaking
+    into later tests.
+    """
+    from app.shared.config.factory import clear_settings_cache, get_settings
+
+    clear_settings_cache()
+    yield get_settings
+    clear_settings_cache()
@@ -0,0 +1,99 @@
+"""
+Test suite for authorize module.
+
+Tests local verification of Keycloak access tokens against a cached JWKS.
+"""
+
+import time
+
+import pytest
+from authlib.jose import JsonWebKey, jwt
+from fastapi import HTTPException
+
+from app.authorize import keycloak
+
+
+@pytest.fixture
+def realm_key(monkeypatch):
+    """Install a freshly generated RSA key as the cached realm JWKS."""
+    key = JsonWebKey.generate_key("RSA", 2048, is_private=True, options={"kid": "k1"})
+    jwks = JsonWebKey.import_key_set({"keys": [key.as_dict(is_private=False)]})
+    monkeypatch.setattr(keycloak, "_jwks", jwks)
+    monkeypatch.setattr(keycloak, "_jwks_fetched_at", time.monotonic())
+    return key
+
+
+def _claims(**extra):
+    return {"iss": keycloak.ISSUER, "exp": int(time.time()) + 300, **extra}
+
+
+class TestValidateKeycloakToken:
+    """Test validate_keycloak_token with locally verified JWTs"""
+
+    @pytest.mark.asyncio
+    async def test_valid_rs256_token(self, realm_key):
+        """Test an RS256 token with the required role is accepted"""
+        token = jwt.encode(
+            {"alg": "RS256", "kid": "k1"},
+            _claims(realm_access={"roles": ["IT-Admin"]}),
+            realm_key,
+        ).decode()
+
+        token_info = await keycloak.validate_keycloak_token(token)
+
+        assert token_info["realm_access"]["roles"] == ["IT-Admin"]
+
+    @pytest.mark.asyncio
+    async def test_missing_role_is_forbidden(self, realm_key):
+        """Test a valid token without the required role is rejected with 403"""
+        token = jwt.encode({"alg": "RS256", "kid": "k1"}, _claims(), realm_key).decode()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await keycloak.validate_keycloak_token(token)
+
+        assert exc_info.value.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_wrong_algorithm_is_unauthorized(self, realm_key):
+        """Test an HS256 token naming a realm key id is rejected with 401"""
+        token = jwt.encode(
+            {"alg": "HS256", "kid": "k1"},
+            _claims(realm_access={"roles": ["IT-Admin"]}),
+            b"secret",
+        ).decode()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await keycloak.validate_keycloak_token(token)
+
+        assert exc_info.value.status_code == 401
+
+
+class TestGetJwks:
+    """Test fetching and caching of the realm key set"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_calls_fetch_once(self, monkeypatch):
+        """Test concurrent requests on an empty cache share one JWKS fetch"""
+        import asyncio
+        from unittest.mock import Mock
+
+        import orjson
+
+        key = JsonWebKey.generate_key("RSA", 2048, options={"kid": "k1"})
+        body = orjson.dumps({"keys": [key.as_dict(is_private=False)]})
+        fetches = []
+
+        async def get(url):
+            fetches.append(url)
+            # Let the other callers reach the cache check meanwhile
+            await asyncio.sleep(0)
+            return Mock(content=body)
+
+        monkeypatch.setattr(keycloak, "_client", Mock(get=get))
+        monkeypatch.setattr(keycloak, "_jwks", None)
+        monkeypatch.setattr(keycloak, "_jwks_fetched_at", 0.0)
+
+        key_sets = await asyncio.gather(*(keycloak._get_jwks() for _ in range(5)))
+
+        assert fetches == [keycloak.JWKS_URL]
+        assert all(key_set is key_sets[0] for key_set in key_sets)
@@ -6,36 +6,44 @@ Tests for environment-based configuration with secrets support.
 
 import pytest
 
-from app.shared.config import Environment, Settings, get_settings
+from app.shared.config import Environment, Settings
 from app.shared.config.factory import clear_settings_cache
+from app.shared.config import loader
 from app.shared.config.loader import load_secret, secrets_available
 
 
+@pytest.fixture(scope="module")
+def env_file_dir(tmp_path_factory):
+    """Directory holding a .env file, written once for the module."""
+    directory = tmp_path_factory.mktemp("config")
+    (directory / ".env").write_text("APP_NAME=Test App\nPORT=7000\nDEBUG=true\n")
+    return directory
+
+
 class TestEnvironmentEnum:
     """Test Environment enum."""
 
     def test_environment_values(self):
         """Test environment enum values."""
-        assert Environment.DEVELOPMENT.value == "development"
-        assert Environment.TESTING.value == "testing"
-        assert Environment.STAGING.value == "staging"
-        assert Environment.PRODUCTION.value == "production"
-
-    def test_is_production(self):
-        """Test is_production method."""
-        assert Environment.PRODUCTION.is_production()
-        assert not Environment.DEVELOPMENT.is_production()
-        assert not Environment.TESTING.is_production()
-
-    def test_is_testing(self):
-        """Test is_testing method."""
-        assert Environment.TESTING.is_testing()
-        assert not Environment.PRODUCTION.is_testing()
-
-    def test_is_development(self):
-        """Test is_development method."""
-        assert Environment.DEVELOPMENT.is_development()
-        assert not Environment.PRODUCTION.is_development()
+        assert tuple(env.value for env in Environment) == (
+            "development",
+            "testing",
+            "staging",
+            "production",
+        )
+
+    @pytest.mark.parametrize(
+        "predicate,member",
+        [
+            ("is_production", Environment.PRODUCTION),
+            ("is_testing", Environment.TESTING),
+            ("is_development", Environment.DEVELOPMENT),
+        ],
+    )
+    def test_environment_predicates(self, predicate, member):
+        """Test each predicate is true for exactly its own member."""
+        for env in Environment:
+            assert getattr(env, predicate)() is (env is member)
 
 
 class TestSecretLoader:
@@ -58,6 +66,21 @@ class TestSecretLoader:
         result = load_secret("definitely_does_not_exist")
         assert result is None
 
+    def test_load_secret_from_file_is_cached(self, tmp_path, monkeypatch):
+        """Test secret files are read once and then served from cache."""
+        monkeypatch.setattr(loader, "_DOCKER_SECRETS_DIR", tmp_path)
+        monkeypatch.setattr(loader, "_HAS_DOCKER_SECRETS", True)
+        loader._read_secret_file.cache_clear()
+
+        secret_file = tmp_path / "file_secret"
+        secret_file.write_text("from-file\n")
+        assert load_secret("file_secret") == "from-file"
+
+        secret_file.write_text("changed\n")
+        assert load_secret("file_secret") == "from-file"
+
+        loader._read_secret_file.cache_clear()
+
     def test_secrets_available(self):
         """Test checking if secrets directories exist."""
         # In test environment, secrets usually not available
@@ -68,24 +91,20 @@ class TestSecretLoader:
 class TestSettings:
     """Test Settings class."""
 
-    def test_default_settings(self):
+    def test_default_settings(self, default_settings):
         """Test default settings values."""
-        settings = Settings()
-
-        assert settings.app_name == "OpenTaberna API"
-        assert settings.app_version == "0.1.0"
-        assert settings.environment in [
+        assert default_settings.app_name == "OpenTaberna API"
+        assert default_settings.app_version == "0.1.0"
+        assert default_settings.environment in [
             Environment.DEVELOPMENT,
             Environment.TESTING,
         ]
-        assert settings.host == "0.0.0.0"
-        assert settings.port == 8000
+        assert default_settings.host == "0.0.0.0"
+        assert default_settings.port == 8000
 
-    def test_custom_settings_from_env(self, monkeypatch):
+    def test_custom_settings_from_env(self, set_env):
         """Test loading custom settings from environment."""
-        monkeypatch.setenv("APP_NAME", "Custom API")
-        monkeypatch.setenv("PORT", "9000")
-        monkeypatch.setenv("DEBUG", "true")
+        set_env(APP_NAME="Custom API", PORT="9000", DEBUG="true")
 
         settings = Settings()
 
@@ -103,56 +122,47 @@ class TestSettings:
         assert settings.environment == Environment.PRODUCTION
         assert settings.is_production
 
-    def test_database_settings(self):
+    def test_database_settings(self, default_settings):
         """Test database configuration."""
-        settings = Settings()
-
-        assert "postgresql" in settings.database_url.lower()
-        assert settings.database_pool_size == 20
-        assert settings.database_max_overflow == 40
-        assert settings.database_pool_timeout == 30
+        assert "postgresql" in default_settings.database_url.lower()
+        assert default_settings.database_pool_size == 20
+        assert default_settings.database_max_overflow == 40
+        assert default_settings.database_pool_timeout == 30
 
-    def test_redis_settings(self):
+    def test_redis_settings(self, default_settings):
         """Test Redis configuration."""
-        settings = Settings()
-
-        assert "redis" in settings.redis_url.lower()
-        assert settings.redis_password is None  # No secret in tests
+        assert "redis" in default_settings.redis_url.lower()
+        assert default_settings.redis_password is None  # No secret in tests
 
-    def test_keycloak_settings(self):
+    def test_keycloak_settings(self, default_settings):
         """Test Keycloak configuration."""
-        settings = Settings()
+        assert "localhost" in default_settings.keycloak_url
+        assert default_settings.keycloak_realm == "opentaberna"
+        assert default_settings.keycloak_client_id == "opentaberna-api"
 
-        assert "localhost" in settings.keycloak_url
-        assert settings.keycloak_realm == "opentaberna"
-        assert settings.keycloak_client_id == "opentaberna-api"
-
-    def test_cors_settings(self):
+    def test_cors_settings(self, default_settings):
         """Test CORS configuration."""
-        settings = Settings()
-
-        assert isinstance(settings.cors_origins, list)
-        assert settings.cors_credentials is True
+        assert isinstance(default_settings.cors_origins, list)
+        assert default_settings.cors_credentials is True
 
-    def test_logging_settings(self):
+    def test_logging_settings(self, default_settings):
         """Test logging configuration."""
-        settings = Settings()
-
-        assert settings.log_level == "INFO"
-        assert settings.log_format in ["console", "json"]
+        assert default_settings.log_level == "INFO"
+        assert default_settings.log_format in ["console", "json"]
 
-    def test_cache_settings(self):
+    def test_cache_settings(self, default_settings):
         """Test cache configuration."""
-        settings = Settings()
+        assert isinstance(default_settings.cache_enabled, bool)
+        assert default_settings.cache_ttl > 0
 
-        assert isinstance(settings.cache_enabled, bool)
-        assert settings.cache_ttl > 0
-
-    def test_feature_flags(self):
+    def test_feature_flags(self, default_settings):
         """Test feature flags."""
-        settings = Settings()
+        assert isinstance(default_settings.feature_webhooks_enabled, bool)
 
-        assert isinstance(settings.feature_webhooks_enabled, bool)
+    def test_settings_are_frozen(self, default_settings):
+        """Test settings cannot be modified after creation."""
+        with pytest.raises(ValueError):
+            default_settings.port = 1234
 
 
 class TestSettingsValidation:
@@ -173,12 +183,10 @@ class TestSettingsValidation:
         settings = Settings()
         assert settings.secret_key == "custom-secure-key-123"
 
-    def test_secret_key_default_ok_in_development(self):
+    def test_secret_key_default_ok_in_development(self, default_settings):
         """Test default SECRET_KEY allowed in development."""
-        settings = Settings()
-
         # Should not raise even with default secret key
-        assert settings.secret_key is not None
+        assert default_settings.secret_key is not None
 
 
 class TestSettingsProperties:
@@ -206,19 +214,22 @@ class TestSettingsProperties:
         settings = Settings()
         assert settings.is_development is True
 
-    def test_get_database_url_with_password(self):
+    def test_get_database_url_with_password(self, default_settings):
         """Test getting database URL with password visible."""
-        settings = Settings()
-
-        url = settings.get_database_url(hide_password=False)
+        url = default_settings.get_database_url(hide_password=False)
         assert "postgresql" in url.lower()
 
-    def test_get_database_url_hidden_password(self):
+    def test_get_database_url_hidden_password(self, default_settings):
         """Test getting database URL with hidden password."""
-        settings = Settings()
+        url = default_settings.get_database_url(hide_password=True)
+        assert "***" in url or "@" not in url  # Password hidden or no password
+
+    def test_get_database_url_masks_only_password(self):
+        """Test password masking keeps scheme, user, and host intact."""
+        settings = Settings(database_url="postgresql+asyncpg://app:s3cr:et@db:5432/app")
 
         url = settings.get_database_url(hide_password=True)
-        assert "***" in url or "@" not in url  # Password hidden or no password
+        assert url == "postgresql+asyncpg://app:***@db:5432/app"
 
 
 class TestSettingsPostInit:
@@ -248,43 +259,35 @@ class TestSettingsPostInit:
 class TestGetSettings:
     """Test get_settings factory function."""
 
-    def test_get_settings_singleton(self):
+    def test_get_settings_singleton(self, fresh_settings):
         """Test get_settings returns cached singleton."""
-        clear_settings_cache()
-
-        settings1 = get_settings()
-        settings2 = get_settings()
+        settings1 = fresh_settings()
+        settings2 = fresh_settings()
 
         assert settings1 is settings2  # Same instance
 
-    def test_clear_settings_cache(self, monkeypatch):
+    def test_clear_settings_cache(self, fresh_settings, monkeypatch):
         """Test clearing settings cache."""
-        clear_settings_cache()
-
         # Get settings with custom env
         monkeypatch.setenv("APP_NAME", "First Name")
-        settings1 = get_settings()
+        settings1 = fresh_settings()
         assert settings1.app_name == "First Name"
 
         # Clear cache and change env
         clear_settings_cache()
         monkeypatch.setenv("APP_NAME", "Second Name")
-        settings2 = get_settings()
+        settings2 = fresh_settings()
 
         assert settings2.app_name == "Second Name"
         assert settings1 is not settings2  # Different instances
 
-    def test_get_settings_with_env_file(self, tmp_path, monkeypatch):
+    def test_get_settings_with_env_file(
+        self, fresh_settings, env_file_dir, monkeypatch
+    ):
         """Test loading settings from .env file."""
-        # Create temporary .env file
-        env_file = tmp_path / ".env"
-        env_file.write_text("APP_NAME=Test App\nPORT=7000\nDEBUG=true\n")
-
-        # Change to temp directory
-        monkeypatch.chdir(tmp_path)
-        clear_settings_cache()
+        monkeypatch.chdir(env_file_dir)
 
-        settings = get_settings()
+        settings = fresh_settings()
 
         assert settings.app_name == "Test App"
         assert settings.port == 7000
@@ -293,36 +296,46 @@ class TestGetSettings:
 class TestEnvironmentVariablePriority:
     """Test priority of different configuration sources."""
 
-    def test_env_var_overrides_default(self, monkeypatch):
+    def test_env_var_overrides_default(self, fresh_settings, monkeypatch):
         """Test environment variable overrides default."""
         monkeypatch.setenv("PORT", "5000")
-        clear_settings_cache()
 
-        settings = get_settings()
+        settings = fresh_settings()
+        assert settings.port == 5000
+
+    def test_env_var_overrides_env_file(
+        self, fresh_settings, env_file_dir, monkeypatch
+    ):
+        """Test environment variable wins over the .env file."""
+        monkeypatch.chdir(env_file_dir)
+        monkeypatch.setenv("PORT", "5000")
+
+        settings = fresh_settings()
         assert settings.port == 5000
+        assert settings.app_name == "Test App"
 
-    def test_case_insensitive_env_vars(self, monkeypatch):
+    def test_case_insensitive_env_vars(self, fresh_settings, monkeypatch):
         """Test case-insensitive environment variables."""
         monkeypatch.setenv("app_name", "Lower Case App")
-        clear_settings_cache()
 
-        settings = get_settings()
+        settings = fresh_settings()
         assert settings.app_name == "Lower Case App"
 
 
 class TestSettingsIntegration:
     """Integration tests for full settings usage."""
 
-    def test_complete_configuration(self, monkeypatch):
+    def test_complete_configuration(self, fresh_settings, set_env):
         """Test loading complete configuration."""
-        monkeypatch.setenv("ENVIRONMENT", "staging")
-        monkeypatch.setenv("APP_NAME", "Staging API")
-        monkeypatch.setenv("DATABASE_URL", "postgresql://staging-db/db")
-        monkeypatch.setenv("REDIS_URL", "redis://staging-redis:6379/0")
-        monkeypatch.setenv("LOG_LEVEL", "WARNING")
-        clear_settings_cache()
+        set_env(
+            ENVIRONMENT="staging",
+            APP_NAME="Staging API",
+            DATABASE_URL="postgresql://staging-db/db",
+            REDIS_URL="redis://staging-redis:6379/0",
+            LOG_LEVEL="WARNING",
+        )
 
-        settings = get_settings()
+        settings = fresh_settings()
 
         assert settings.environment == Environment.STAGING
         assert settings.app_name == "Staging API"
@@ -330,15 +343,16 @@ class TestSettingsIntegration:
         assert "staging-redis" in settings.redis_url
         assert settings.log_level == "WARNING"
 
-    def test_production_configuration(self, monkeypatch):
+    def test_production_configuration(self, fresh_settings, set_env):
         """Test production-specific configuration."""
-        monkeypatch.setenv("ENVIRONMENT", "production")
-        monkeypatch.setenv("SECRET_KEY", "super-secure-production-key")
-        monkeypatch.setenv("DATABASE_POOL_SIZE", "50")
-        monkeypatch.setenv("CORS_ORIGINS", '["https://example.com"]')
-        clear_settings_cache()
-
-        settings = get_settings()
+        set_env(
+            ENVIRONMENT="production",
+            SECRET_KEY="super-secure-production-key",
+            DATABASE_POOL_SIZE="50",
+            CORS_ORIGINS='["https://example.com"]',
+        )
+
+        settings = fresh_settings()
 
         assert settings.is_production
         assert settings.debug is False
@@ -4,7 +4,11 @@ Database Module Tests
 Tests for database layer components.
 """
 
-from datetime import datetime, UTC
+import enum
+
+import pytest
+from sqlalchemy import Enum, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.shared.database import (
     Base,
@@ -19,6 +23,66 @@ from app.shared.database.utils import (
 )
 
 
+class SampleItem(Base):
+    """Minimal mapped model used to exercise Base helpers."""
+
+    __tablename__ = "test_sample_items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+
+
+class SampleDocument(Base, SoftDeleteMixin):
+    """Soft-deletable mapped model."""
+
+    __tablename__ = "test_sample_documents"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+class SampleAuthor(Base):
+    """Mapped model with a one-to-many relationship."""
+
+    __tablename__ = "test_sample_authors"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    books: Mapped[list["SampleBook"]] = relationship()
+
+
+class SampleBook(Base):
+    """Child side of SampleAuthor.books."""
+
+    __tablename__ = "test_sample_books"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    author_id: Mapped[int] = mapped_column(ForeignKey("test_sample_authors.id"))
+
+
+class SampleTag(Base):
+    """Single-column mapped model."""
+
+    __tablename__ = "test_sample_tags"
+
+    label: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+
+class SampleKind(enum.Enum):
+    """Values of SampleEvent.kind."""
+
+    CREATED = "created"
+    DELETED = "deleted"
+
+
+class SampleEvent(Base):
+    """Mapped model whose attributes differ from its columns."""
+
+    __tablename__ = "test_sample_events"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    kind: Mapped[SampleKind] = mapped_column("event_kind", Enum(SampleKind))
+    source: Mapped[str] = mapped_column(String(20), default="api")
+
+
 class TestDatabaseUtils:
     """Test database utilities."""
 
@@ -72,10 +136,46 @@ class TestBaseModel:
         """Test Base has to_dict method."""
         assert hasattr(Base, "to_dict")
 
+    def test_to_dict_values(self):
+        """Test to_dict maps every column to its value."""
+        assert SampleItem(id=1, name="Widget").to_dict() == {"id": 1, "name": "Widget"}
+
+    def test_to_dicts_batch(self):
+        """Test to_dicts converts a list of models in order."""
+        items = [SampleItem(id=1, name="A"), SampleItem(id=2, name="B")]
+
+        assert SampleItem.to_dicts(items) == [
+            {"id": 1, "name": "A"},
+            {"id": 2, "name": "B"},
+        ]
+
+    def test_column_spec_built_at_class_creation(self):
+        """Test mapped models get their column spec when defined."""
+        names, _ = SampleItem.__dict__["__to_dict_spec__"]
+        assert names == ("id", "name")
+
+    def test_to_dict_single_column(self):
+        """Test to_dict on a model with a single column."""
+        assert SampleTag(label="sale").to_dict() == {"label": "sale"}
+
+    def test_select_dicts_columns(self):
+        """Test select_dicts selects all columns or the requested ones."""
+        all_columns = SampleItem.select_dicts()
+        assert [c.name for c in all_columns.selected_columns] == ["id", "name"]
+
+        name_only = SampleItem.select_dicts("name")
+        assert [c.name for c in name_only.selected_columns] == ["name"]
+
     def test_repr_method_exists(self):
         """Test Base has __repr__ method."""
         assert hasattr(Base, "__repr__")
 
+    def test_repr_lists_columns(self):
+        """Test __repr__ shows class name and column values."""
+        assert (
+            repr(SampleItem(id=1, name="Widget")) == "SampleItem(id=1, name='Widget')"
+        )
+
 
 class TestTimestampMixin:
     """Test TimestampMixin functionality."""
@@ -115,24 +215,31 @@ class TestSoftDeleteMixin:
         assert hasattr(SoftDeleteMixin, "restore")
         assert callable(SoftDeleteMixin.restore)
 
-    def test_soft_delete_logic(self):
-        """Test soft delete sets deleted_at."""
+    def test_soft_delete_many_statement(self):
+        """Test bulk soft delete is one UPDATE using the database clock."""
+        sql = str(SampleDocument.soft_delete_many([1, 2]))
+
+        assert sql.startswith("UPDATE test_sample_documents SET deleted_at=now()")
+        assert "test_sample_documents.id IN" in sql
+        assert "test_sample_documents.deleted_at IS NULL" in sql
 
-        # Create a mock instance
-        class MockModel:
-            deleted_at = None
+    def test_partial_alive_index(self):
+        """Test soft-deletable tables get a partial index on live rows."""
+        indexes = {ix.name: ix for ix in SampleDocument.__table__.indexes}
+        index = indexes["ix_test_sample_documents_alive"]
 
-            @property
-            def is_deleted(self):
-                return self.deleted_at is not None
+        assert [c.name for c in index.columns] == ["id"]
+        assert "deleted_at IS NULL" in str(index.dialect_options["postgresql"]["where"])
 
-            def soft_delete(self):
-                self.deleted_at = datetime.now(UTC)
+    def test_select_alive_filters_deleted(self):
+        """Test select_alive excludes soft deleted rows."""
+        sql = str(SampleDocument.select_alive())
 
-            def restore(self):
-                self.deleted_at = None
+        assert "WHERE test_sample_documents.deleted_at IS NULL" in sql
 
-        instance = MockModel()
+    def test_soft_delete_logic(self):
+        """Test soft delete sets deleted_at."""
+        instance = SampleDocument()
         assert not instance.is_deleted
         assert instance.deleted_at is None
 
@@ -148,47 +255,164 @@ class TestSoftDeleteMixin:
 class TestEngineModule:
     """Test engine module imports and structure."""
 
-    def test_engine_module_imports(self):
-        """Test engine module can be imported."""
-        from app.shared.database.engine import (
-            create_engine,
-            create_test_engine,
-            init_database,
-            close_database,
-            get_engine,
+    def test_insert_page_size(self, monkeypatch):
+        """Test the multi-VALUES INSERT page size reaches the engine."""
+        from unittest.mock import Mock
+
+        from app.shared.database import engine as engine_module
+
+        factory = Mock()
+        monkeypatch.setattr(engine_module, "create_async_engine", factory)
+
+        engine_module.create_engine(
+            "postgresql+asyncpg://app@db/app", insert_page_size=500
         )
+        assert factory.call_args.kwargs["insertmanyvalues_page_size"] == 500
+
+    def test_statement_cache_connect_args(self, monkeypatch):
+        """Test prepared statement caches are sized, or off behind PgBouncer."""
+        from unittest.mock import Mock
+
+        from app.shared.database import engine as engine_module
+
+        factory = Mock()
+        monkeypatch.setattr(engine_module, "create_async_engine", factory)
+        url = "postgresql+asyncpg://app@db/app"
+
+        engine_module.create_engine(url, statement_cache_size=256)
+        connect_args = factory.call_args.kwargs["connect_args"]
+        assert connect_args["statement_cache_size"] == 256
+        assert connect_args["prepared_statement_cache_size"] == 256
+
+        engine_module.create_engine(url, use_pgbouncer=True)
+        connect_args = factory.call_args.kwargs["connect_args"]
+        assert connect_args["statement_cache_size"] == 0
+        assert connect_args["prepared_statement_cache_size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_close_disposes_once(self):
+        """Test concurrent close_database calls dispose the engine once."""
+        import asyncio
+        from unittest.mock import AsyncMock, Mock
+
+        from app.shared.database.engine import close_database, init_database
+
+        async def slow_dispose():
+            await asyncio.sleep(0)
+
+        engine = Mock()
+        engine.dispose = AsyncMock(side_effect=slow_dispose)
+        await init_database(engine)
 
-        assert callable(create_engine)
-        assert callable(create_test_engine)
-        assert callable(init_database)
-        assert callable(close_database)
-        assert callable(get_engine)
+        await asyncio.gather(close_database(), close_database())
+
+        engine.dispose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_warmup_pool_holds_connections_concurrently(self):
+        """Test warmup opens the requested connections side by side."""
+        from contextlib import asynccontextmanager
+        from unittest.mock import Mock
+
+        from app.shared.database.engine import use_engine, warmup_pool
+
+        open_now = peak = 0
+
+        @asynccontextmanager
+        async def connect():
+            nonlocal open_now, peak
+            open_now += 1
+            peak = max(peak, open_now)
+            yield Mock()
+            open_now -= 1
+
+        engine = Mock()
+        engine.connect = connect
+        engine.pool.size.return_value = 3
+
+        with use_engine(engine):
+            assert await warmup_pool() == 3
+
+        assert peak == 3
+        assert open_now == 0
+
+    @pytest.mark.asyncio
+    async def test_warmup_pool_skips_null_pool(self):
+        """Test warmup opens nothing on a pool that keeps no connections."""
+        from unittest.mock import Mock
+
+        from sqlalchemy.pool import NullPool
+
+        from app.shared.database.engine import use_engine, warmup_pool
+
+        engine = Mock()
+        engine.pool = NullPool(Mock())
+
+        with use_engine(engine):
+            assert await warmup_pool() == 0
+
+        engine.connect.assert_not_called()
+
+    def test_use_engine_overrides_context(self):
+        """Test use_engine binds an engine only inside the block."""
+        from unittest.mock import Mock
+
+        from app.shared.database.engine import get_engine, use_engine
+        from app.shared.database.utils import InternalError
+
+        engine = Mock()
+        with use_engine(engine):
+            assert get_engine() is engine
+
+        with pytest.raises(InternalError):
+            get_engine()
 
 
 class TestSessionModule:
     """Test session module imports and structure."""
 
-    def test_session_module_imports(self):
-        """Test session module can be imported."""
-        from app.shared.database.session import (
-            create_session_factory,
-            get_session,
-            get_session_dependency,
+    @pytest.mark.asyncio
+    async def test_get_session_commits_only_open_transaction(self, monkeypatch):
+        """Test get_session skips COMMIT when no transaction is open."""
+        from unittest.mock import AsyncMock, Mock
+
+        from app.shared.database import session as session_module
+
+        session = Mock()
+        session.info = {}
+        session.commit = AsyncMock()
+        session.close = AsyncMock()
+        monkeypatch.setattr(
+            session_module, "create_session_factory", lambda: lambda: session
         )
 
-        assert callable(create_session_factory)
-        assert callable(get_session)
-        assert callable(get_session_dependency)
+        session.in_transaction.return_value = False
+        async with session_module.get_session():
+            pass
+        session.commit.assert_not_awaited()
 
+        session.in_transaction.return_value = True
+        async with session_module.get_session():
+            pass
+        session.commit.assert_awaited_once()
 
-class TestRepositoryModule:
-    """Test repository module imports and structure."""
+    def test_session_factory_reused_per_engine(self):
+        """Test the session factory is rebuilt only when the engine changes."""
+        from unittest.mock import Mock
 
-    def test_repository_module_imports(self):
-        """Test repository module can be imported."""
-        from app.shared.database.repository import BaseRepository
+        from app.shared.database.engine import use_engine
+        from app.shared.database.session import create_session_factory
 
-        assert BaseRepository is not None
+        first, second = Mock(), Mock()
+        with use_engine(first):
+            factory = create_session_factory()
+            assert create_session_factory() is factory
+        with use_engine(second):
+            assert create_session_factory() is not factory
+
+
+class TestRepositoryModule:
+    """Test repository module imports and structure."""
 
     def test_repository_has_crud_methods(self):
         """Test repository has all CRUD methods."""
@@ -201,95 +425,640 @@ class TestRepositoryModule:
             "filter",
             "create",
             "create_many",
+            "bulk_insert",
             "update",
             "update_many",
             "delete",
             "delete_many",
             "count",
             "exists",
+            "exists_by_id",
             "get_or_raise",
             "get_by_or_raise",
+            "fetch_dicts",
+            "stream_dicts",
         ]
 
-        for method in methods:
-            assert hasattr(BaseRepository, method)
-            assert callable(getattr(BaseRepository, method))
+        missing = [m for m in methods if not callable(getattr(BaseRepository, m, None))]
+        assert missing == []
 
+    def test_filter_statements_cached_per_key_set(self):
+        """Test filter statements are reused across values of the same keys."""
+        from unittest.mock import Mock
 
-class TestTransactionModule:
-    """Test transaction module imports and structure."""
+        from app.shared.database.repository import BaseRepository
 
-    def test_transaction_module_imports(self):
-        """Test transaction module can be imported."""
-        from app.shared.database.transaction import transaction
+        repo = BaseRepository(SampleItem, Mock())
 
-        assert callable(transaction)
+        first, params = repo._filter_query("rows", {"name": "A"})
+        second, _ = repo._filter_query("rows", {"name": "B"})
+        assert first is second
+        assert params == {"name": "A"}
+
+        is_null, null_params = repo._filter_query("count", {"name": None})
+        assert "test_sample_items.name IS NULL" in str(is_null)
+        assert null_params == {}
+
+    def test_keyset_pagination(self):
+        """Test after_id pages by primary key instead of offset."""
+        from unittest.mock import Mock
+
+        from sqlalchemy import select
+
+        from app.shared.database.repository import BaseRepository
+
+        repo = BaseRepository(SampleItem, Mock())
+
+        keyset = str(repo._paginate(select(SampleItem), 100, after_id=5))
+        assert "WHERE test_sample_items.id >" in keyset
+        assert "ORDER BY test_sample_items.id" in keyset
+        assert "OFFSET" not in keyset
+
+        offset = str(repo._paginate(select(SampleItem), 100, after_id=None))
+        assert "ORDER BY test_sample_items.id" in offset
+        assert "OFFSET" in offset
+
+    def test_eager_load_options(self):
+        """Test relationship names become selectinload options."""
+        from unittest.mock import Mock
+
+        from sqlalchemy import select
+
+        from app.shared.database.repository import BaseRepository
+
+        repo = BaseRepository(SampleAuthor, Mock())
+        stmt = repo._with_load(select(SampleAuthor), ["books"])
+
+        (option,) = stmt._with_options
+        assert SampleAuthor.books.property in list(option.path)
+        assert repo._with_load(stmt, ()) is stmt
+
+    @pytest.mark.asyncio
+    async def test_exists_stops_at_first_match(self):
+        """Test exists selects a constant with LIMIT 1 instead of counting."""
+        from unittest.mock import AsyncMock, Mock
+
+        from app.shared.database.repository import BaseRepository
+
+        session = Mock()
+        session.scalar = AsyncMock(return_value=None)
+        repo = BaseRepository(SampleItem, session)
+
+        assert await repo.exists(name="A") is False
+
+        sql = str(session.scalar.await_args.args[0])
+        assert "count" not in sql.lower()
+        assert "LIMIT :param_2" in sql
+
+    @pytest.mark.asyncio
+    async def test_exists_by_id_uses_driver_sql(self):
+        """Test exists_by_id sends plain SQL in the driver's paramstyle."""
+        from unittest.mock import AsyncMock, Mock
+
+        from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+        from app.shared.database.repository import BaseRepository
+
+        conn = Mock()
+        conn.dialect = PGDialect_asyncpg()
+        conn.exec_driver_sql = AsyncMock(return_value=Mock())
+        conn.exec_driver_sql.return_value.first.return_value = (1,)
+        session = Mock()
+        session.connection = AsyncMock(return_value=conn)
+        repo = BaseRepository(SampleItem, session)
+
+        assert await repo.exists_by_id(7) is True
+        conn.exec_driver_sql.assert_awaited_once_with(
+            "SELECT 1 FROM test_sample_items WHERE id = $1 LIMIT 1", (7,)
+        )
+
+    @pytest.mark.asyncio
+    async def test_filter_where_expressions(self):
+        """Test where expressions are added to the SQL filter."""
+        from unittest.mock import AsyncMock, Mock
+
+        from app.shared.database.repository import BaseRepository
+
+        session = Mock()
+        session.execute = AsyncMock(return_value=Mock())
+        repo = BaseRepository(SampleItem, session)
+
+        await repo.filter(where=[SampleItem.id > 10], name="A")
+
+        sql = str(session.execute.await_args.args[0])
+        assert "test_sample_items.name = :name_1" in sql
+        assert "test_sample_items.id > :id_1" in sql
+
+    @pytest.mark.asyncio
+    async def test_bulk_mutations_skip_session_sync(self):
+        """Test update_many/delete_many do not synchronize the session."""
+        from unittest.mock import AsyncMock, Mock
+
+        from app.shared.database.repository import BaseRepository
+
+        session = Mock()
+        session.execute = AsyncMock()
+        repo = BaseRepository(SampleItem, session)
+
+        await repo.update_many(name="A", values={"name": "B"})
+        await repo.delete_many(name="B")
+
+        for call in session.execute.await_args_list:
+            stmt = call.args[0]
+            assert stmt.get_execution_options()["synchronize_session"] is False
+
+    @pytest.mark.asyncio
+    async def test_create_refreshes_only_expired_columns(self):
+        """Test create reloads only values the INSERT did not return."""
+        from unittest.mock import AsyncMock, Mock
+
+        from sqlalchemy import inspect
+
+        from app.shared.database.repository import BaseRepository
+
+        session = Mock()
+        session.flush = AsyncMock()
+        session.refresh = AsyncMock()
+        repo = BaseRepository(SampleItem, session)
+
+        await repo.create(name="returned")
+        session.refresh.assert_not_awaited()
+
+        def expire_name():
+            (item,) = session.add.call_args.args
+            state = inspect(item)
+            state._expire_attributes(state.dict, ["name"])
+
+        session.flush.side_effect = expire_name
+        item = await repo.create(name="fetched")
+        session.refresh.assert_awaited_once_with(item, attribute_names={"name"})
+
+    @pytest.mark.asyncio
+    async def test_create_error_context_omits_values(self):
+        """Test a failed create reports field names, not attribute values."""
+        from unittest.mock import AsyncMock, Mock
+
+        from app.shared.database.repository import BaseRepository
+
+        session = Mock()
+        session.flush = AsyncMock(side_effect=RuntimeError("unique violation"))
+        repo = BaseRepository(SampleItem, session)
+
+        with pytest.raises(DatabaseError) as exc_info:
+            await repo.create(name="x" * 1000, id=1)
+
+        assert exc_info.value.context["fields"] == ["id", "name"]
+        assert "attributes" not in exc_info.value.context
+
+    @pytest.mark.asyncio
+    async def test_create_without_refresh_skips_flush(self):
+        """Test refresh=False only adds the instance to the session."""
+        from unittest.mock import AsyncMock, Mock
+
+        from app.shared.database.repository import BaseRepository
+
+        session = Mock()
+        session.flush = AsyncMock()
+        session.refresh = AsyncMock()
+        repo = BaseRepository(SampleItem, session)
+
+        item = await repo.create(refresh=False, name="pending")
+
+        session.add.assert_called_once_with(item)
+        session.flush.assert_not_awaited()
+        session.refresh.assert_not_awaited()
+
+    @staticmethod
+    def _asyncpg_session():
+        """Mock session on asyncpg whose raw connection records COPY calls."""
+        from unittest.mock import AsyncMock, Mock
+
+        from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+        raw = Mock()
+        raw.driver_connection.copy_records_to_table = AsyncMock()
+        conn = Mock()
+        conn.dialect = PGDialect_asyncpg()
+        conn.get_raw_connection = AsyncMock(return_value=raw)
+        session = Mock()
+        session.connection = AsyncMock(return_value=conn)
+        session.flush = AsyncMock()
+        session.execute = AsyncMock()
+        return session, raw.driver_connection.copy_records_to_table
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_copies_table_columns(self, monkeypatch):
+        """Test COPY uses column names, bind processing and Python defaults."""
+        from app.shared.database import repository as repository_module
+        from app.shared.database.repository import BaseRepository
+
+        monkeypatch.setattr(repository_module, "COPY_THRESHOLD", 2)
+        session, copy = self._asyncpg_session()
+        repo = BaseRepository(SampleEvent, session)
+
+        await repo.bulk_insert(
+            [
+                {"id": 1, "kind": SampleKind.CREATED},
+                {"id": 2, "kind": SampleKind.DELETED},
+            ]
+        )
+
+        session.execute.assert_not_awaited()
+        assert copy.await_args.kwargs["columns"] == ["id", "event_kind", "source"]
+        assert copy.await_args.kwargs["records"] == [
+            (1, "CREATED", "api"),
+            (2, "DELETED", "api"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_mixed_keys_falls_back_to_insert(self, monkeypatch):
+        """Test rows with differing key sets are not copied."""
+        from app.shared.database import repository as repository_module
+        from app.shared.database.repository import BaseRepository
+
+        monkeypatch.setattr(repository_module, "COPY_THRESHOLD", 2)
+        session, copy = self._asyncpg_session()
+        repo = BaseRepository(SampleEvent, session)
+
+        await repo.bulk_insert(
+            [{"id": 1, "kind": SampleKind.CREATED}, {"id": 2, "source": "cli"}]
+        )
+
+        copy.assert_not_awaited()
+        session.execute.assert_awaited_once()
+
+
+class TestQueryCache:
+    """Test repository query cache."""
+
+    @pytest.mark.asyncio
+    async def test_ttl_cache_expires_and_invalidates(self, monkeypatch):
+        """Test entries expire after the TTL and by key prefix."""
+        from app.shared.database import cache as cache_module
+        from app.shared.database.cache import TTLQueryCache
+
+        now = 100.0
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now)
+        cache = TTLQueryCache(ttl=10, maxsize=2)
+
+        await cache.set("Item:a", 1)
+        await cache.set("Tag:a", 2)
+        assert await cache.get("Item:a") == 1
+
+        await cache.invalidate_prefix("Item:")
+        assert await cache.get("Item:a") is None
+        assert await cache.get("Tag:a") == 2
+
+        now = 111.0
+        assert await cache.get("Tag:a") is None
+
+    @staticmethod
+    def _clean_session():
+        from unittest.mock import Mock
+
+        session = Mock()
+        session.info = {}
+        session.new = session.dirty = session.deleted = ()
+        session.identity_map = {}
+        return session
+
+    @pytest.mark.asyncio
+    async def test_count_is_cached_until_write(self):
+        """Test count hits the cache until a write's transaction ends."""
+        from unittest.mock import AsyncMock
+
+        from app.shared.database.cache import TTLQueryCache, apply_invalidations
+        from app.shared.database.repository import BaseRepository
+
+        cache = TTLQueryCache()
+        reader = self._clean_session()
+        reader.scalar = AsyncMock(return_value=3)
+        writer = self._clean_session()
+        writer.scalar = AsyncMock(return_value=2)
+        writer.execute = AsyncMock()
+        reader_repo = BaseRepository(SampleItem, reader, cache=cache)
+        writer_repo = BaseRepository(SampleItem, writer, cache=cache)
+
+        assert await reader_repo.count(name="A") == 3
+        assert await reader_repo.count(name="A") == 3
+        assert reader.scalar.await_count == 1
+
+        # Uncommitted writes: the writer bypasses the cache, others keep it
+        await writer_repo.delete_many(name="A")
+        assert await writer_repo.count(name="A") == 2
+        assert await cache.get("SampleItem:count:[('name', 'A')]") == 3
+
+        await apply_invalidations(writer)
+        await reader_repo.count(name="A")
+        assert reader.scalar.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_rebuilds_cached_row(self):
+        """Test cached rows are merged into the session without a query."""
+        from unittest.mock import AsyncMock
+
+        from sqlalchemy import inspect
+
+        from app.shared.database.cache import TTLQueryCache
+        from app.shared.database.repository import BaseRepository
+
+        cache = TTLQueryCache()
+        await cache.set("SampleItem:get:7", {"id": 7, "name": "cached"})
+        session = self._clean_session()
+        session.get = AsyncMock()
+        session.merge = AsyncMock(side_effect=lambda obj, load: obj)
+        repo = BaseRepository(SampleItem, session, cache=cache)
+
+        item = await repo.get(7)
+
+        assert item.name == "cached"
+        assert inspect(item).detached
+        session.get.assert_not_awaited()
+        assert session.merge.await_args.kwargs == {"load": False}
+
+    @pytest.mark.asyncio
+    async def test_get_prefers_session_instance(self):
+        """Test a cached row never overwrites the session's own instance."""
+        from unittest.mock import AsyncMock
+
+        from sqlalchemy import inspect
+
+        from app.shared.database.cache import TTLQueryCache
+        from app.shared.database.repository import BaseRepository
+
+        cache = TTLQueryCache()
+        await cache.set("SampleItem:get:7", {"id": 7, "name": "cached"})
+        session = self._clean_session()
+        session.merge = AsyncMock()
+        current = SampleItem(id=7, name="current")
+        session.identity_map[
+            inspect(SampleItem).identity_key_from_instance(current)
+        ] = current
+        repo = BaseRepository(SampleItem, session, cache=cache)
+
+        assert await repo.get(7) is current
+        session.merge.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_uncommitted_reads_are_not_cached(self):
+        """Test a session with pending changes does not fill the cache."""
+        from unittest.mock import AsyncMock
+
+        from app.shared.database.cache import TTLQueryCache
+        from app.shared.database.repository import BaseRepository
+
+        cache = TTLQueryCache()
+        session = self._clean_session()
+        session.new = (SampleItem(name="pending"),)
+        session.get = AsyncMock(return_value=SampleItem(id=7, name="pending"))
+        repo = BaseRepository(SampleItem, session, cache=cache)
+
+        await repo.get(7)
+
+        assert await cache.get("SampleItem:get:7") is None
+
+
+class TestPKBatchLoader:
+    """Test primary key batch loading."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_share_one_query(self):
+        """Test concurrent repo.get calls are read with one IN query."""
+        import asyncio
+        from unittest.mock import AsyncMock, Mock
+
+        from app.shared.database.loader import PK_LOADER_KEY, PKBatchLoader
+        from app.shared.database.repository import BaseRepository
+
+        session = Mock()
+        session.scalars = AsyncMock(
+            return_value=[SampleItem(id=1, name="A"), SampleItem(id=2, name="B")]
+        )
+        session.get = AsyncMock()
+        session.info = {PK_LOADER_KEY: PKBatchLoader(session)}
+        repo = BaseRepository(SampleItem, session)
+
+        first, second, again, missing = await asyncio.gather(
+            repo.get(1), repo.get(2), repo.get(1), repo.get(3)
+        )
+
+        assert (first.name, second.name, missing) == ("A", "B", None)
+        assert again is first
+        session.scalars.assert_awaited_once()
+        assert "IN (__[POSTCOMPILE_id_1])" in str(session.scalars.await_args.args[0])
+        session.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_single_get_uses_session_get(self):
+        """Test a batch of one keeps the identity map fast path."""
+        from unittest.mock import AsyncMock, Mock
+
+        from app.shared.database.loader import PKBatchLoader
+
+        session = Mock()
+        session.get = AsyncMock(return_value="item")
+        loader = PKBatchLoader(session)
+
+        assert await loader.load(SampleItem, 5) == "item"
+        session.get.assert_awaited_once_with(SampleItem, 5)
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_reaches_every_caller(self):
+        """Test a failed batch query raises in all joined lookups."""
+        import asyncio
+        from unittest.mock import AsyncMock, Mock
+
+        from app.shared.database.loader import PKBatchLoader
+
+        session = Mock()
+        session.scalars = AsyncMock(side_effect=RuntimeError("down"))
+        loader = PKBatchLoader(session)
+
+        results = await asyncio.gather(
+            loader.load(SampleItem, 1),
+            loader.load(SampleItem, 2),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert loader._batches == {}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fails", [False, True])
+    async def test_cancelled_caller_leaves_batch_intact(self, fails):
+        """Test a joined caller cancelled mid-batch does not break the others."""
+        import asyncio
+        from unittest.mock import AsyncMock, Mock
+
+        from app.shared.database.loader import PKBatchLoader
+
+        session = Mock()
+        if fails:
+            session.scalars = AsyncMock(side_effect=RuntimeError("down"))
+        else:
+            session.scalars = AsyncMock(return_value=[SampleItem(id=1, name="A")])
+        loader = PKBatchLoader(session)
+
+        owner = asyncio.create_task(loader.load(SampleItem, 1))
+        joined = asyncio.create_task(loader.load(SampleItem, 2))
+        # Both tasks are now waiting: the owner on its tick, the other on the batch
+        await asyncio.sleep(0)
+        joined.cancel()
+
+        if fails:
+            with pytest.raises(RuntimeError):
+                await owner
+        else:
+            assert (await owner).name == "A"
+        assert joined.cancelled()
+        assert "IN" in str(session.scalars.await_args.args[0])
+
+    @pytest.mark.asyncio
+    async def test_cancelled_owner_hands_batch_to_joined_callers(self):
+        """Test joined callers load their rows when the batch owner is cancelled."""
+        import asyncio
+        from unittest.mock import AsyncMock, Mock
+
+        from app.shared.database.loader import PKBatchLoader
+
+        session = Mock()
+        session.scalars = AsyncMock(
+            return_value=[SampleItem(id=2, name="B"), SampleItem(id=3, name="C")]
+        )
+        loader = PKBatchLoader(session)
+
+        owner = asyncio.create_task(loader.load(SampleItem, 1))
+        joined = [asyncio.create_task(loader.load(SampleItem, id)) for id in (2, 3)]
+        await asyncio.sleep(0)
+        owner.cancel()
+
+        results = await asyncio.gather(*joined)
+
+        assert [item.name for item in results] == ["B", "C"]
+        assert owner.cancelled()
+        session.scalars.assert_awaited_once()
+        assert loader._batches == {}
 
 
 class TestHealthModule:
     """Test health module imports and structure."""
 
-    def test_health_module_imports(self):
-        """Test health module can be imported."""
-        from app.shared.database.health import (
-            check_database_health,
-            get_database_info,
-        )
+    @pytest.mark.asyncio
+    async def test_shallow_health_check_skips_database(self):
+        """Test shallow health check reports pool stats without connecting."""
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        from app.shared.database.health import check_database_health
+
+        engine = create_async_engine("postgresql+asyncpg://user:pw@unreachable/db")
+        try:
+            health = await check_database_health(engine, deep=False)
+        finally:
+            await engine.dispose()
 
-        assert callable(check_database_health)
-        assert callable(get_database_info)
+        assert health["healthy"] is True
+        assert health["pool"]["checked_out"] == 0
 
 
 class TestMigrationsModule:
     """Test migrations module imports and structure."""
 
-    def test_migrations_module_imports(self):
-        """Test migrations module can be imported."""
-        from app.shared.database.migrations import (
-            get_alembic_config,
-            run_migrations,
-            create_migration,
-            rollback_migration,
-            get_migration_history,
-        )
+    def test_alembic_config_cached_per_directory(self, tmp_path):
+        """Test alembic.ini is parsed once per migrations directory."""
+        from app.shared.database.migrations import get_alembic_config
 
-        assert callable(get_alembic_config)
-        assert callable(run_migrations)
-        assert callable(create_migration)
-        assert callable(rollback_migration)
-        assert callable(get_migration_history)
+        (tmp_path / "alembic.ini").write_text("[alembic]\n")
 
+        config = get_alembic_config(tmp_path)
+        assert get_alembic_config(tmp_path) is config
+        assert config.get_main_option("script_location") == str(tmp_path.resolve())
 
-class TestDatabaseModuleExports:
-    """Test main database module exports."""
-
-    def test_main_module_exports(self):
-        """Test main database module has all exports."""
-        from app.shared.database import (
-            init_database,
-            close_database,
-            get_engine,
-            get_session,
-            get_session_dependency,
-            AsyncSession,
-            Base,
-            TimestampMixin,
-            SoftDeleteMixin,
-            BaseRepository,
-            transaction,
-            check_database_health,
+    @pytest.mark.asyncio
+    async def test_migration_history_lists_revisions(self, tmp_path):
+        """Test migration history walks revisions from head to base."""
+        from app.shared.database.migrations import get_migration_history
+
+        (tmp_path / "alembic.ini").write_text("[alembic]\n")
+        versions = tmp_path / "versions"
+        versions.mkdir()
+        (versions / "0001_first.py").write_text(
+            'revision = "0001"\ndown_revision = None\n'
         )
+        (versions / "0002_second.py").write_text(
+            'revision = "0002"\ndown_revision = "0001"\n'
+        )
+
+        assert await get_migration_history(tmp_path) == ["0002", "0001"]
+
+    def test_alembic_config_missing_ini(self, tmp_path):
+        """Test a missing alembic.ini raises FileNotFoundError."""
+        from app.shared.database.migrations import get_alembic_config
 
-        # Check all exports exist
-        assert init_database is not None
-        assert close_database is not None
-        assert get_engine is not None
-        assert get_session is not None
-        assert get_session_dependency is not None
-        assert AsyncSession is not None
-        assert Base is not None
-        assert TimestampMixin is not None
-        assert SoftDeleteMixin is not None
-        assert BaseRepository is not None
-        assert transaction is not None
-        assert check_database_health is not None
+        with pytest.raises(FileNotFoundError):
+            get_alembic_config(tmp_path)
+
+
+class TestDatabaseModuleExports:
+    """Test database modules expose their public API."""
+
+    @pytest.mark.parametrize(
+        "module_name,names",
+        [
+            (
+                "app.shared.database.engine",
+                [
+                    "create_engine",
+                    "create_test_engine",
+                    "init_database",
+                    "close_database",
+                    "get_engine",
+                ],
+            ),
+            (
+                "app.shared.database.session",
+                ["create_session_factory", "get_session", "get_session_dependency"],
+            ),
+            ("app.shared.database.repository", ["BaseRepository"]),
+            ("app.shared.database.transaction", ["transaction"]),
+            (
+                "app.shared.database.health",
+                ["check_database_health", "get_database_info"],
+            ),
+            (
+                "app.shared.database.migrations",
+                [
+                    "get_alembic_config",
+                    "run_migrations",
+                    "create_migration",
+                    "rollback_migration",
+                    "get_migration_history",
+                ],
+            ),
+            (
+                "app.shared.database",
+                [
+                    "init_database",
+                    "close_database",
+                    "get_engine",
+                    "warmup_pool",
+                    "get_session",
+                    "get_session_dependency",
+                    "AsyncSession",
+                    "Base",
+                    "TimestampMixin",
+                    "SoftDeleteMixin",
+                    "BaseRepository",
+                    "TTLQueryCache",
+                    "transaction",
+                    "check_database_health",
+                ],
+            ),
+        ],
+    )
+    def test_module_exports(self, module_name, names):
+        """Test each module can be imported and exports its names."""
+        import importlib
+
+        module = importlib.import_module(module_name)
+        for name in names:
+            assert callable(getattr(module, name)), name
@@ -4,7 +4,8 @@ Tests for the Exception Module.
 Tests all exception classes, helper functions, and automatic logging.
 """
 
-from unittest.mock import Mock, patch
+import pytest
+
 from app.shared.exceptions import (
     # Exception classes
     NotFoundError,
@@ -45,15 +46,12 @@ from app.shared.exceptions import (
 # ============================================================================
 
 
+@pytest.mark.usefixtures("exception_logger")
 class TestAppException:
     """Test the base AppException class."""
 
-    @patch("app.shared.logger.get_logger")
-    def test_basic_exception_creation(self, mock_get_logger):
+    def test_basic_exception_creation(self):
         """Test creating a basic exception."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
         exc = AppException(
             message="Test error",
             error_code=ErrorCode.INTERNAL_ERROR,
@@ -66,12 +64,8 @@ class TestAppException:
         assert exc.context == {}
         assert exc.original_exception is None
 
-    @patch("app.shared.logger.get_logger")
-    def test_exception_with_context(self, mock_get_logger):
+    def test_exception_with_context(self):
         """Test exception with additional context."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
         context = {"user_id": 123, "action": "delete"}
         exc = AppException(
             message="Test error",
@@ -83,12 +77,8 @@ class TestAppException:
         assert exc.context == context
         assert exc.get_context() == context
 
-    @patch("app.shared.logger.get_logger")
-    def test_exception_with_original_exception(self, mock_get_logger):
+    def test_exception_with_original_exception(self):
         """Test wrapping another exception."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
         original = ValueError("Original error")
         exc = AppException(
             message="Wrapped error",
@@ -99,12 +89,8 @@ class TestAppException:
 
         assert exc.original_exception is original
 
-    @patch("app.shared.logger.get_logger")
-    def test_to_dict(self, mock_get_logger):
+    def test_to_dict(self):
         """Test converting exception to dictionary."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
         exc = AppException(
             message="Test error",
             error_code=ErrorCode.INTERNAL_ERROR,
@@ -118,66 +104,212 @@ class TestAppException:
         assert result["error"]["code"] == ErrorCode.INTERNAL_ERROR.value
         assert result["error"]["category"] == ErrorCategory.INTERNAL.value
         assert result["error"]["context"]["key"] == "value"
+        # Plain strings, not enum members
+        assert type(result["error"]["code"]) is str
+        assert type(result["error"]["category"]) is str
 
-    @patch("app.shared.logger.get_logger")
-    def test_automatic_logging_server_error(self, mock_get_logger):
-        """Test that server errors are logged with ERROR level."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
+    def test_to_json_bytes(self):
+        """Test JSON serialization matches to_dict and handles non-JSON values."""
+        import json
+        from decimal import Decimal
 
-        AppException(
+        exc = BusinessRuleError("Limit exceeded", context={"limit": Decimal("9.50")})
+
+        result = json.loads(exc.to_json_bytes())
+
+        assert result["error"]["message"] == "Limit exceeded"
+        assert result["error"]["code"] == exc.to_dict()["error"]["code"]
+        assert result["error"]["context"] == {"limit": "9.50"}
+
+    def test_to_dict_is_cached(self):
+        """Test to_dict builds the dictionary once per instance."""
+        exc = AppException(
+            message="Test error",
+            error_code=ErrorCode.INTERNAL_ERROR,
+            category=ErrorCategory.INTERNAL,
+        )
+
+        assert exc.to_dict() is exc.to_dict()
+
+    def test_automatic_logging_server_error(self, exception_logger):
+        """Test that server errors are logged with ERROR level."""
+        exc = AppException(
             message="Server error",
             error_code=ErrorCode.INTERNAL_ERROR,
             category=ErrorCategory.INTERNAL,
         )
 
+        # Logged once handled, not when created
+        assert exception_logger.errors == []
+        exc.ensure_logged()
+
         # Verify error was logged
-        mock_logger.error.assert_called_once()
-        call_args = mock_logger.error.call_args
-        assert "Server error" in call_args[0]
-        assert call_args[1]["error_code"] == ErrorCode.INTERNAL_ERROR.value
-        assert call_args[1]["category"] == ErrorCategory.INTERNAL.value
-
-    @patch("app.shared.logger.get_logger")
-    def test_automatic_logging_client_error(self, mock_get_logger):
+        assert len(exception_logger.errors) == 1
+        message, kwargs = exception_logger.errors[0]
+        assert "Server error" in message
+        assert kwargs["extra"]["error_code"] == ErrorCode.INTERNAL_ERROR.value
+        assert kwargs["extra"]["category"] == ErrorCategory.INTERNAL.value
+        assert kwargs["exc_info"] is exc
+
+    def test_automatic_logging_client_error(self, exception_logger):
         """Test that client errors are logged with WARNING level."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
         AppException(
             message="Client error",
             error_code=ErrorCode.INVALID_INPUT,
             category=ErrorCategory.VALIDATION,
-        )
+        ).ensure_logged()
 
         # Verify warning was logged
-        mock_logger.warning.assert_called_once()
-        call_args = mock_logger.warning.call_args
-        assert "Client error" in call_args[0]
+        assert len(exception_logger.warnings) == 1
+        message, kwargs = exception_logger.warnings[0]
+        assert "Client error" in message
+        assert "exc_info" not in kwargs
+
+    def test_slots_and_pickle(self):
+        """Test exceptions keep attributes in slots and survive pickling."""
+        import pickle
+
+        exc = NotFoundError("User not found", context={"user_id": 1})
+
+        assert "message" not in vars(exc)
+        restored = pickle.loads(pickle.dumps(exc))
+        assert type(restored) is NotFoundError
+        assert restored.message == "User not found"
+        assert restored.context == {"user_id": 1}
+
+    def test_log_fields_shared_without_context(self, exception_logger):
+        """Test context-free exceptions reuse one log field dict."""
+        NotFoundError().ensure_logged()
+        NotFoundError().ensure_logged()
+        NotFoundError(context={"user_id": 1}).ensure_logged()
+
+        first, second, third = (
+            kwargs["extra"] for _, kwargs in exception_logger.warnings
+        )
+        assert first is second
+        assert first == {"error_code": "resource_not_found", "category": "not_found"}
+        assert third == {**first, "user_id": 1}
 
-    @patch("app.shared.logger.get_logger")
-    def test_no_logging_when_disabled(self, mock_get_logger):
-        """Test that logging can be disabled."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
+    def test_original_exception_stringified_once(self, exception_logger):
+        """Test the wrapped exception is formatted once for log and dict."""
+        calls = []
+
+        class DriverError(Exception):
+            def __str__(self):
+                calls.append(1)
+                return "connection reset"
+
+        exc = DatabaseError("Query failed", original_exception=DriverError())
+        result = exc.to_dict()
+
+        assert result["error"]["original_error"] == {
+            "type": "DriverError",
+            "message": "connection reset",
+        }
+        extra = exception_logger.errors[-1][1]["extra"]
+        assert extra["original_error"] == "DriverError"
+        assert extra["original_message"] == "connection reset"
+        assert len(calls) == 1
+
+    def test_concrete_errors_match_base_state(self):
+        """Test concrete errors set the same attributes as AppException."""
+        exc = NotFoundError()
+        base_exc = AppException(
+            message="Resource not found",
+            error_code=ErrorCode.RESOURCE_NOT_FOUND,
+            category=ErrorCategory.NOT_FOUND,
+        )
+
+        for name in AppException.__slots__:
+            assert getattr(exc, name) == getattr(base_exc, name)
+        assert exc.args == base_exc.args
+
+    def test_concrete_errors_log_like_base(self, exception_logger):
+        """Test concrete errors log the same records as AppException."""
+        original = RuntimeError("connection reset")
+        exc = DatabaseError(
+            "Query failed", context={"table": "users"}, original_exception=original
+        )
+        base_exc = AppException(
+            message="Query failed",
+            error_code=ErrorCode.DATABASE_QUERY_ERROR,
+            category=ErrorCategory.DATABASE,
+            context={"table": "users"},
+            original_exception=original,
+        )
+
+        for name in AppException.__slots__:
+            assert getattr(exc, name) == getattr(base_exc, name)
+        exc.ensure_logged()
+        base_exc.ensure_logged()
+
+        (message, kwargs), (base_message, base_kwargs) = exception_logger.errors
+        assert message == base_message
+        assert kwargs["extra"] == base_kwargs["extra"]
+        assert kwargs["exc_info"] is exc
+
+    def test_logger_resolved_once(self, monkeypatch, exception_logger):
+        """Test the exception logger is looked up once, not per exception."""
+        from app.shared.exceptions import base
+
+        requested = []
+
+        def get_logger(name):
+            requested.append(name)
+            return exception_logger
+
+        monkeypatch.setattr(base, "_logger", None)
+        monkeypatch.setattr("app.shared.logger.get_logger", get_logger)
+
+        for _ in range(3):
+            AppException(
+                message="Test error",
+                error_code=ErrorCode.INTERNAL_ERROR,
+                category=ErrorCategory.INTERNAL,
+            ).ensure_logged()
+
+        assert requested == ["app.shared.exceptions.base"]
+        assert len(exception_logger.errors) == 3
+
+    def test_logged_once_when_handled(self, exception_logger):
+        """Test handling logs once and discarded exceptions never log."""
+        # Caught and dropped: nothing is logged
+        try:
+            raise AppException(
+                message="Swallowed",
+                error_code=ErrorCode.INTERNAL_ERROR,
+                category=ErrorCategory.INTERNAL,
+            )
+        except AppException:
+            pass
+        assert exception_logger.errors == []
+
+        exc = AppException(
+            message="Handled",
+            error_code=ErrorCode.INTERNAL_ERROR,
+            category=ErrorCategory.INTERNAL,
+        )
+        exc.to_dict()
+        exc.to_dict()
+        exc.ensure_logged()
+
+        assert len(exception_logger.errors) == 1
 
+    def test_no_logging_when_disabled(self, exception_logger):
+        """Test that logging can be disabled."""
         AppException(
             message="Test error",
             error_code=ErrorCode.INTERNAL_ERROR,
             category=ErrorCategory.INTERNAL,
             should_auto_log=False,
-        )
+        ).ensure_logged()
 
         # Verify no logging occurred
-        mock_logger.error.assert_not_called()
-        mock_logger.warning.assert_not_called()
+        assert exception_logger.errors == []
+        assert exception_logger.warnings == []
 
-    @patch("app.shared.logger.get_logger")
-    def test_string_representation(self, mock_get_logger):
+    def test_string_representation(self):
         """Test string representation of exception."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
         exc = AppException(
             message="Test error",
             error_code=ErrorCode.INTERNAL_ERROR,
@@ -189,6 +321,12 @@ class TestAppException:
         assert "INTERNAL" in str_repr
         assert "internal_error" in str_repr
         assert "Test error" in str_repr
+        assert str_repr == (
+            "INTERNAL: [internal_error] Test error, context={'key': 'value'}"
+        )
+        assert (
+            str(NotFoundError()) == "NOT_FOUND: [resource_not_found] Resource not found"
+        )
 
 
 # ============================================================================
@@ -196,27 +334,20 @@ class TestAppException:
 # ============================================================================
 
 
+@pytest.mark.usefixtures("exception_logger")
 class TestNotFoundError:
     """Test NotFoundError exception."""
 
-    @patch("app.shared.logger.get_logger")
-    def test_basic_not_found(self, mock_get_logger):
+    def test_basic_not_found(self):
         """Test basic NotFoundError."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
         exc = NotFoundError("User not found")
 
         assert exc.message == "User not found"
         assert exc.category == ErrorCategory.NOT_FOUND
         assert exc.error_code == ErrorCode.RESOURCE_NOT_FOUND
 
-    @patch("app.shared.logger.get_logger")
-    def test_entity_not_found_helper(self, mock_get_logger):
+    def test_entity_not_found_helper(self):
         """Test entity_not_found helper function."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
         exc = entity_not_found("User", 123)
 
         assert "User" in exc.message
@@ -225,380 +356,273 @@ class TestNotFoundError:
         assert exc.context["entity_type"] == "User"
         assert exc.context["entity_id"] == "123"
 
+    def test_custom_message_skips_default_formatting(self):
+        """Test helpers only format their default message when it is used."""
+        formatted = []
 
-# ============================================================================
-# ValidationError Tests
-# ============================================================================
-
-
-class TestValidationError:
-    """Test ValidationError exception."""
-
-    @patch("app.shared.logger.get_logger")
-    def test_basic_validation_error(self, mock_get_logger):
-        """Test basic ValidationError."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = ValidationError("Invalid input")
-
-        assert exc.message == "Invalid input"
-        assert exc.category == ErrorCategory.VALIDATION
-        assert exc.error_code == ErrorCode.INVALID_INPUT
-
-    @patch("app.shared.logger.get_logger")
-    def test_missing_field_helper(self, mock_get_logger):
-        """Test missing_field helper function."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = missing_field("email")
-
-        assert "email" in exc.message
-        assert exc.error_code == ErrorCode.MISSING_FIELD
-        assert exc.context["field"] == "email"
-
-    @patch("app.shared.logger.get_logger")
-    def test_invalid_format_helper(self, mock_get_logger):
-        """Test invalid_format helper function."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = invalid_format("email", "valid email address")
-
-        assert "email" in exc.message
-        assert "valid email address" in exc.message
-        assert exc.error_code == ErrorCode.INVALID_FORMAT
-        assert exc.context["field"] == "email"
-        assert exc.context["expected_format"] == "valid email address"
-
-    @patch("app.shared.logger.get_logger")
-    def test_duplicate_entry_helper(self, mock_get_logger):
-        """Test duplicate_entry helper function."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = duplicate_entry("User", "email", "test@example.com")
-
-        assert "User" in exc.message
-        assert "email" in exc.message
-        assert "test@example.com" in exc.message
-        assert exc.error_code == ErrorCode.DUPLICATE_ENTRY
-        assert exc.context["entity_type"] == "User"
-        assert exc.context["field"] == "email"
-
-    @patch("app.shared.logger.get_logger")
-    def test_constraint_violation_helper(self, mock_get_logger):
-        """Test constraint_violation helper function."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = constraint_violation("price_positive", "Price must be > 0")
-
-        assert "price_positive" in exc.message
-        assert exc.error_code == ErrorCode.CONSTRAINT_VIOLATION
-        assert exc.context["constraint"] == "price_positive"
-        assert exc.context["details"] == "Price must be > 0"
-
-
-# ============================================================================
-# DatabaseError Tests
-# ============================================================================
-
-
-class TestDatabaseError:
-    """Test DatabaseError exception."""
-
-    @patch("app.shared.logger.get_logger")
-    def test_basic_database_error(self, mock_get_logger):
-        """Test basic DatabaseError."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = DatabaseError("Query failed")
-
-        assert exc.message == "Query failed"
-        assert exc.category == ErrorCategory.DATABASE
-        assert exc.error_code == ErrorCode.DATABASE_QUERY_ERROR
+        class Tracked:
+            def __format__(self, spec):
+                formatted.append(spec)
+                return "tracked"
 
-    @patch("app.shared.logger.get_logger")
-    def test_database_connection_error_helper(self, mock_get_logger):
-        """Test database_connection_error helper function."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
+        exc = duplicate_entry("User", "email", Tracked(), message="Email taken")
 
-        original = ConnectionError("Connection refused")
-        exc = database_connection_error("Timeout", original)
-
-        assert "Database connection failed" in exc.message
-        assert exc.error_code == ErrorCode.DATABASE_CONNECTION_ERROR
-        assert exc.original_exception is original
-
-    @patch("app.shared.logger.get_logger")
-    def test_database_integrity_error_helper(self, mock_get_logger):
-        """Test database_integrity_error helper function."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = database_integrity_error("Foreign key violation")
-
-        assert "Database integrity error" in exc.message
-        assert exc.error_code == ErrorCode.DATABASE_INTEGRITY_ERROR
-
-
-# ============================================================================
-# AuthenticationError Tests
-# ============================================================================
-
-
-class TestAuthenticationError:
-    """Test AuthenticationError exception."""
-
-    @patch("app.shared.logger.get_logger")
-    def test_basic_authentication_error(self, mock_get_logger):
-        """Test basic AuthenticationError."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = AuthenticationError("Invalid credentials")
-
-        assert exc.message == "Invalid credentials"
-        assert exc.category == ErrorCategory.AUTHENTICATION
-        assert exc.error_code == ErrorCode.INVALID_CREDENTIALS
-
-    @patch("app.shared.logger.get_logger")
-    def test_token_expired_helper(self, mock_get_logger):
-        """Test token_expired helper function."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = token_expired()
-
-        assert "expired" in exc.message.lower()
-        assert exc.error_code == ErrorCode.TOKEN_EXPIRED
-
-    @patch("app.shared.logger.get_logger")
-    def test_invalid_token_helper(self, mock_get_logger):
-        """Test invalid_token helper function."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = invalid_token()
-
-        assert "Invalid" in exc.message
-        assert exc.error_code == ErrorCode.TOKEN_INVALID
-
-    @patch("app.shared.logger.get_logger")
-    def test_authentication_required_helper(self, mock_get_logger):
-        """Test authentication_required helper function."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = authentication_required()
-
-        assert "required" in exc.message.lower()
-        assert exc.error_code == ErrorCode.AUTHENTICATION_REQUIRED
-
-
-# ============================================================================
-# AuthorizationError Tests
-# ============================================================================
-
-
-class TestAuthorizationError:
-    """Test AuthorizationError exception."""
-
-    @patch("app.shared.logger.get_logger")
-    def test_basic_authorization_error(self, mock_get_logger):
-        """Test basic AuthorizationError."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = AuthorizationError("Access denied")
-
-        assert exc.message == "Access denied"
-        assert exc.category == ErrorCategory.AUTHORIZATION
-        assert exc.error_code == ErrorCode.INSUFFICIENT_PERMISSIONS
-
-    @patch("app.shared.logger.get_logger")
-    def test_access_denied_helper(self, mock_get_logger):
-        """Test access_denied helper function."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = access_denied(resource="Order", action="delete")
-
-        assert "delete" in exc.message
-        assert "Order" in exc.message
-        assert exc.error_code == ErrorCode.ACCESS_DENIED
-        assert exc.context["resource"] == "Order"
-        assert exc.context["action"] == "delete"
-
-    @patch("app.shared.logger.get_logger")
-    def test_insufficient_permissions_helper(self, mock_get_logger):
-        """Test insufficient_permissions helper function."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = insufficient_permissions(required_role="admin")
-
-        assert "admin" in exc.message
-        assert exc.error_code == ErrorCode.INSUFFICIENT_PERMISSIONS
-        assert exc.context["required_role"] == "admin"
-
-
-# ============================================================================
-# BusinessRuleError Tests
-# ============================================================================
-
-
-class TestBusinessRuleError:
-    """Test BusinessRuleError exception."""
-
-    @patch("app.shared.logger.get_logger")
-    def test_basic_business_rule_error(self, mock_get_logger):
-        """Test basic BusinessRuleError."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = BusinessRuleError("Invalid operation")
-
-        assert exc.message == "Invalid operation"
-        assert exc.category == ErrorCategory.BUSINESS_RULE
-        assert exc.error_code == ErrorCode.BUSINESS_RULE_VIOLATION
-
-    @patch("app.shared.logger.get_logger")
-    def test_invalid_state_helper(self, mock_get_logger):
-        """Test invalid_state helper function."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = invalid_state("cancelled", "active")
-
-        assert "cancelled" in exc.message
-        assert exc.error_code == ErrorCode.INVALID_STATE
-        assert exc.context["current_state"] == "cancelled"
-        assert exc.context["expected_state"] == "active"
-
-    @patch("app.shared.logger.get_logger")
-    def test_operation_not_allowed_helper(self, mock_get_logger):
-        """Test operation_not_allowed helper function."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = operation_not_allowed("delete", "Order already shipped")
-
-        assert "delete" in exc.message
-        assert exc.error_code == ErrorCode.OPERATION_NOT_ALLOWED
-        assert exc.context["operation"] == "delete"
-        assert exc.context["reason"] == "Order already shipped"
+        assert exc.message == "Email taken"
+        assert formatted == []
 
 
 # ============================================================================
-# ExternalServiceError Tests
+# Exception Class and Helper Function Tests
 # ============================================================================
 
-
-class TestExternalServiceError:
-    """Test ExternalServiceError exception."""
-
-    @patch("app.shared.logger.get_logger")
-    def test_basic_external_service_error(self, mock_get_logger):
-        """Test basic ExternalServiceError."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = ExternalServiceError("Payment API failed")
-
-        assert exc.message == "Payment API failed"
-        assert exc.category == ErrorCategory.EXTERNAL_SERVICE
-        assert exc.error_code == ErrorCode.EXTERNAL_SERVICE_ERROR
-
-    @patch("app.shared.logger.get_logger")
-    def test_external_service_unavailable_helper(self, mock_get_logger):
-        """Test external_service_unavailable helper function."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = external_service_unavailable("PaymentAPI")
-
-        assert "PaymentAPI" in exc.message
-        assert exc.error_code == ErrorCode.EXTERNAL_SERVICE_UNAVAILABLE
-        assert exc.context["service_name"] == "PaymentAPI"
-
-    @patch("app.shared.logger.get_logger")
-    def test_external_service_timeout_helper(self, mock_get_logger):
-        """Test external_service_timeout helper function."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = external_service_timeout("PaymentAPI", 30.0)
-
-        assert "PaymentAPI" in exc.message
-        assert "30.0" in exc.message
-        assert exc.error_code == ErrorCode.EXTERNAL_SERVICE_TIMEOUT
-        assert exc.context["service_name"] == "PaymentAPI"
-        assert exc.context["timeout_seconds"] == 30.0
+# (exception class, default category, default error code)
+EXCEPTION_DEFAULTS = [
+    pytest.param(
+        ValidationError,
+        ErrorCategory.VALIDATION,
+        ErrorCode.INVALID_INPUT,
+        id="ValidationError",
+    ),
+    pytest.param(
+        DatabaseError,
+        ErrorCategory.DATABASE,
+        ErrorCode.DATABASE_QUERY_ERROR,
+        id="DatabaseError",
+    ),
+    pytest.param(
+        AuthenticationError,
+        ErrorCategory.AUTHENTICATION,
+        ErrorCode.INVALID_CREDENTIALS,
+        id="AuthenticationError",
+    ),
+    pytest.param(
+        AuthorizationError,
+        ErrorCategory.AUTHORIZATION,
+        ErrorCode.INSUFFICIENT_PERMISSIONS,
+        id="AuthorizationError",
+    ),
+    pytest.param(
+        BusinessRuleError,
+        ErrorCategory.BUSINESS_RULE,
+        ErrorCode.BUSINESS_RULE_VIOLATION,
+        id="BusinessRuleError",
+    ),
+    pytest.param(
+        ExternalServiceError,
+        ErrorCategory.EXTERNAL_SERVICE,
+        ErrorCode.EXTERNAL_SERVICE_ERROR,
+        id="ExternalServiceError",
+    ),
+    pytest.param(
+        InternalError,
+        ErrorCategory.INTERNAL,
+        ErrorCode.INTERNAL_ERROR,
+        id="InternalError",
+    ),
+]
+
+# (helper, args, error code, expected context subset, message fragments)
+HELPER_CASES = [
+    pytest.param(
+        missing_field,
+        ("email",),
+        ErrorCode.MISSING_FIELD,
+        {"field": "email"},
+        ["email"],
+        id="missing_field",
+    ),
+    pytest.param(
+        invalid_format,
+        ("email", "valid email address"),
+        ErrorCode.INVALID_FORMAT,
+        {"field": "email", "expected_format": "valid email address"},
+        ["email", "valid email address"],
+        id="invalid_format",
+    ),
+    pytest.param(
+        duplicate_entry,
+        ("User", "email", "test@example.com"),
+        ErrorCode.DUPLICATE_ENTRY,
+        {"entity_type": "User", "field": "email"},
+        ["User", "email", "test@example.com"],
+        id="duplicate_entry",
+    ),
+    pytest.param(
+        constraint_violation,
+        ("price_positive", "Price must be > 0"),
+        ErrorCode.CONSTRAINT_VIOLATION,
+        {"constraint": "price_positive", "details": "Price must be > 0"},
+        ["price_positive"],
+        id="constraint_violation",
+    ),
+    pytest.param(
+        database_connection_error,
+        ("Timeout",),
+        ErrorCode.DATABASE_CONNECTION_ERROR,
+        {},
+        ["Database connection failed"],
+        id="database_connection_error",
+    ),
+    pytest.param(
+        database_integrity_error,
+        ("Foreign key violation",),
+        ErrorCode.DATABASE_INTEGRITY_ERROR,
+        {},
+        ["Database integrity error"],
+        id="database_integrity_error",
+    ),
+    pytest.param(
+        token_expired,
+        (),
+        ErrorCode.TOKEN_EXPIRED,
+        {},
+        ["expired"],
+        id="token_expired",
+    ),
+    pytest.param(
+        invalid_token,
+        (),
+        ErrorCode.TOKEN_INVALID,
+        {},
+        ["Invalid"],
+        id="invalid_token",
+    ),
+    pytest.param(
+        authentication_required,
+        (),
+        ErrorCode.AUTHENTICATION_REQUIRED,
+        {},
+        ["required"],
+        id="authentication_required",
+    ),
+    pytest.param(
+        access_denied,
+        ("Order", "delete"),
+        ErrorCode.ACCESS_DENIED,
+        {"resource": "Order", "action": "delete"},
+        ["delete", "Order"],
+        id="access_denied",
+    ),
+    pytest.param(
+        insufficient_permissions,
+        ("admin",),
+        ErrorCode.INSUFFICIENT_PERMISSIONS,
+        {"required_role": "admin"},
+        ["admin"],
+        id="insufficient_permissions",
+    ),
+    pytest.param(
+        invalid_state,
+        ("cancelled", "active"),
+        ErrorCode.INVALID_STATE,
+        {"current_state": "cancelled", "expected_state": "active"},
+        ["cancelled"],
+        id="invalid_state",
+    ),
+    pytest.param(
+        operation_not_allowed,
+        ("delete", "Order already shipped"),
+        ErrorCode.OPERATION_NOT_ALLOWED,
+        {"operation": "delete", "reason": "Order already shipped"},
+        ["delete"],
+        id="operation_not_allowed",
+    ),
+    pytest.param(
+        external_service_unavailable,
+        ("PaymentAPI",),
+        ErrorCode.EXTERNAL_SERVICE_UNAVAILABLE,
+        {"service_name": "PaymentAPI"},
+        ["PaymentAPI"],
+        id="external_service_unavailable",
+    ),
+    pytest.param(
+        external_service_timeout,
+        ("PaymentAPI", 30.0),
+        ErrorCode.EXTERNAL_SERVICE_TIMEOUT,
+        {"service_name": "PaymentAPI", "timeout_seconds": 30.0},
+        ["PaymentAPI", "30.0"],
+        id="external_service_timeout",
+    ),
+    pytest.param(
+        configuration_error,
+        ("DATABASE_URL", "Not set"),
+        ErrorCode.CONFIGURATION_ERROR,
+        {"config_key": "DATABASE_URL", "details": "Not set"},
+        ["DATABASE_URL"],
+        id="configuration_error",
+    ),
+]
+
+
+@pytest.mark.parametrize("exc_class,category,error_code", EXCEPTION_DEFAULTS)
+def test_exception_defaults(exc_class, category, error_code):
+    """Test each exception class sets its default category and code."""
+    exc = exc_class("Something failed")
+
+    assert exc.message == "Something failed"
+    assert exc.category == category
+    assert exc.error_code == error_code
+
+
+@pytest.mark.parametrize("helper,args,error_code,context,fragments", HELPER_CASES)
+def test_helpers(helper, args, error_code, context, fragments):
+    """Test helper functions set code, context, and message."""
+    exc = helper(*args)
+
+    assert exc.error_code == error_code
+    assert {key: exc.context[key] for key in context} == context
+    for fragment in fragments:
+        assert fragment in exc.message
+
+
+def test_database_connection_error_wraps_original():
+    """Test database_connection_error keeps the original exception."""
+    original = ConnectionError("Connection refused")
+    exc = database_connection_error("Timeout", original)
+
+    assert exc.original_exception is original
+
+
+def test_authentication_required_fresh_instance():
+    """Test authentication_required builds a new exception per call."""
+    # Raising mutates __traceback__ and __context__
+    assert authentication_required() is not authentication_required()
+
+
+def test_access_denied_partial_context():
+    """Test access_denied only records the arguments it was given."""
+    assert access_denied().context == {}
+    assert access_denied(resource="Order").context == {"resource": "Order"}
+    assert access_denied(action="delete").context == {"action": "delete"}
 
 
 # ============================================================================
-# InternalError Tests
+# Error Category Tests
 # ============================================================================
 
 
-class TestInternalError:
-    """Test InternalError exception."""
-
-    @patch("app.shared.logger.get_logger")
-    def test_basic_internal_error(self, mock_get_logger):
-        """Test basic InternalError."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = InternalError("Something went wrong")
-
-        assert exc.message == "Something went wrong"
-        assert exc.category == ErrorCategory.INTERNAL
-        assert exc.error_code == ErrorCode.INTERNAL_ERROR
-
-    @patch("app.shared.logger.get_logger")
-    def test_configuration_error_helper(self, mock_get_logger):
-        """Test configuration_error helper function."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        exc = configuration_error("DATABASE_URL", "Not set")
-
-        assert "DATABASE_URL" in exc.message
-        assert exc.error_code == ErrorCode.CONFIGURATION_ERROR
-        assert exc.context["config_key"] == "DATABASE_URL"
-        assert exc.context["details"] == "Not set"
-
-
-# ============================================================================
-# Error Category Tests
-# ============================================================================
+# Expected is_client_error() result for every category
+CLIENT_ERROR_CATEGORIES = {
+    ErrorCategory.NOT_FOUND: True,
+    ErrorCategory.VALIDATION: True,
+    ErrorCategory.AUTHENTICATION: True,
+    ErrorCategory.AUTHORIZATION: True,
+    ErrorCategory.BUSINESS_RULE: True,
+    ErrorCategory.DATABASE: False,
+    ErrorCategory.EXTERNAL_SERVICE: False,
+    ErrorCategory.INTERNAL: False,
+}
 
 
 class TestErrorCategory:
     """Test ErrorCategory enum methods."""
 
-    def test_is_client_error(self):
-        """Test is_client_error method."""
-        assert ErrorCategory.NOT_FOUND.is_client_error()
-        assert ErrorCategory.VALIDATION.is_client_error()
-        assert ErrorCategory.AUTHENTICATION.is_client_error()
-        assert ErrorCategory.AUTHORIZATION.is_client_error()
-        assert ErrorCategory.BUSINESS_RULE.is_client_error()
-
-        assert not ErrorCategory.DATABASE.is_client_error()
-        assert not ErrorCategory.INTERNAL.is_client_error()
-
-    def test_is_server_error(self):
-        """Test is_server_error method."""
-        assert ErrorCategory.DATABASE.is_server_error()
-        assert ErrorCategory.EXTERNAL_SERVICE.is_server_error()
-        assert ErrorCategory.INTERNAL.is_server_error()
-
-        assert not ErrorCategory.NOT_FOUND.is_server_error()
-        assert not ErrorCategory.VALIDATION.is_server_error()
+    def test_table_covers_all_categories(self):
+        """Test the expectation table lists every category."""
+        assert set(CLIENT_ERROR_CATEGORIES) == set(ErrorCategory)
+
+    @pytest.mark.parametrize("category,is_client", CLIENT_ERROR_CATEGORIES.items())
+    def test_client_server_classification(self, category, is_client):
+        """Test every category is exactly one of client or server error."""
+        assert category.is_client_error() is is_client
+        assert category.is_server_error() is not is_client
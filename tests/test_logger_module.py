@@ -5,6 +5,15 @@ Tests all logger functionality including basic logging, context management,
 sensitive data filtering, performance measurement, and custom configuration.
 """
 
+import io
+import json
+import logging
+import sys
+import traceback
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from types import SimpleNamespace
+
 import pytest
 from app.shared.logger import (
     get_logger,
@@ -13,8 +22,17 @@ from app.shared.logger import (
     Environment,
     LoggerConfig,
     ConsoleHandler,
+    FileHandler,
+    QueuedHandler,
+    ConsoleFormatter,
+    JSONFormatter,
+    SensitiveDataFilter,
     clear_loggers,
+    setup_request_logging,
 )
+from app.shared.logger import formatters, handlers
+from app.shared.logger import logger as logger_module
+from app.shared.logger.context import get_log_context
 
 
 @pytest.fixture(autouse=True)
@@ -25,20 +43,14 @@ def cleanup_loggers():
     clear_loggers()
 
 
-def test_basic_logging(capsys):
-    """Test basic logging functionality."""
+@pytest.mark.parametrize("method", ["debug", "info", "warning", "error", "critical"])
+def test_basic_logging(capsys, method):
+    """Test each level method writes its message."""
     logger = get_logger("test.basic")
 
-    logger.debug("Debug message", test_id=1)
-    logger.info("Info message", test_id=2)
-    logger.warning("Warning message", test_id=3)
-    logger.error("Error message", test_id=4)
+    getattr(logger, method)(f"{method} message", test_id=1)
 
-    captured = capsys.readouterr()
-    assert "Debug message" in captured.out
-    assert "Info message" in captured.out
-    assert "Warning message" in captured.out
-    assert "Error message" in captured.out
+    assert f"{method} message" in capsys.readouterr().out
 
 
 def test_context_logging(capsys):
@@ -61,6 +73,30 @@ def test_context_logging(capsys):
     assert "order_id=order-789" in captured.out
 
 
+def test_context_nesting_restores_outer_context():
+    """Test nested and empty contexts leave the outer context intact."""
+    assert get_log_context() == {}
+    with LogContext(request_id="req-1") as outer:
+        assert get_log_context() == {"request_id": "req-1"}
+        with LogContext():
+            assert get_log_context() == {"request_id": "req-1"}
+        with LogContext(user_id="user-1"):
+            assert get_log_context() == {"request_id": "req-1", "user_id": "user-1"}
+        assert get_log_context() == {"request_id": "req-1"}
+    assert get_log_context() == {}
+    # The outer dict was stored as-is and never merged into
+    assert outer.context == {"request_id": "req-1"}
+
+
+def test_setup_request_logging_context():
+    """Test the request helper sets and restores the request id."""
+    request_context = setup_request_logging("req-9")
+    with request_context:
+        assert get_log_context() == {"request_id": "req-9"}
+    assert get_log_context() == {}
+    assert not hasattr(request_context, "__dict__")
+
+
 def test_sensitive_data_filtering(capsys):
     """Test sensitive data filtering."""
     logger = get_logger("test.sensitive")
@@ -79,14 +115,51 @@ def test_sensitive_data_filtering(capsys):
     # Note: The filter sanitizes before logging, so sensitive data won't appear
 
 
-def test_performance_measurement(capsys):
+def test_sensitive_key_matching():
+    """Test key patterns match case-insensitively and extra keys are added."""
+    default = SensitiveDataFilter()
+    custom = SensitiveDataFilter(extra_keys={"IBAN"})
+    data = {"User_Password": "x", "iban_number": "y", "email": "z"}
+
+    assert default.sanitize(data) == {
+        "User_Password": "***REDACTED***",
+        "iban_number": "y",
+        "email": "z",
+    }
+    assert custom.sanitize(data)["iban_number"] == "***REDACTED***"
+    # Repeated lookups are served from the key cache with the same verdict
+    assert default.sanitize(data) == default.sanitize(data)
+    assert "IBAN" not in SensitiveDataFilter.SENSITIVE_KEYS
+
+
+def test_sanitize_copies_only_on_change():
+    """Test sanitize returns clean data as-is and never modifies input."""
+    sensitive_filter = SensitiveDataFilter()
+    clean = {"user": {"name": "john"}, "items": [{"sku": "A1"}], "count": 2}
+    nested = {"user": {"name": "john", "token": "abc"}, "items": ({"pin": 1},)}
+
+    assert sensitive_filter.sanitize(clean) is clean
+
+    result = sensitive_filter.sanitize(nested)
+    assert result == {
+        "user": {"name": "john", "token": "***REDACTED***"},
+        "items": [{"pin": "***REDACTED***"}],
+    }
+    assert nested["user"]["token"] == "abc"
+    assert nested["items"][0]["pin"] == 1
+
+
+def test_performance_measurement(capsys, monkeypatch):
     """Test performance measurement."""
+    # Fake clock so the test does not have to sleep
+    ticks = iter([1.0, 1.25])
+    monkeypatch.setattr(
+        logger_module, "time", SimpleNamespace(perf_counter=lambda: next(ticks))
+    )
     logger = get_logger("test.performance")
 
-    import time
-
     with logger.measure_time("test_operation", operation_type="test"):
-        time.sleep(0.05)
+        pass
 
     captured = capsys.readouterr()
     assert "Starting test_operation" in captured.out
@@ -123,16 +196,38 @@ def test_custom_config(capsys):
     assert "Custom config logger" in captured.out
 
 
-def test_logger_levels():
-    """Test that different log levels work correctly."""
-    logger = get_logger("test.levels")
+def test_below_threshold_skips_processing(capsys, monkeypatch):
+    """Test that messages below the configured level are dropped early."""
+    config = LoggerConfig(
+        name="test.threshold",
+        level=LogLevel.WARNING,
+        handlers=[ConsoleHandler(LogLevel.DEBUG)],
+        environment=Environment.DEVELOPMENT,
+    )
+    logger = get_logger("test.threshold", config=config)
+
+    def fail_sanitize(data):
+        raise AssertionError("sanitize called for a dropped message")
 
-    # Should not raise exceptions
-    logger.debug("Debug level")
-    logger.info("Info level")
-    logger.warning("Warning level")
-    logger.error("Error level")
-    logger.critical("Critical level")
+    monkeypatch.setattr(logger._sensitive_filter, "sanitize", fail_sanitize)
+    logger.info("Dropped message", password="secret")
+
+    captured = capsys.readouterr()
+    assert "Dropped message" not in captured.out
+
+
+def test_is_enabled_for():
+    """Test isEnabledFor reflects the configured level."""
+    config = LoggerConfig(
+        name="test.enabled",
+        level=LogLevel.WARNING,
+        handlers=[ConsoleHandler(LogLevel.DEBUG)],
+        environment=Environment.DEVELOPMENT,
+    )
+    logger = get_logger("test.enabled", config=config)
+
+    assert logger.isEnabledFor(logging.ERROR)
+    assert not logger.isEnabledFor(logging.DEBUG)
 
 
 def test_clear_loggers():
@@ -168,6 +263,20 @@ def test_environment_config():
     assert test_logger is not None
 
 
+def test_config_from_environment(tmp_path):
+    """Test each environment gets its own configuration."""
+    expected = {
+        Environment.DEVELOPMENT: LogLevel.DEBUG,
+        Environment.TESTING: LogLevel.WARNING,
+        Environment.STAGING: LogLevel.INFO,
+        Environment.PRODUCTION: LogLevel.INFO,
+    }
+    for env, level in expected.items():
+        config = LoggerConfig.from_environment("test.env", env, tmp_path)
+        assert config.environment == env
+        assert config.level == level
+
+
 def test_multiple_loggers():
     """Test that multiple loggers can coexist."""
     logger1 = get_logger("test.logger1")
@@ -192,3 +301,210 @@ def test_log_with_extra_fields(capsys):
 
     captured = capsys.readouterr()
     assert "Order processed" in captured.out
+
+
+def test_log_with_extra_dict(monkeypatch):
+    """Test a stdlib-style extra dict is flattened into the record fields."""
+    logger = get_logger("test.extra_dict")
+    calls = []
+    monkeypatch.setattr(
+        logger._logger, "log", lambda *args, **kwargs: calls.append(kwargs)
+    )
+    fields = {"order_id": "ORD-123", "password": "secret"}
+
+    logger.info("Order processed", extra=fields, user_id="USR-456")
+
+    assert calls[0]["extra"] == {
+        "order_id": "ORD-123",
+        "password": "***REDACTED***",
+        "user_id": "USR-456",
+    }
+    # The caller's dict is not modified
+    assert fields["password"] == "secret"
+
+
+def test_reserved_attributes_dropped_from_fields(monkeypatch):
+    """Test reserved names are dropped while other fields are kept."""
+    logger = get_logger("test.reserved_fields")
+    calls = []
+    monkeypatch.setattr(
+        logger._logger, "log", lambda *args, **kwargs: calls.append(kwargs)
+    )
+
+    logger.info("Test message", module="dropped", user_id=1)
+    logger.info("Test message", user_id=2)
+
+    assert calls[0]["extra"] == {"user_id": 1}
+    assert calls[1]["extra"] == {"user_id": 2}
+
+
+def test_queued_handler_writes_on_listener(tmp_path):
+    """Test queued records reach the wrapped handler with their context."""
+    log_file = tmp_path / "app.log"
+    config = LoggerConfig(
+        name="test.queued",
+        level=LogLevel.INFO,
+        handlers=[QueuedHandler([FileHandler(log_file, level=LogLevel.WARNING)])],
+        environment=Environment.PRODUCTION,
+    )
+    logger = get_logger("test.queued", config=config)
+
+    with LogContext(request_id="req-1"):
+        logger.info("Below handler level")
+        logger.warning("Queued message", order_id="ORD-1")
+
+    # Stopping the listener drains the queue; restart it for other tests
+    handlers._listener.stop()
+    handlers._listener.start()
+
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 1
+    entry = json.loads(lines[0])
+    assert entry["message"] == "Queued message"
+    assert entry["context"] == {"request_id": "req-1"}
+    assert entry["extra"]["order_id"] == "ORD-1"
+
+
+def test_handlers_share_formatter_wrapper(tmp_path):
+    """Test handlers set up with one formatter share its wrapper."""
+    config = LoggerConfig(
+        name="test.shared_wrapper",
+        level=LogLevel.INFO,
+        handlers=[ConsoleHandler(), FileHandler(tmp_path / "app.log")],
+        environment=Environment.PRODUCTION,
+    )
+    logger = get_logger("test.shared_wrapper", config=config)
+
+    console, file = logger._logger.handlers
+    assert console.formatter is file.formatter
+
+
+def test_console_timestamps_match_datetime():
+    """Test cached per-second console timestamps match datetime formatting."""
+    console_formatter = ConsoleFormatter(use_colors=False)
+    for created in (1_700_000_000.25, 1_700_000_000.5, 1_700_000_001.000123):
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+        record.created = created
+        expected = datetime.fromtimestamp(created)
+
+        assert console_formatter.format(record).startswith(
+            f"[{expected:%Y-%m-%d %H:%M:%S}]"
+        )
+
+
+def test_json_formatter_extra_fields():
+    """Test only caller-supplied attributes end up in the extra block."""
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+    record.order_id = "ORD-1"
+    record.user_id = "USR-1"
+    record.log_context = {}
+
+    entry = json.loads(JSONFormatter().format(record))
+
+    assert list(entry["extra"]) == ["order_id", "user_id"]
+    assert "context" not in entry
+
+
+def test_json_formatter_serializes_any_extra():
+    """Test non-JSON values and non-string keys do not break formatting."""
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+    record.counts = {1: "one"}
+    record.owner = object()
+
+    entry = json.loads(JSONFormatter().format(record))
+
+    assert entry["extra"]["counts"] == {"1": "one"}
+    assert entry["extra"]["owner"].startswith("<object object")
+    assert entry["timestamp"] == datetime.fromtimestamp(record.created).isoformat()
+
+
+def test_json_formatter_falls_back_for_big_integers():
+    """Test integers orjson cannot encode are still written."""
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+    record.big = 2**70
+
+    entry = json.loads(JSONFormatter().format(record))
+
+    assert entry["extra"]["big"] == 2**70
+    assert entry["timestamp"] == datetime.fromtimestamp(record.created).isoformat()
+
+
+def test_exception_traceback_formatted_once(monkeypatch):
+    """Test a record's traceback is formatted once for all formatters."""
+    calls = []
+    format_exception = traceback.format_exception
+    monkeypatch.setattr(
+        traceback,
+        "format_exception",
+        lambda *args: calls.append(args) or format_exception(*args),
+    )
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        exc_info = sys.exc_info()
+    record = logging.LogRecord(
+        "test", logging.ERROR, __file__, 1, "msg", None, exc_info
+    )
+
+    entry = json.loads(JSONFormatter().format(record))
+    console = ConsoleFormatter(use_colors=False).format(record)
+
+    assert len(calls) == 1
+    assert entry["exception"]["type"] == "ValueError"
+    assert entry["exception"]["traceback"].endswith("ValueError: boom")
+    assert console.endswith("ValueError: boom")
+
+
+def test_console_level_column(monkeypatch):
+    """Test level names are padded, or colored when the terminal allows it."""
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+
+    monkeypatch.setattr(formatters, "_STDERR_IS_TTY", False)
+    assert " INFO     test: msg" in ConsoleFormatter().format(record)
+
+    monkeypatch.setattr(formatters, "_STDERR_IS_TTY", True)
+    assert " \033[32mINFO\033[0m test: msg" in ConsoleFormatter().format(record)
+    assert not ConsoleFormatter(use_colors=False).use_colors
+
+
+def test_queue_listener_flushes_once_per_batch(tmp_path):
+    """Test a drained batch is written with one flush per stream handler."""
+
+    class CountingStream(io.StringIO):
+        flushes = 0
+
+        def flush(self):
+            self.flushes += 1
+
+    stream = CountingStream()
+    stream_handler = logging.StreamHandler(stream)
+    error_handler = logging.StreamHandler(CountingStream())
+    error_handler.setLevel(logging.ERROR)
+    rotating = RotatingFileHandler(tmp_path / "app.log", maxBytes=20, backupCount=2)
+    targets = (stream_handler, error_handler, rotating)
+
+    records = [
+        logging.LogRecord("test", logging.INFO, __file__, 1, f"line {i}", None, None)
+        for i in range(5)
+    ]
+    listener = handlers._DispatchingQueueListener(None)
+    listener._handle_batch([(targets, record) for record in records])
+    rotating.close()
+
+    assert stream.getvalue().splitlines() == [f"line {i}" for i in range(5)]
+    assert stream.flushes == 1
+    assert error_handler.stream.getvalue() == ""
+    # Size-based rollover still happens between records of one batch
+    assert (tmp_path / "app.log.1").exists()
+
+
+def test_filter_masks_only_extra_fields():
+    """Test the record filter masks sensitive extras and skips standard ones."""
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+    record.api_key = "abc"
+    record.order_id = "ORD-1"
+
+    assert SensitiveDataFilter().filter(record)
+    assert record.api_key == "***REDACTED***"
+    assert record.order_id == "ORD-1"
+    assert record.msg == "msg"
@@ -236,6 +236,43 @@ def test_error_response_from_exception():
     assert "entity_type" in response.details
 
 
+def test_error_response_from_exception_logs_exception(monkeypatch):
+    """Test converting an exception to a response logs it once."""
+    from unittest.mock import Mock
+
+    from app.shared.exceptions import base
+
+    mock_logger = Mock()
+    monkeypatch.setattr(base, "_get_logger", lambda: mock_logger)
+    exception = NotFoundError(message="User not found")
+
+    ErrorResponse.from_exception(exception)
+    ErrorResponse.from_exception(exception)
+
+    mock_logger.warning.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_app_renders_app_exception_as_error_response(exception_logger):
+    """Test the app's AppException handler returns an ErrorResponse body."""
+    import json
+
+    from app.main import app
+    from app.shared.exceptions import AppException
+
+    handler = app.exception_handlers[AppException]
+    exception = NotFoundError(message="User not found", context={"user_id": 1})
+
+    response = await handler(None, exception)
+
+    assert response.status_code == 404
+    assert response.media_type == "application/json"
+    body = json.loads(response.body)
+    assert body["error_code"] == "resource_not_found"
+    assert body["details"] == {"user_id": 1}
+    assert len(exception_logger.warnings) == 1
+
+
 # ============================================================================
 # Test ValidationErrorResponse
 # ============================================================================
@@ -296,6 +333,27 @@ def test_page_info_validation():
     assert page_info.total == 0
 
 
+def test_page_info_computes_pages():
+    """Test PageInfo derives pages from total and size."""
+    assert PageInfo(page=1, size=20, total=101).pages == 6
+    assert PageInfo(page=3, size=20, total=0).pages == 0
+    # A caller-supplied value cannot disagree with the other fields
+    assert PageInfo(page=1, size=20, total=100, pages=9).pages == 5
+    assert PageInfo(page=1, size=20, total=100).model_dump()["pages"] == 5
+
+
+def test_pagination_metadata_is_frozen():
+    """Test PageInfo and CursorInfo are immutable value objects."""
+    page_info = PageInfo(page=1, size=20, total=100, pages=5)
+    cursor_info = CursorInfo(cursor="abc123", has_next=True, count=20)
+
+    with pytest.raises(ValidationError):
+        page_info.page = 2
+    with pytest.raises(ValidationError):
+        cursor_info.count = 0
+    assert page_info == PageInfo(page=1, size=20, total=100, pages=5)
+
+
 # ============================================================================
 # Test PaginatedResponse
 # ============================================================================